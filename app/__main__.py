@@ -1,14 +1,24 @@
-import sys
-import os
-from pathlib import Path
+import time
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import (
+# The start time is taken before the imports to include them in the startup time,
+# so the imports below are not at the top of the module (noqa: E402).
+START_TIME = time.perf_counter()
+
+import sys  # noqa: E402
+import os  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Final  # noqa: E402
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from PyQt6.QtGui import QIcon  # noqa: E402
+from PyQt6.QtCore import (  # noqa: E402
     QDir,
     QFile,
     QIODevice,
-    QTextStream
+    QTextStream,
+    QObject,
+    QEvent,
+    QTimer
 )
 
 APP_PATH = os.path.dirname(__file__)
@@ -20,7 +30,23 @@ sys.path.append(PROJECT_PATH)
 QDir.addSearchPath("icons", APP_PATH + "/resources/icons")
 QDir.addSearchPath("styles", APP_PATH + "/gui")
 
-from app.gui.mainwindow import MainWindow
+from app.gui.mainwindow import MainWindow  # noqa: E402
+
+# If the environment variable is set, the time to the first paint of the main
+# window is printed to stderr and the application exits (see benchmarks/bench_startup.py).
+STARTUP_TIMING_ENV: Final = "CRYPTO_METHODS_STARTUP_TIMING"
+
+
+class FirstPaintTimer(QObject):
+    """Event filter that prints the time from the start of the program to the first paint of the window."""
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            print(f"Time to first paint: {(time.perf_counter() - START_TIME) * 1000:.1f} ms", file=sys.stderr)
+            QTimer.singleShot(0, QApplication.quit)
+
+        return False
 
 
 def main():
@@ -35,6 +61,11 @@ def main():
         style_file.close()
 
     window = MainWindow()
+
+    if os.environ.get(STARTUP_TIMING_ENV):
+        first_paint_timer = FirstPaintTimer(window)
+        window.installEventFilter(first_paint_timer)
+
     window.show()
 
     sys.exit(app.exec())
@@ -0,0 +1,255 @@
+# This module contains the command line interface for encrypting/decrypting
+# files and streams without the graphical interface. PyQt6 is not imported here,
+# so the interface can be used on servers without a display.
+#
+# Examples (from the root of the project):
+#   python -m app.cli encrypt -c des -k 8d380efc717b90 -i f356687d1989b70b -m CBC "data/*.bin"
+#   python -m app.cli decrypt -c xor -k 8d380efc717b90 < secret.bin > plain.bin
+#   python -m app.cli encrypt -c rc4 -k 8d380efc717b90 < plain.bin > secret.bin
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from typing import BinaryIO
+
+from app.crypto import parallel
+from app.crypto.common import EncProc
+
+# Size of the chunk read from the input at a time.
+CHUNK_SIZE = 1 << 22
+
+# Suffix added to the names of encrypted files.
+ENCRYPTED_SUFFIX = ".enc"
+# Suffix added to the names of decrypted files that do not end with ENCRYPTED_SUFFIX.
+DECRYPTED_SUFFIX = ".dec"
+
+
+def _make_des(args: argparse.Namespace, workers: int):
+    """Function for creating the DES cipher from the command line arguments."""
+    from app.crypto.symmetric.des import DES
+
+    return DES(args.key, args.iv, DES.EncMode.from_str(args.mode), backend=DES.Backend.from_str(args.backend),
+               workers=workers)
+
+
+def _make_gost(args: argparse.Namespace, workers: int):
+    """Function for creating the GOST 28147-89 cipher from the command line arguments."""
+    from app.crypto.symmetric.gost import GOST
+
+    return GOST(args.key, args.iv, GOST.EncMode.from_str(args.mode), backend=GOST.Backend.from_str(args.backend),
+                workers=workers)
+
+
+def _make_xor(args: argparse.Namespace, workers: int):
+    """Function for creating the XOR cipher from the command line arguments."""
+    from app.crypto.symmetric.xor import XOR
+
+    return XOR(args.key)
+
+
+def _make_rc4(args: argparse.Namespace, workers: int):
+    """Function for creating the RC4 stream cipher from the command line arguments."""
+    from app.crypto.prngs.rc4 import RC4
+
+    return RC4(args.key)
+
+
+_CIPHERS = {"des": _make_des,
+            "gost": _make_gost,
+            "xor": _make_xor,
+            "rc4": _make_rc4}
+
+
+def format_size(size: float) -> str:
+    """Function for formatting the size in bytes in a human-readable form."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+
+        size /= 1024
+
+
+def process_stream(cipher, enc_proc: EncProc, input_stream: BinaryIO, output_stream: BinaryIO,
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Function for encrypting/decrypting a stream with the incremental interface of the cipher.
+
+    Args:
+        cipher: cipher with the "encryptor" and "decryptor" interfaces.
+        enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+        input_stream: binary stream to read the data from.
+        output_stream: binary stream to write the processed data to.
+        chunk_size: size of the chunk read at a time.
+
+    Returns:
+        Number of bytes read.
+    """
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            context = cipher.encryptor()
+
+        case EncProc.DECRYPT:
+            context = cipher.decryptor()
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    size = 0
+    while chunk := input_stream.read(chunk_size):
+        size += len(chunk)
+        output_stream.write(context.update(chunk))
+
+    output_stream.write(context.finalize())
+    return size
+
+
+def output_path(path: str, enc_proc: EncProc, output_dir: str = None) -> str:
+    """
+    Function for getting the path of the output file.
+
+    Encrypted files get the ENCRYPTED_SUFFIX suffix. When decrypting, the suffix is
+    removed, or DECRYPTED_SUFFIX is added if the file name does not end with it.
+    """
+    if enc_proc is EncProc.ENCRYPT:
+        new_path = path + ENCRYPTED_SUFFIX
+    elif path.endswith(ENCRYPTED_SUFFIX):
+        new_path = path[:-len(ENCRYPTED_SUFFIX)]
+    else:
+        new_path = path + DECRYPTED_SUFFIX
+
+    if output_dir is not None:
+        new_path = os.path.join(output_dir, os.path.basename(new_path))
+
+    return new_path
+
+
+def _process_file(args: argparse.Namespace, path: str) -> int:
+    """Function for processing one file. It is executed in the worker processes."""
+    cipher = _CIPHERS[args.cipher](args, 1)
+    enc_proc = EncProc.from_str(args.command)
+
+    with open(path, "rb") as input_file, open(output_path(path, enc_proc, args.output_dir), "wb") as output_file:
+        return process_stream(cipher, enc_proc, input_file, output_file, args.chunk_size)
+
+
+def _expand_patterns(patterns: list[str]) -> list[str]:
+    """Function for expanding the glob patterns into the list of files (a file matched several times is taken once)."""
+    paths = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if os.path.isfile(path):
+                paths.setdefault(os.path.realpath(path), path)
+
+    return list(paths.values())
+
+
+def _file_id(path: str) -> tuple[int, int]:
+    """Function for getting the identifier of an existing file (also the same for links to it)."""
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino
+
+
+def _find_output_conflict(paths: list[str], enc_proc: EncProc, output_dir: str = None) -> tuple[str, str] or None:
+    """
+    Function for finding an output file that would overwrite an input file or the output
+    of another input file (for example, files with the same name from different directories
+    written to one output directory, or "x" and "x.enc" encrypted together).
+
+    Returns:
+        The pair (input file, its conflicting output file) or None.
+    """
+    inputs = {_file_id(path) for path in paths}
+    outputs = set()
+
+    for path in paths:
+        output = output_path(path, enc_proc, output_dir)
+        output_key = os.path.normcase(os.path.realpath(output))
+
+        # The output file is truncated when opened, so it must not be one of the input files.
+        if output_key in outputs or (os.path.exists(output) and _file_id(output) in inputs):
+            return path, output
+
+        outputs.add(output_key)
+
+    return None
+
+
+def _parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """Function for parsing the command line arguments."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli",
+                                     description="Encrypting/decrypting files and streams without the GUI. "
+                                                 "Without files, the data is read from stdin and written to stdout.")
+
+    parser.add_argument("command", choices=("encrypt", "decrypt"), help="process of data encryption")
+    parser.add_argument("files", nargs="*", help="files or glob patterns to process")
+    parser.add_argument("-c", "--cipher", choices=tuple(_CIPHERS.keys()), default="des", help="cipher")
+    parser.add_argument("-k", "--key", required=True, help="key (hex)")
+    parser.add_argument("-i", "--iv", help="initialization vector (hex)")
+    parser.add_argument("-m", "--mode", default="ECB", type=str.upper, choices=("ECB", "CBC", "CFB", "OFB", "CTR"),
+                        help="encryption mode (DES, GOST)")
+    parser.add_argument("-b", "--backend", default="table", type=str.lower, choices=("reference", "table"),
+                        help="block transformation backend (DES, GOST)")
+    parser.add_argument("-j", "--jobs", type=int, default=parallel.cpu_count(), help="number of processes")
+    parser.add_argument("-o", "--output-dir", help="directory for the output files (default: next to the input)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="size of the chunk read at a time")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print statistics")
+
+    # The files may follow the options (as in the examples at the top of the module).
+    return parser.parse_intermixed_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    """Entry point of the command line interface. Returns the exit code."""
+    args = _parse_args(argv)
+    enc_proc = EncProc.from_str(args.command)
+
+    start = time.perf_counter()
+
+    try:
+        if not args.files:
+            # A single stream is split between the processes inside the cipher.
+            cipher = _CIPHERS[args.cipher](args, args.jobs)
+            total_size = process_stream(cipher, enc_proc, sys.stdin.buffer, sys.stdout.buffer, args.chunk_size)
+            sys.stdout.buffer.flush()
+            files_count = 1
+        else:
+            paths = _expand_patterns(args.files)
+            if not paths:
+                print("No files found!", file=sys.stderr)
+                return 1
+
+            if conflict := _find_output_conflict(paths, enc_proc, args.output_dir):
+                print(f"Error: the output file {conflict[1]!r} of {conflict[0]!r} would overwrite "
+                      f"an input file or another output file!", file=sys.stderr)
+                return 1
+
+            if args.output_dir is not None:
+                os.makedirs(args.output_dir, exist_ok=True)
+
+            if args.jobs > 1 and len(paths) > 1:
+                executor = parallel.get_executor(min(args.jobs, len(paths)))
+                futures = [executor.submit(_process_file, args, path) for path in paths]
+                total_size = sum(future.result() for future in as_completed(futures))
+            else:
+                total_size = sum(_process_file(args, path) for path in paths)
+
+            files_count = len(paths)
+
+    except (ValueError, TypeError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        print(f"{args.command}: {files_count} file(s), {format_size(total_size)} in {elapsed:.3f} s "
+              f"({format_size(total_size / max(elapsed, 1e-9))}/s)", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,11 @@
-from .rsa import RSA
-from .elgamal import Elgamal
+# The classes are imported on first access (see app.crypto.utils.lazy_import).
+from app.crypto.utils import lazy_import
+
+_ATTRIBUTES = {
+    "RSA": ".rsa",
+    "Elgamal": ".elgamal"
+}
+
+__all__ = tuple(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
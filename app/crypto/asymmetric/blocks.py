@@ -0,0 +1,60 @@
+# This module contains the parallel processing of independent blocks by the asymmetric
+# ciphers (RSA, Elgamal): the blocks are grouped into batches, which are encrypted or
+# decrypted by the worker processes, and the results are returned in the original order.
+from functools import (
+    lru_cache,
+    partial
+)
+from typing import (
+    Iterable,
+    Iterator
+)
+
+from app.crypto import parallel
+from app.crypto.common import EncProc
+
+# Number of blocks in a batch processed by a worker at a time.
+BATCH_BLOCKS = 64
+
+
+@lru_cache(maxsize=4)
+def _get_cipher(cipher_cls, private_key, public_key):
+    """
+    Function for getting the cipher in the worker process.
+
+    The cipher is created once for the keys, so the precomputed data (for example,
+    the tables of the exponentiation with a fixed base) is reused between the batches.
+    """
+    return cipher_cls(private_key, public_key)
+
+
+def _process_batch(cipher_cls, private_key, public_key, enc_proc: EncProc, blocks: list[bytes]) -> list[bytes]:
+    """Function for processing a batch of blocks. It is executed in the worker processes."""
+    cipher = _get_cipher(cipher_cls, private_key, public_key)
+    return [cipher.make(block, enc_proc) for block in blocks]
+
+
+def process_blocks(cipher, enc_proc: EncProc, blocks: Iterable[bytes], workers: int) -> Iterator[bytes]:
+    """
+    Function for encrypting/decrypting independent blocks of data.
+
+    Args:
+        cipher: asymmetric cipher (RSA, Elgamal).
+        enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+        blocks: blocks of data. They are read lazily.
+        workers: number of worker processes. If it is 1, the blocks are processed in the current process.
+
+    Returns:
+        Iterator over the processed blocks in the order of the input blocks.
+    """
+    if workers <= 1:
+        return (cipher.make(block, enc_proc) for block in blocks)
+
+    fn = partial(_process_batch, type(cipher), cipher._private_key, cipher._public_key, enc_proc)
+    return parallel.imap_batches(fn, blocks, workers, BATCH_BLOCKS)
+
+
+def split_blocks(data: bytes, block_size: int) -> Iterator[bytes]:
+    """Function for splitting data into blocks of the given size (the last one may be shorter)."""
+    view = memoryview(data)
+    return (bytes(view[pos:pos + block_size]) for pos in range(0, len(data), block_size))
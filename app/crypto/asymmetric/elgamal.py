@@ -1,16 +1,28 @@
 # The module contains the implementation of the Elgamal asymmetric encryption algorithm
 from dataclasses import dataclass
 from secrets import SystemRandom
-
-from sympy import isprime, primitive_root
+from typing import (
+    Iterable,
+    Iterator
+)
 
 from app.crypto.mathlib import (
     fpow,
     ext_gcd,
-    modinv
+    ModContext
+)
+from app.crypto.fixed_base import fixed_base
+from app.crypto.group_pool import GroupPool
+from app.crypto.groups import (
+    find_generator,
+    gen_group
 )
-from app.crypto.utils import gen_prime
 from app.crypto.common import EncProc
+from app.crypto import stream
+from app.crypto.asymmetric.blocks import (
+    process_blocks,
+    split_blocks
+)
 
 
 class Elgamal:
@@ -35,7 +47,7 @@ class Elgamal:
         a: int
         b: int
 
-    def __init__(self, private_key: PrivateKey, public_key: PublicKey) -> None:
+    def __init__(self, private_key: PrivateKey, public_key: PublicKey, workers: int = 1) -> None:
         """
         Implementation of the asymmetric Elgamal encryption algorithm.
 
@@ -43,6 +55,9 @@ class Elgamal:
             Private key of type Elgamal.PrivateKey, which contains the number D and the modulus N.
         public_key
             Public key of type Elgamal.PublicKey, which contains the number E and the modulus N.
+        workers
+            Number of processes used to encrypt/decrypt the blocks in the encrypt_blocks and
+            decrypt_blocks methods and in the incremental interface.
         """
         if not (isinstance(private_key, Elgamal.PrivateKey) and isinstance(public_key, Elgamal.PublicKey)):
             raise TypeError("Values must be of type Elgamal.PrivateKey and Elgamal.PublicKey.")
@@ -52,40 +67,45 @@ class Elgamal:
 
         self._private_key = private_key
         self._public_key = public_key
+        self._workers = workers
         self._sysrand = SystemRandom()
 
+        # The bases G and Y are the same for all blocks, so the exponentiations
+        # with the session keys are performed by the precomputed tables.
+        self._g_pow = fixed_base(public_key.g, public_key.p).pow
+        self._y_pow = fixed_base(public_key.y, public_key.p).pow
+        self._private_ctx = ModContext(private_key.p)
+
     @staticmethod
-    def gen_keys(n: int = 1024, p: int = None) -> tuple[PrivateKey, PublicKey]:
+    def gen_keys(n: int = 1024, p: int = None, pool: GroupPool = None, workers: int = 1,
+                 factors: Iterable[int] = None) -> tuple[PrivateKey, PublicKey]:
         """
         Method for generating private and public keys.
 
-        If the P parameter is set, then the function of the Sympy library
-        will be used to search for the primitive element, which is quite
-        time-consuming for large P. If the P parameter is not set, then it
-        will be generated with the specified bit dimension. Moreover, in this
-        case, the search for the primitive element will be faster, since it
-        will be searched for simply a number of the form p = 2q + 1, where q is prime.
+        If the P parameter is not set, then it will be generated with the specified
+        bit dimension as a safe prime p = 2q + 1, where q is prime, so the search for
+        the primitive element is fast. If the P parameter is set and it is not a safe
+        prime, then the prime factors of p - 1 are needed to search for the primitive
+        element: they are either specified or found by trial division (if p - 1 has at
+        most one large prime factor), otherwise ValueError is raised.
 
         n
             Number of bits to generate prime p.
         p
             Prime number to generate private and public keys&
+        pool
+            Pool of precomputed groups (p, g). It is used if the P parameter is not set.
+        workers
+            Number of processes searching for the prime number P, if it is generated.
+        factors
+            Distinct prime factors of p - 1, if the P parameter is set.
         """
         if not p:
-            while True:
-                p = gen_prime(n)
-                q = (p-1) >> 1
-                if isprime(q):
-                    break
-
-            g = 2
-            for i in range(2, p-1):
-                if fpow(i, q, p) != 1:
-                    g = i
-                    break
+            group = pool.get(n, workers) if pool is not None else gen_group(n, workers)
+            p, g = group.p, group.g
 
         else:
-            g = primitive_root(p)
+            g = find_generator(p, factors)
 
         sysrand = SystemRandom()
         x = sysrand.randrange(2, p-1)
@@ -100,7 +120,7 @@ class Elgamal:
     @property
     def num_bytes_to_decrypt(self):
         """The maximum number of bytes that can be read from the file to be decrypted."""
-        return (self._private_key.p.bit_length() >> 3) * 2
+        return ((self._private_key.p.bit_length() + 7) >> 3) * 2
 
     def _gen_session_key(self) -> SessionKey:
         """Method for generating a session key."""
@@ -125,17 +145,17 @@ class Elgamal:
             of the module (little endian order).
         """
         session_key = self._gen_session_key()
-        a = fpow(self._public_key.g, session_key.k, self._public_key.p)
+        a = self._g_pow(session_key.k)
 
         match data:
             case int():
-                b = fpow(self._public_key.y, session_key.k, self._public_key.p) * data % self._public_key.p
+                b = self._y_pow(session_key.k) * data % self._public_key.p
                 return Elgamal.Ciphertext(a, b)
 
             case bytes():
                 data = int.from_bytes(data, "little")
-                b = fpow(self._public_key.y, session_key.k, self._public_key.p) * data % self._public_key.p
-                block_size = self._public_key.p.bit_length() >> 3
+                b = self._y_pow(session_key.k) * data % self._public_key.p
+                block_size = (self._public_key.p.bit_length() + 7) >> 3
                 return a.to_bytes(block_size, "little") + b.to_bytes(block_size, "little")
 
             case _:
@@ -155,24 +175,79 @@ class Elgamal:
             The length of the total string must be the length of the module.
         """
         def transform(a: int, b: int) -> int:
-            m1 = fpow(a, self._private_key.x, self._private_key.p)
-            m2 = modinv(m1, self._private_key.p)
-            m = m2 * b % self._private_key.p
-            return m
+            # m = b * (a^x)^-1 = b * a^(p-1-x) mod p, since a^(p-1) = 1 mod p
+            # (Fermat's little theorem), so no inverse has to be found.
+            ctx = self._private_ctx
+            return ctx.mul(ctx.pow(a, ctx.modulus - 1 - self._private_key.x), b)
 
         match data:
             case Elgamal.Ciphertext(a, b):
                 return transform(a, b)
 
             case bytes():
-                block_size = self._private_key.p.bit_length() >> 3
+                block_size = (self._private_key.p.bit_length() + 7) >> 3
                 a = int.from_bytes(data[:block_size], "little")
                 b = int.from_bytes(data[block_size:], "little")
-                return transform(a, b).to_bytes(block_size - 1, "little")
+                return transform(a, b).to_bytes((self._private_key.p.bit_length() >> 3) - 1, "little")
 
             case _:
                 raise TypeError("Possible types: Elgamal.Ciphertext, bytes.")
 
+    def encrypt_blocks(self, blocks: Iterable[bytes], workers: int = None) -> Iterator[bytes]:
+        """
+        Method for encrypting independent blocks of data (each of at most num_bytes_to_encrypt bytes).
+
+        With several workers, the blocks are encrypted in parallel by batches; a limited
+        number of batches is processed at a time, so the blocks can be read lazily.
+
+        blocks
+            Blocks of data to encrypt.
+        workers
+            Number of processes (by default, the value passed to the constructor).
+
+        Returns
+            Iterator over the encrypted blocks in the order of the input blocks.
+        """
+        return process_blocks(self, EncProc.ENCRYPT, blocks, self._workers if workers is None else workers)
+
+    def decrypt_blocks(self, blocks: Iterable[bytes], workers: int = None) -> Iterator[bytes]:
+        """
+        Method for decrypting independent blocks of data (each of num_bytes_to_decrypt bytes).
+
+        blocks
+            Blocks of data to decrypt.
+        workers
+            Number of processes (by default, the value passed to the constructor).
+
+        Returns
+            Iterator over the decrypted blocks in the order of the input blocks.
+        """
+        return process_blocks(self, EncProc.DECRYPT, blocks, self._workers if workers is None else workers)
+
+    def encryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        The data is split into blocks of num_bytes_to_encrypt bytes, each of which is
+        encrypted separately. The last block is padded (ISO/IEC 7816-4) when finalizing.
+        """
+        def process(data: bytes) -> bytes:
+            return b"".join(self.encrypt_blocks(split_blocks(data, self.num_bytes_to_encrypt)))
+
+        return stream.padded_context(process, self.num_bytes_to_encrypt, EncProc.ENCRYPT)
+
+    def decryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is split into blocks of num_bytes_to_decrypt bytes, each of which is
+        decrypted separately. The padding is removed from the last block when finalizing.
+        """
+        def process(data: bytes) -> bytes:
+            return b"".join(self.decrypt_blocks(split_blocks(data, self.num_bytes_to_decrypt)))
+
+        return stream.padded_context(process, self.num_bytes_to_decrypt, EncProc.DECRYPT)
+
     def make(self, data: int or Ciphertext or bytes, enc_proc: EncProc):
         """
         Method for encrypting and decrypting data.
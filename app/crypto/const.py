@@ -191,6 +191,10 @@ GOST_DEC_INDICES = (0, 1, 2, 3, 4, 5, 6, 7,
                     7, 6, 5, 4, 3, 2, 1, 0,
                     7, 6, 5, 4, 3, 2, 1, 0)
 
+# Constants of the gamma mode (addends of the counter registers N4 and N3)
+GOST_C1 = 0x01010104
+GOST_C2 = 0x01010101
+
 GOST_SBLOCK = ((9, 6, 3, 2, 8, 11, 1, 7, 10, 4, 14, 15, 12, 0, 13, 5),
                (3, 7, 14, 9, 8, 10, 15, 0, 5, 2, 6, 12, 11, 4, 13, 1),
                (14, 4, 6, 2, 11, 3, 13, 8, 12, 15, 5, 10, 0, 7, 1, 9),
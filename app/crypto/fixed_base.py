@@ -0,0 +1,132 @@
+# This module contains the exponentiation with a fixed base: g^k mod m for a fixed g
+# and m and many different exponents k (for example, g^k and y^k in the Elgamal cipher,
+# where k is a new session key for each block).
+#
+# The exponent is split into windows of w bits: k = sum(d_i * 2^(w*i)), so
+# g^k = prod((g^(2^(w*i)))^d_i). The table of the values g^(d * 2^(w*i)) for all
+# windows i and digits d is precomputed, after which the exponentiation takes only
+# one multiplication per window and no squarings. For 2048-bit numbers it is about
+# 5 times faster than the built-in pow.
+#
+# The table takes ceil(bits / w) * (2^w - 1) numbers. The window is chosen as large as
+# possible within the memory limit, and the number of tables kept is limited as well.
+from functools import lru_cache
+
+from app.crypto.mathlib import fpow
+
+# Maximum size of one table in bytes.
+MAX_TABLE_SIZE = 4 << 20
+
+# Maximum width of the window in bits.
+MAX_WINDOW = 8
+
+# Number of exponentiations after which the table is built. Building the table takes
+# about as long as 5-10 ordinary exponentiations, so it is not worth it for a few.
+PRECOMPUTE_AFTER = 8
+
+# Maximum number of tables (pairs of the base and the module) kept by fixed_base.
+CACHE_SIZE = 8
+
+# Approximate memory overhead of a Python integer object in bytes.
+_INT_OVERHEAD = 28
+
+
+def table_size(modulus_bits: int, exp_bits: int, window: int) -> int:
+    """Function for estimating the size of the table in bytes."""
+    return -(-exp_bits // window) * ((1 << window) - 1) * ((modulus_bits + 7) // 8 + _INT_OVERHEAD)
+
+
+class FixedBase:
+    def __init__(self, base: int, modulus: int, exp_bits: int = None, max_table_size: int = None,
+                 precompute_after: int = PRECOMPUTE_AFTER) -> None:
+        """
+        Exponentiation modulo with a fixed base by the precomputed table.
+
+        Args:
+            base: fixed base.
+            modulus: module.
+            exp_bits: maximum number of bits of the exponents (by default, the number of bits
+                of the module). Larger exponents are processed without the table.
+            max_table_size: maximum size of the table in bytes (by default, MAX_TABLE_SIZE).
+                If even the table with one-bit windows does not fit, the table is not used.
+            precompute_after: number of exponentiations after which the table is built.
+        """
+        if modulus < 2:
+            raise ValueError("The module must be greater than 1!")
+
+        self._base = base % modulus
+        self._modulus = modulus
+        self._exp_bits = exp_bits or modulus.bit_length()
+        self._precompute_after = precompute_after
+        self._uses = 0
+        self._table = None
+
+        if max_table_size is None:
+            max_table_size = MAX_TABLE_SIZE
+
+        self._window = 0
+        for window in range(MAX_WINDOW, 0, -1):
+            if table_size(modulus.bit_length(), self._exp_bits, window) <= max_table_size:
+                self._window = window
+                break
+
+    @property
+    def window(self) -> int:
+        """Width of the window in bits (0 if the table is not used)."""
+        return self._window
+
+    def _build_table(self) -> tuple[tuple[int, ...], ...]:
+        """Method for building the table: row i contains g^(d * 2^(w*i)) for d = 1, ..., 2^w - 1."""
+        m = self._modulus
+        b = self._base
+
+        table = []
+        for _ in range(-(-self._exp_bits // self._window)):
+            row = [b]
+            for _ in range((1 << self._window) - 2):
+                row.append(row[-1] * b % m)
+
+            table.append(tuple(row))
+            # The base of the next row: g^(2^(w*(i+1))).
+            b = row[-1] * b % m
+
+        return tuple(table)
+
+    def pow(self, exp: int) -> int:
+        """Method for calculating base^exp mod modulus."""
+        if not self._window or exp < 0 or exp.bit_length() > self._exp_bits:
+            return fpow(self._base, exp, self._modulus)
+
+        if self._table is None:
+            self._uses += 1
+            if self._uses <= self._precompute_after:
+                return fpow(self._base, exp, self._modulus)
+
+            self._table = self._build_table()
+
+        m = self._modulus
+        mask = (1 << self._window) - 1
+
+        result = 1
+        for row in self._table:
+            if not exp:
+                break
+
+            d = exp & mask
+            if d:
+                result = result * row[d - 1] % m
+
+            exp >>= self._window
+
+        return result % m
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fixed_base(base: int, modulus: int) -> FixedBase:
+    """
+    Function for getting the shared object of exponentiation with a fixed base.
+
+    The objects are cached, so the table is built once for the same base and module
+    (for example, for all ciphers with the same key). At most CACHE_SIZE objects are kept.
+    """
+    return FixedBase(base, modulus)
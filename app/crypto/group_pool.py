@@ -0,0 +1,218 @@
+# This module contains the implementation of a pool of precomputed groups (p, g) for
+# the Diffie-Hellman protocol and the Elgamal cipher, where p is a safe prime and g is
+# a primitive root modulo p.
+#
+# Generating a large safe prime takes seconds (tens of seconds for 2048 bits), so the
+# groups are generated in advance by background processes and stored in a cache file.
+# Each group is given out only once. If there are no ready groups of the requested
+# size, the group is generated on demand.
+import json
+import os
+import threading
+from pathlib import Path
+
+from app.crypto import parallel
+from app.crypto.groups import (
+    Group,
+    gen_group
+)
+from app.crypto.primes import (
+    _gen_rounds,
+    is_safe_prime
+)
+
+# Number of groups of each size kept ready by default.
+DEFAULT_POOL_SIZE = 4
+
+# Version of the format of the cache file.
+CACHE_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """Function for getting the path of the cache file in the user cache directory."""
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_dir) / "crypto-methods" / "groups.json"
+
+
+def _is_valid_group(group: Group, bits: int) -> bool:
+    """
+    Function for checking a group loaded from the cache file: p must be a safe prime of
+    the given size and g must be a primitive root modulo p, i.e. a quadratic non-residue
+    other than -1 (g^((p-1)/2) = -1 mod p).
+    """
+    p, g = group.p, group.g
+    return (p.bit_length() == bits and 1 < g < p - 1 and is_safe_prime(p, _gen_rounds(bits))
+            and pow(g, (p - 1) >> 1, p) == p - 1)
+
+
+def _lower_priority() -> None:
+    """Function for lowering the priority of the background process (initializer of the workers)."""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+
+class GroupPool:
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, cache_path: str or Path = None, workers: int = 1) -> None:
+        """
+        Pool of precomputed groups (p, g).
+
+        The ready groups are stored in the cache file, so they are preserved between runs
+        of the program. The generation of new groups is started by the fill method, and
+        also automatically after each group is given out by the get method.
+
+        Args:
+            size: number of ready groups of each size kept in the pool.
+            cache_path: path to the cache file. By default, the file "crypto-methods/groups.json"
+                in the user cache directory is used. If the value is False, the cache is not used.
+            workers: number of background processes generating the groups.
+        """
+        if size < 0 or workers < 1:
+            raise ValueError("The pool size must be non-negative and the number of workers must be positive!")
+
+        self._size = size
+        self._workers = workers
+        self._cache_path = default_cache_path() if cache_path is None else cache_path
+
+        self._lock = threading.Lock()
+        self._process_pool = None
+        # Number of groups of each size being generated.
+        self._pending: dict[int, int] = {}
+        self._groups: dict[int, list[Group]] = self._load()
+
+    def _load(self) -> dict[int, list[Group]]:
+        """
+        Method for loading the groups from the cache file. A damaged file is ignored,
+        the groups that are not valid (damaged or substituted) are dropped.
+        """
+        if not self._cache_path:
+            return {}
+
+        try:
+            with open(self._cache_path, "r") as file:
+                cache = json.load(file)
+
+            if cache.get("version") != CACHE_VERSION:
+                return {}
+
+            loaded = {int(bits): [Group(int(group["p"], 16), int(group["g"], 16)) for group in groups]
+                      for bits, groups in cache["groups"].items()}
+
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+        return {bits: [group for group in groups if _is_valid_group(group, bits)]
+                for bits, groups in loaded.items()}
+
+    def _save(self) -> None:
+        """Method for saving the groups to the cache file. It is called with the lock held."""
+        if not self._cache_path:
+            return
+
+        cache = {"version": CACHE_VERSION,
+                 "groups": {str(bits): [{"p": hex(group.p), "g": hex(group.g)} for group in groups]
+                            for bits, groups in self._groups.items()}}
+
+        try:
+            path = Path(self._cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # The file is replaced atomically, so a damaged file is not left on failure.
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w") as file:
+                json.dump(cache, file)
+
+            os.replace(tmp_path, path)
+
+        except OSError:
+            pass
+
+    def available(self, bits: int) -> int:
+        """Method for getting the number of ready groups of the given size."""
+        with self._lock:
+            return len(self._groups.get(bits, ()))
+
+    def get(self, bits: int, workers: int = 1) -> Group:
+        """
+        Method for getting a group of the given size.
+
+        A ready group is given out instantly (and removed from the pool). If there are no
+        ready groups, the group is generated on demand by the given number of processes.
+        In both cases, the generation of groups to replenish the pool is started in the background.
+        """
+        with self._lock:
+            groups = self._groups.get(bits)
+            group = groups.pop(0) if groups else None
+
+            if group is not None:
+                self._save()
+
+        if group is None:
+            group = gen_group(bits, workers)
+
+        self.fill(bits)
+        return group
+
+    def fill(self, bits: int) -> None:
+        """Method for starting the background generation of the missing groups of the given size."""
+        with self._lock:
+            missing = self._size - len(self._groups.get(bits, ())) - self._pending.get(bits, 0)
+            if missing <= 0:
+                return
+
+            if self._process_pool is None:
+                self._process_pool = parallel.get_context().Pool(self._workers, initializer=_lower_priority)
+
+            self._pending[bits] = self._pending.get(bits, 0) + missing
+
+            for _ in range(missing):
+                self._process_pool.apply_async(gen_group, (bits,),
+                                               callback=self._on_generated,
+                                               error_callback=lambda _: self._on_failed(bits))
+
+    def _on_generated(self, group: Group) -> None:
+        """Method - a callback called when a group is generated in the background."""
+        bits = group.p.bit_length()
+
+        with self._lock:
+            self._pending[bits] -= 1
+            self._groups.setdefault(bits, []).append(group)
+            self._save()
+
+    def _on_failed(self, bits: int) -> None:
+        """Method - a callback called when the background generation of a group fails."""
+        with self._lock:
+            self._pending[bits] -= 1
+
+    def wait(self) -> None:
+        """Method for waiting for the end of the background generation."""
+        with self._lock:
+            process_pool, self._process_pool = self._process_pool, None
+
+        if process_pool is not None:
+            process_pool.close()
+            process_pool.join()
+
+    def close(self) -> None:
+        """Method for stopping the background generation. The ready groups are kept in the cache."""
+        with self._lock:
+            process_pool, self._process_pool = self._process_pool, None
+            self._pending.clear()
+
+        if process_pool is not None:
+            process_pool.terminate()
+            process_pool.join()
+
+
+_default_pool = None
+
+
+def get_default_pool() -> GroupPool:
+    """Function for getting the shared pool of groups (created on first call)."""
+    global _default_pool
+
+    if _default_pool is None:
+        _default_pool = GroupPool()
+
+    return _default_pool
@@ -0,0 +1,209 @@
+# This module contains the search for the parameters of the multiplicative group modulo
+# a prime p, used by the Diffie-Hellman protocol and the Elgamal cipher: the generator
+# of the whole group (primitive root) and the generator of a subgroup of prime order.
+#
+# An element g is a primitive root modulo p if g^((p-1)/f) != 1 for every prime factor f
+# of p - 1. At least a fraction 1/(e^γ ln ln p) of the elements are primitive roots, so a
+# few candidates are enough, provided the factorization of p - 1 is known. It is known
+# for a safe prime p = 2q + 1, where the primitive roots are exactly the quadratic
+# non-residues except -1: they are selected by the Jacobi symbol without exponentiation.
+#
+# The built-in pow is used for modular exponentiation here, as in the primes module.
+from dataclasses import dataclass
+from math import gcd
+from typing import Iterable
+
+from app.crypto.primes import (
+    SMALL_PRIMES,
+    gen_safe_prime,
+    is_prime
+)
+
+
+@dataclass(frozen=True)
+class Group:
+    p: int
+    g: int
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Function for calculating the Jacobi symbol (a/n) for an odd positive n.
+
+    For a prime n, it is the Legendre symbol: 1 if a is a quadratic residue modulo n,
+    -1 if it is a non-residue, and 0 if a is divisible by n.
+    """
+    if n <= 0 or n & 1 == 0:
+        raise ValueError("The modulus must be an odd positive number!")
+
+    a %= n
+    result = 1
+
+    while a:
+        while a & 1 == 0:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+
+        a %= n
+
+    return result if n == 1 else 0
+
+
+def factor_group_order(p: int) -> tuple[int, ...]:
+    """
+    Function for finding the prime factors of p - 1 for a prime p.
+
+    The factors are found by trial division by small primes. The factorization is
+    successful if the remaining cofactor is prime (in particular, for safe primes).
+
+    Returns
+        Distinct prime factors of p - 1 in ascending order.
+
+    Raises
+        ValueError if p - 1 has more than one large prime factor.
+    """
+    n = p - 1
+    factors = []
+
+    for f in SMALL_PRIMES:
+        if f * f > n:
+            break
+
+        if n % f == 0:
+            factors.append(f)
+            while n % f == 0:
+                n //= f
+
+    if n > 1:
+        if not is_prime(n):
+            raise ValueError("Failed to factor p - 1, the prime factors of p - 1 must be specified!")
+
+        factors.append(n)
+
+    return tuple(factors)
+
+
+def _check_factors(p: int, factors: Iterable[int]) -> tuple[int, ...]:
+    """Function for checking that the factors are all the distinct prime factors of p - 1."""
+    factors = tuple(sorted(set(factors)))
+    n = p - 1
+
+    for f in factors:
+        if f < 2 or n % f != 0 or not is_prime(f):
+            raise ValueError(f"The number {f} is not a prime factor of p - 1!")
+
+        while n % f == 0:
+            n //= f
+
+    if n != 1:
+        raise ValueError("The factorization of p - 1 is incomplete!")
+
+    return factors
+
+
+def is_generator(g: int, p: int, factors: Iterable[int]) -> bool:
+    """
+    Function for checking whether g is a primitive root modulo a prime p.
+
+    g
+        Element to check.
+    p
+        Prime modulus.
+    factors
+        Distinct prime factors of p - 1.
+    """
+    return 1 < g < p and all(pow(g, (p - 1) // f, p) != 1 for f in factors)
+
+
+def _safe_prime_generator(p: int) -> int:
+    """
+    Function for finding the smallest primitive root modulo p = 2q + 1, where q is prime.
+
+    The primitive roots are the quadratic non-residues, so candidates are selected by the
+    Jacobi symbol, and only the found one is checked by exponentiation: g^q = -1 (mod p).
+    Together with gcd(g^2 - 1, p) = 1 it also proves that p is prime (Pocklington's criterion).
+    """
+    q = (p - 1) >> 1
+
+    for g in range(2, p - 1):
+        symbol = jacobi(g, p)
+        if symbol == 0:
+            break
+
+        if symbol == -1:
+            if pow(g, q, p) == p - 1 and gcd(g * g - 1, p) == 1:
+                return g
+
+            break
+
+    raise ValueError("The number must be a safe prime!")
+
+
+def find_generator(p: int, factors: Iterable[int] = None) -> int:
+    """
+    Function for finding the smallest primitive root modulo a prime p.
+
+    p
+        Prime modulus.
+    factors
+        Distinct prime factors of p - 1. If they are not specified, then for a safe prime
+        the generator is found by the Jacobi symbol, otherwise p - 1 is factored by trial
+        division (ValueError is raised if it fails).
+    """
+    if p < 5 or p & 1 == 0:
+        raise ValueError("The module must be a prime greater than 3!")
+
+    if factors is None and p & 3 == 3 and is_prime((p - 1) >> 1):
+        return _safe_prime_generator(p)
+
+    factors = factor_group_order(p) if factors is None else _check_factors(p, factors)
+
+    for g in range(2, p):
+        if is_generator(g, p, factors):
+            # Together with the found generator, it proves that p is prime (Lucas test).
+            if pow(g, p - 1, p) != 1:
+                break
+
+            return g
+
+    raise ValueError("The number must be prime!")
+
+
+def find_subgroup_generator(p: int, q: int = None) -> int:
+    """
+    Function for finding a generator of the subgroup of prime order q modulo a prime p.
+
+    p
+        Prime modulus.
+    q
+        Prime divisor of p - 1. By default, q = (p - 1) / 2, which requires a safe prime p.
+    """
+    if q is None:
+        q = (p - 1) >> 1
+
+    if q < 2 or (p - 1) % q != 0 or not is_prime(q):
+        raise ValueError("The order of the subgroup must be a prime divisor of p - 1!")
+
+    cofactor = (p - 1) // q
+
+    for h in range(2, p):
+        g = pow(h, cofactor, p)
+        if g != 1:
+            return g
+
+    raise ValueError("The number must be prime!")
+
+
+def gen_group(bits: int, workers: int = 1) -> Group:
+    """
+    Function for generating a group: a safe prime of the given size and its primitive root.
+
+    The workers parameter is the number of processes searching for the safe prime.
+    """
+    p = gen_safe_prime(bits, workers)
+    return Group(p, _safe_prime_generator(p))
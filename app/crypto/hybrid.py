@@ -0,0 +1,246 @@
+# This module contains the implementation of the hybrid encryption (envelope): the data is
+# encrypted by a symmetric cipher (GOST 28147-89 or DES in CTR mode) with a random session
+# key, and only the session key is encrypted by the asymmetric cipher (RSA or Elgamal).
+# The data is processed at the speed of the symmetric cipher, and the ciphertext is
+# longer than the plaintext only by the header.
+#
+# Format of the envelope (integers in little endian order):
+#   magic (4 bytes) | version (1 byte) | symmetric cipher (1 byte) | length of the wrapped key (4 bytes)
+#   | wrapped key | data encrypted by the symmetric cipher
+# The wrapped key is the session key and the initialization vector encrypted by the
+# incremental interface of the asymmetric cipher (with padding).
+#
+# The envelope provides confidentiality only: the integrity of the data is not checked.
+import secrets
+import struct
+from enum import Enum
+
+from app.crypto.common import EncProc
+
+MAGIC = b"CMHE"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBI")
+
+# Sizes of the keys of the symmetric ciphers and of their initialization vector in bytes.
+_KEY_SIZES = {"DES": 7, "GOST": 32}
+_IV_SIZE = 8
+
+
+class Hybrid:
+
+    class SymCipher(Enum):
+        """Symmetric ciphers encrypting the data. The values are stored in the header."""
+        DES = 1
+        GOST = 2
+
+        @staticmethod
+        def from_str(value: str):
+            match value.lower():
+                case "des":
+                    return Hybrid.SymCipher.DES
+
+                case "gost":
+                    return Hybrid.SymCipher.GOST
+
+                case _:
+                    raise NotImplementedError
+
+    def __init__(self, cipher, sym_cipher: SymCipher = SymCipher.GOST, workers: int = 1) -> None:
+        """
+        Implementation of the hybrid encryption.
+
+        Args:
+            cipher: asymmetric cipher (RSA or Elgamal object) encrypting the session key.
+            sym_cipher: symmetric cipher encrypting the data (it is used for encryption,
+                when decrypting the cipher is read from the header).
+            workers: number of processes used by the symmetric cipher to process large data.
+        """
+        if not isinstance(sym_cipher, Hybrid.SymCipher):
+            raise TypeError("Possible types: Hybrid.SymCipher.DES, Hybrid.SymCipher.GOST.")
+
+        self._cipher = cipher
+        self._sym_cipher = sym_cipher
+        self._workers = workers
+
+    def _make_sym_cipher(self, sym_cipher: SymCipher, secret: bytes):
+        """Method for creating the symmetric cipher from the session key and the initialization vector."""
+        match sym_cipher:
+            case Hybrid.SymCipher.DES:
+                from app.crypto.symmetric.des import DES as cipher_cls
+
+            case Hybrid.SymCipher.GOST:
+                from app.crypto.symmetric.gost import GOST as cipher_cls
+
+            case _:
+                raise TypeError("Possible types: Hybrid.SymCipher.DES, Hybrid.SymCipher.GOST.")
+
+        key_size = _KEY_SIZES[sym_cipher.name]
+        if len(secret) != key_size + _IV_SIZE:
+            raise ValueError("Invalid session key! (Check the private key)")
+
+        return cipher_cls(secret[:key_size].hex(), secret[key_size:].hex(), cipher_cls.EncMode.CTR,
+                          workers=self._workers)
+
+    def _max_wrapped_key_size(self) -> int:
+        """
+        Method for getting the maximum length of the wrapped key: the longest session key
+        and the initialization vector with padding, encrypted by the asymmetric cipher.
+        """
+        blocks = (max(_KEY_SIZES.values()) + _IV_SIZE) // self._cipher.num_bytes_to_encrypt + 1
+        return blocks * self._cipher.num_bytes_to_decrypt
+
+    def _wrap(self, secret: bytes) -> bytes:
+        """Method for encrypting the session key by the asymmetric cipher."""
+        context = self._cipher.encryptor()
+        return context.update(secret) + context.finalize()
+
+    def _unwrap(self, wrapped_key: bytes) -> bytes:
+        """Method for decrypting the session key by the asymmetric cipher."""
+        context = self._cipher.decryptor()
+        return context.update(wrapped_key) + context.finalize()
+
+    def encryptor(self) -> "_Encryptor":
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        A new session key is generated for each encryptor. The header is returned
+        together with the first encrypted data.
+        """
+        secret = secrets.token_bytes(_KEY_SIZES[self._sym_cipher.name] + _IV_SIZE)
+
+        wrapped_key = self._wrap(secret)
+        header = _HEADER.pack(MAGIC, VERSION, self._sym_cipher.value, len(wrapped_key)) + wrapped_key
+
+        return _Encryptor(header, self._make_sym_cipher(self._sym_cipher, secret).encryptor())
+
+    def decryptor(self) -> "_Decryptor":
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is buffered until the header is received, after which the session key is
+        decrypted and the rest of the data is decrypted by the symmetric cipher.
+        """
+        return _Decryptor(self)
+
+    def _parse_header(self, data: bytes) -> tuple[int, object] or None:
+        """
+        Method for parsing the header of the envelope.
+
+        Returns
+            Pair (header length, symmetric decryptor), or None if the data is shorter than the header.
+        """
+        if len(data) < _HEADER.size:
+            return None
+
+        magic, version, sym_cipher, wrapped_key_size = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("The data is not a hybrid envelope!")
+
+        try:
+            sym_cipher = Hybrid.SymCipher(sym_cipher)
+        except ValueError:
+            raise ValueError("Unknown symmetric cipher in the header!") from None
+
+        # The length is not trusted: the data is buffered until the whole header is received.
+        if wrapped_key_size > self._max_wrapped_key_size():
+            raise ValueError("The data is not a hybrid envelope!")
+
+        header_size = _HEADER.size + wrapped_key_size
+        if len(data) < header_size:
+            return None
+
+        secret = self._unwrap(bytes(data[_HEADER.size:header_size]))
+        return header_size, self._make_sym_cipher(sym_cipher, secret).decryptor()
+
+    def encrypt(self, data: bytes) -> bytes:
+        """Method for encrypting data. Returns the envelope: the header and the encrypted data."""
+        context = self.encryptor()
+        return context.update(data) + context.finalize()
+
+    def decrypt(self, data: bytes) -> bytes:
+        """Method for decrypting the envelope."""
+        context = self.decryptor()
+        return context.update(data) + context.finalize()
+
+    def make(self, data: bytes, enc_proc: EncProc) -> bytes:
+        """
+        Method for encrypting and decrypting data.
+
+        Args:
+            data: data to encrypt or the envelope to decrypt.
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+        """
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                return self.encrypt(data)
+
+            case EncProc.DECRYPT:
+                return self.decrypt(data)
+
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+
+class _Encryptor:
+    def __init__(self, header: bytes, context) -> None:
+        """Incremental encryptor of the envelope: the header followed by the output of the symmetric encryptor."""
+        self._header = header
+        self._context = context
+
+    def update(self, data: bytes) -> bytes:
+        """Method for encrypting the next chunk of data. Returns the encrypted data."""
+        processed_data = self._context.update(data)
+
+        if self._header:
+            processed_data, self._header = self._header + processed_data, b""
+
+        return processed_data
+
+    def finalize(self) -> bytes:
+        """Method for completing the encryption. Returns the rest of the encrypted data."""
+        processed_data = self._context.finalize()
+
+        if self._header:
+            processed_data, self._header = self._header + processed_data, b""
+
+        return processed_data
+
+
+class _Decryptor:
+    def __init__(self, hybrid: Hybrid) -> None:
+        """Incremental decryptor of the envelope."""
+        self._hybrid = hybrid
+        self._buffer = bytearray()
+        self._context = None
+        self._finalized = False
+
+    def update(self, data: bytes) -> bytes:
+        """Method for decrypting the next chunk of data. Returns the decrypted data."""
+        if self._finalized:
+            raise ValueError("The context has already been finalized!")
+
+        if self._context is not None:
+            return self._context.update(data)
+
+        self._buffer += data
+
+        parsed = self._hybrid._parse_header(self._buffer)
+        if parsed is None:
+            return b""
+
+        header_size, self._context = parsed
+        data, self._buffer = bytes(self._buffer[header_size:]), bytearray()
+        return self._context.update(data)
+
+    def finalize(self) -> bytes:
+        """Method for completing the decryption. Returns the rest of the decrypted data."""
+        if self._finalized:
+            raise ValueError("The context has already been finalized!")
+
+        self._finalized = True
+
+        if self._context is None:
+            raise ValueError("The envelope is too short: the header is incomplete!")
+
+        return self._context.finalize()
@@ -1,14 +1,61 @@
-from typing import NamedTuple
+# This module contains the big-integer arithmetic used by the asymmetric ciphers and
+# the cryptographic protocols: modular exponentiation, the extended Euclidean algorithm
+# and the modular inverse.
+#
+# The functions are performed by one of the backends:
+# - REFERENCE: the implementation of the algorithms in pure Python;
+# - BUILTIN: the built-in pow (including pow(a, -1, m) for the inverse);
+# - GMPY2: the gmpy2 library (GMP), if it is installed.
+# By default, the fastest available backend is used. It can be changed by set_backend.
+#
+# ModContext binds the backend to one module for repeated operations under it (RSA,
+# Elgamal, the protocols) and finds many inverses at once by Montgomery's trick.
+from enum import (
+    Enum,
+    auto
+)
+from typing import (
+    Iterable,
+    NamedTuple
+)
 
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
 
-def fpow(a: int, n: int, m: int = None) -> int:
-    """Function for fast exponentiation modulo."""
-    if not (isinstance(a, int) and isinstance(n, int)):
-        raise TypeError("Function arguments must be integers.")
 
-    if m and not isinstance(m, int):
-        raise TypeError("Function arguments must be integers.")
+class Backend(Enum):
+    """Implementations of the big-integer arithmetic."""
+    REFERENCE = auto()
+    BUILTIN = auto()
+    GMPY2 = auto()
+
+    @staticmethod
+    def from_str(value: str):
+        match value.lower():
+            case "reference":
+                return Backend.REFERENCE
+
+            case "builtin":
+                return Backend.BUILTIN
 
+            case "gmpy2":
+                return Backend.GMPY2
+
+            case _:
+                raise NotImplementedError
+
+
+class EGCDResult(NamedTuple):
+    """Result of the extended Euclidean algorithm"""
+    gcd: int
+    x: int
+    y: int
+
+
+def _fpow_reference(a: int, n: int, m: int = None) -> int:
+    """Function for fast exponentiation modulo (square-and-multiply)."""
     result = 1
 
     while n > 0:
@@ -26,23 +73,8 @@ def fpow(a: int, n: int, m: int = None) -> int:
     return result
 
 
-class EGCDResult(NamedTuple):
-    """Result of the extended Euclidean algorithm"""
-    gcd: int
-    x: int
-    y: int
-
-
-def ext_gcd(a: int, b: int) -> EGCDResult:
-    """
-    Extended Euclidean Algorithm.
-
-    Returns a namedtuple (d, x, y) where x, y are the
-    expansion coefficients: gcd = d = a*x + b*y
-    """
-    if not (isinstance(a, int) and isinstance(b, int)):
-        raise TypeError("Function arguments must be integers.")
-
+def _ext_gcd_reference(a: int, b: int) -> EGCDResult:
+    """Extended Euclidean Algorithm."""
     s0, s1 = 1, 0
     t0, t1 = 0, 1
 
@@ -65,14 +97,204 @@ def ext_gcd(a: int, b: int) -> EGCDResult:
     return result
 
 
-def modinv(a: int, m: int) -> int:
-    """
-    Modular multiplicative inverse
-    """
-    g, x, y = ext_gcd(a, m)
+def _modinv_reference(a: int, m: int) -> int:
+    """Modular multiplicative inverse by the extended Euclidean algorithm."""
+    g, x, y = _ext_gcd_reference(a, m)
 
     if g != 1:
         raise ValueError("Unable to find inverse element. The numbers "
                          "A and M must be relatively prime.")
 
     return x % m
+
+
+def _fpow_builtin(a: int, n: int, m: int = None) -> int:
+    """Function for fast exponentiation modulo by the built-in pow."""
+    if n <= 0:
+        return 1
+
+    return pow(a, n, m) if m else a ** n
+
+
+def _modinv_builtin(a: int, m: int) -> int:
+    """Modular multiplicative inverse by the built-in pow."""
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        raise ValueError("Unable to find inverse element. The numbers "
+                         "A and M must be relatively prime.") from None
+
+
+def _fpow_gmpy2(a: int, n: int, m: int = None) -> int:
+    """Function for fast exponentiation modulo by gmpy2."""
+    if n <= 0:
+        return 1
+
+    return int(gmpy2.powmod(a, n, m)) if m else int(gmpy2.mpz(a) ** n)
+
+
+def _ext_gcd_gmpy2(a: int, b: int) -> EGCDResult:
+    """Extended Euclidean Algorithm by gmpy2."""
+    g, x, y = gmpy2.gcdext(a, b)
+    return EGCDResult(int(g), int(x), int(y))
+
+
+def _modinv_gmpy2(a: int, m: int) -> int:
+    """Modular multiplicative inverse by gmpy2."""
+    try:
+        return int(gmpy2.invert(a, m))
+    except ZeroDivisionError:
+        raise ValueError("Unable to find inverse element. The numbers "
+                         "A and M must be relatively prime.") from None
+
+
+# Implementations of the functions (fpow, ext_gcd, modinv) of each backend. Python has
+# no built-in extended Euclidean algorithm, so the BUILTIN backend uses the reference one.
+_BACKENDS = {Backend.REFERENCE: (_fpow_reference, _ext_gcd_reference, _modinv_reference),
+             Backend.BUILTIN: (_fpow_builtin, _ext_gcd_reference, _modinv_builtin),
+             Backend.GMPY2: (_fpow_gmpy2, _ext_gcd_gmpy2, _modinv_gmpy2)}
+
+
+def available_backends() -> tuple[Backend, ...]:
+    """Function for getting the backends that can be used (GMPY2 requires the gmpy2 library)."""
+    return tuple(backend for backend in Backend if backend is not Backend.GMPY2 or gmpy2 is not None)
+
+
+_backend = Backend.GMPY2 if gmpy2 is not None else Backend.BUILTIN
+_fpow, _ext_gcd, _modinv = _BACKENDS[_backend]
+
+
+def get_backend() -> Backend:
+    """Function for getting the current backend."""
+    return _backend
+
+
+def set_backend(backend: Backend) -> None:
+    """Function for setting the backend used by the functions of the module."""
+    global _backend, _fpow, _ext_gcd, _modinv
+
+    if not isinstance(backend, Backend):
+        raise TypeError("Possible types: Backend.REFERENCE, Backend.BUILTIN, Backend.GMPY2.")
+
+    if backend not in available_backends():
+        raise ValueError(f"The backend {backend.name} is not available!")
+
+    _backend = backend
+    _fpow, _ext_gcd, _modinv = _BACKENDS[backend]
+
+
+def fpow(a: int, n: int, m: int = None) -> int:
+    """Function for fast exponentiation modulo."""
+    if not (isinstance(a, int) and isinstance(n, int)):
+        raise TypeError("Function arguments must be integers.")
+
+    if m and not isinstance(m, int):
+        raise TypeError("Function arguments must be integers.")
+
+    return _fpow(a, n, m)
+
+
+def ext_gcd(a: int, b: int) -> EGCDResult:
+    """
+    Extended Euclidean Algorithm.
+
+    Returns a namedtuple (d, x, y) where x, y are the
+    expansion coefficients: gcd = d = a*x + b*y
+    """
+    if not (isinstance(a, int) and isinstance(b, int)):
+        raise TypeError("Function arguments must be integers.")
+
+    return _ext_gcd(a, b)
+
+
+def modinv(a: int, m: int) -> int:
+    """
+    Modular multiplicative inverse
+    """
+    return _modinv(a, m)
+
+
+class ModContext:
+    def __init__(self, m: int) -> None:
+        """
+        Context of the modular arithmetic for repeated operations under one module.
+
+        The functions of the current backend are bound once at creation (the context keeps
+        using them, even if the backend is changed later), and the module is converted to
+        the representation of the backend (for GMPY2, to mpz), so it is not converted on
+        each call.
+
+        Montgomery and Barrett reductions are not used: implemented in pure Python, they
+        are slower than the operator % and the built-in pow, which are performed in C.
+
+        Args:
+            m: module (greater than 1).
+        """
+        if not isinstance(m, int):
+            raise TypeError("Function arguments must be integers.")
+
+        if m < 2:
+            raise ValueError("The module must be greater than 1!")
+
+        self._m = m
+        self._backend = _backend
+        self._fpow, _, self._modinv = _BACKENDS[_backend]
+        self._backend_m = gmpy2.mpz(m) if _backend is Backend.GMPY2 else m
+
+    @property
+    def modulus(self) -> int:
+        """Module of the context."""
+        return self._m
+
+    @property
+    def backend(self) -> Backend:
+        """Backend performing the operations of the context."""
+        return self._backend
+
+    def reduce(self, a: int) -> int:
+        """Method for reducing a number modulo."""
+        return a % self._m
+
+    def mul(self, a: int, b: int) -> int:
+        """Method for multiplication modulo."""
+        return a * b % self._m
+
+    def pow(self, a: int, n: int) -> int:
+        """Method for exponentiation modulo. A negative exponent is the power of the inverse."""
+        if n < 0:
+            return self._fpow(self.inv(a), -n, self._backend_m) % self._m
+
+        return self._fpow(a, n, self._backend_m) % self._m
+
+    def inv(self, a: int) -> int:
+        """Method for finding the modular multiplicative inverse."""
+        return self._modinv(a % self._m, self._backend_m)
+
+    def batch_inv(self, values: Iterable[int]) -> list[int]:
+        """
+        Method for finding the inverses of several numbers by Montgomery's trick.
+
+        Only one inverse (of the product of all numbers) is found, the rest are obtained
+        by 3(n - 1) multiplications, which is much cheaper than n inversions.
+
+        Raises ValueError if any of the numbers has no inverse.
+        """
+        m = self._m
+        values = [a % m for a in values]
+        if not values:
+            return []
+
+        # prefix[i] = values[0] * ... * values[i]
+        prefix = [values[0]]
+        for a in values[1:]:
+            prefix.append(prefix[-1] * a % m)
+
+        inverse = self.inv(prefix[-1])
+
+        result = [0] * len(values)
+        for i in range(len(values) - 1, 0, -1):
+            result[i] = inverse * prefix[i - 1] % m
+            inverse = inverse * values[i] % m
+
+        result[0] = inverse
+        return result
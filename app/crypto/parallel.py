@@ -0,0 +1,155 @@
+# This module contains helpers for distributing work across processes.
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Callable,
+    Iterable,
+    Iterator
+)
+
+# Minimum size of data in bytes processed by one worker. Smaller pieces are not
+# worth the cost of transferring them to another process.
+MIN_CHUNK_SIZE = 1 << 20
+
+# Start method of the worker processes. Forking a multi-threaded process (the GUI
+# runs the work in a QThread) can deadlock the child, so the workers are forked from
+# a single-threaded server process ("forkserver") or, where it is not available,
+# started from scratch ("spawn").
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_context() -> multiprocessing.context.BaseContext:
+    """Function for getting the multiprocessing context used to start the worker processes."""
+    return multiprocessing.get_context(START_METHOD)
+
+
+def cpu_count() -> int:
+    """Function for getting the number of processors available to the current process."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Function for getting a shared process pool with the given number of workers.
+
+    Pools are created on first request and reused, so the cost of starting
+    the processes is paid once. All pools are shut down when the program exits.
+    The function can be called from several threads.
+    """
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ProcessPoolExecutor(max_workers, mp_context=get_context())
+
+        return _executors[max_workers]
+
+
+@atexit.register
+def shutdown() -> None:
+    """Function for shutting down all shared process pools."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(cancel_futures=True)
+
+
+def is_worth_parallel(size: int, workers: int) -> bool:
+    """Function for checking whether data of the given size should be processed in parallel."""
+    return workers > 1 and size >= 2 * MIN_CHUNK_SIZE
+
+
+def split(size: int, workers: int, align: int = 1) -> list[tuple[int, int]]:
+    """
+    Function for splitting data into chunks for workers.
+
+    Args:
+        size: size of the data.
+        workers: number of workers.
+        align: the boundaries of the chunks are multiples of this value (block size).
+
+    Returns:
+        List of pairs (start, end) of the chunks.
+    """
+    chunk_size = max(-(-size // workers), MIN_CHUNK_SIZE)
+    chunk_size = -(-chunk_size // align) * align
+
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def map_chunks(fn: Callable[[bytes, int], bytes], data: bytes, workers: int,
+               align: int = 1, overlap: int = 0) -> bytes:
+    """
+    Function for processing data in parallel by chunks.
+
+    Args:
+        fn: function called in the worker for each chunk with the chunk and the index of
+            its first block (position divided by align). The function must be picklable.
+        data: data to be processed.
+        workers: number of worker processes.
+        align: the boundaries of the chunks are multiples of this value (block size).
+        overlap: number of bytes at the beginning of the data preceding the first chunk.
+            Each chunk is passed to the worker together with the overlap bytes preceding
+            it, so adjacent chunks overlap (for modes where a block depends on the
+            previous one). The result of the function must not include them.
+
+    Returns:
+        Concatenation of the results in the order of the chunks.
+    """
+    executor = get_executor(workers)
+    futures = [executor.submit(fn, data[start:overlap + end], start // align)
+               for start, end in split(len(data) - overlap, workers, align)]
+
+    return b"".join(future.result() for future in futures)
+
+
+def imap_batches(fn: Callable[[list], list], items: Iterable, workers: int, batch_size: int,
+                 max_in_flight: int = None) -> Iterator:
+    """
+    Function for processing items in parallel by batches, keeping their order.
+
+    The items are read lazily: at most max_in_flight batches are submitted to the
+    workers at a time, so the memory use does not depend on the number of items.
+
+    Args:
+        fn: function called in the worker for each batch (list of items), returning the
+            list of results. The function must be picklable.
+        items: items to be processed.
+        workers: number of worker processes.
+        batch_size: number of items in a batch.
+        max_in_flight: maximum number of batches being processed (by default, twice the
+            number of workers).
+
+    Returns:
+        Iterator over the results in the order of the items.
+    """
+    executor = get_executor(workers)
+    max_in_flight = max_in_flight or 2 * workers
+
+    items = iter(items)
+    pending = deque()
+
+    try:
+        while True:
+            while len(pending) < max_in_flight and (batch := list(islice(items, batch_size))):
+                pending.append(executor.submit(fn, batch))
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+    finally:
+        for future in pending:
+            future.cancel()
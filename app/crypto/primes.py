@@ -0,0 +1,366 @@
+# This module contains the implementation of the generation of prime numbers.
+#
+# Candidates are taken from a window of consecutive odd numbers starting at a random
+# point. The window is sieved by the table of small primes, so that the expensive
+# Miller-Rabin test is performed only for numbers without small divisors.
+#
+# The built-in pow is used for modular exponentiation here directly: the search performs
+# hundreds of exponentiations, so the argument checks of mathlib.fpow are not repeated.
+#
+# Large primes can be searched in parallel: consecutive pieces of the window are
+# sieved and tested by worker processes, and the first prime found is returned.
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    wait
+)
+from functools import lru_cache
+from secrets import SystemRandom
+
+from app.crypto import parallel
+
+# Upper bound of the table of small primes used for sieving.
+SMALL_PRIMES_BOUND = 1 << 16
+
+# Number of rounds of the Miller-Rabin test. The probability that a composite
+# number passes the test does not exceed 4^-40.
+MILLER_RABIN_ROUNDS = 40
+
+# Number of rounds of the Miller-Rabin test for generated (random) candidates of at
+# least GEN_MIN_BITS bits. For random candidates the probability of error is much lower
+# than the worst-case bound: FIPS 186-4 (table C.3) requires 7 rounds for 512-bit
+# primes with error probability 2^-100, and fewer rounds for larger primes.
+GEN_MILLER_RABIN_ROUNDS = 8
+GEN_MIN_BITS = 512
+
+# Number of odd candidates in one sieved window.
+SIEVE_WINDOW = 1 << 12
+
+# Minimum number of bits of a prime for which the parallel search is used. Smaller
+# primes are found faster than the tasks are transferred to the worker processes.
+PARALLEL_MIN_BITS = 1024
+
+# Number of odd candidates tested by a worker in one task, for primes and safe primes.
+# About 10% (primes) and 0.2% (safe primes) of the candidates pass the sieve, so a task
+# performs a few dozen exponentiations and the search is stopped soon after a prime is found.
+PARALLEL_BATCH = 256
+PARALLEL_SAFE_BATCH = SIEVE_WINDOW
+
+_sysrand = SystemRandom()
+
+
+def _gen_small_primes(bound: int) -> tuple[int, ...]:
+    """Function for generating all primes less than the bound (sieve of Eratosthenes)."""
+    sieve = bytearray([1]) * bound
+    sieve[:2] = b"\00\00"
+
+    for i in range(2, int(bound ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, bound, i)))
+
+    return tuple(i for i in range(bound) if sieve[i])
+
+
+SMALL_PRIMES = _gen_small_primes(SMALL_PRIMES_BOUND)
+
+# Odd small primes used for sieving.
+_SIEVE_PRIMES = SMALL_PRIMES[1:]
+
+
+def miller_rabin(n: int, rounds: int = MILLER_RABIN_ROUNDS) -> bool:
+    """
+    Function for checking an odd number n > 3 for primality by the Miller-Rabin test.
+
+    n
+        Odd number greater than 3.
+    rounds
+        Number of rounds of the test with random bases.
+    """
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for _ in range(rounds):
+        x = pow(_sysrand.randrange(2, n - 1), d, n)
+        if x == 1 or x == n - 1:
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def is_prime(n: int, rounds: int = MILLER_RABIN_ROUNDS) -> bool:
+    """
+    Function for checking a number for primality.
+
+    Numbers less than the square of the bound of the table of small primes are checked
+    exactly by trial division, larger numbers are checked by the Miller-Rabin test.
+
+    n
+        Number to check.
+    rounds
+        Number of rounds of the Miller-Rabin test.
+    """
+    if not isinstance(n, int):
+        raise TypeError("The function parameter must be an integer!")
+
+    if n < 2:
+        return False
+
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+        if p * p > n:
+            return True
+
+    return miller_rabin(n, rounds)
+
+
+def is_safe_prime(p: int, rounds: int = MILLER_RABIN_ROUNDS) -> bool:
+    """Function for checking whether a number is a safe prime (p = 2q + 1, where q is prime)."""
+    return p > 4 and p & 1 == 1 and is_prime((p - 1) >> 1, rounds) and is_prime(p, rounds)
+
+
+def _check_bits(n: int, min_bits: int) -> None:
+    """Function for checking the number of bits of a generated prime."""
+    if not isinstance(n, int):
+        raise TypeError("The function parameter must be an integer!")
+
+    if n < min_bits:
+        raise ValueError(f"The number of bits must be at least {min_bits}!")
+
+
+def _gen_rounds(bits: int) -> int:
+    """Function for getting the number of rounds of the Miller-Rabin test for generated candidates."""
+    return GEN_MILLER_RABIN_ROUNDS if bits >= GEN_MIN_BITS else MILLER_RABIN_ROUNDS
+
+
+def _sieve(start: int, residues: tuple[tuple[int, int, int], ...], size: int) -> bytearray:
+    """
+    Function for sieving the window of odd numbers start + 2k, k = 0, ..., size - 1.
+
+    residues
+        Triples (p, r, h): the number start + 2k is excluded if it is congruent to r
+        modulo p; h is the inverse of 2 modulo p.
+
+    Returns
+        Array in which the not excluded numbers are marked with ones.
+    """
+    sieve = bytearray([1]) * size
+
+    for p, r, h in residues:
+        # start + 2k = r (mod p)  <=>  k = (r - start) * 2^-1 (mod p)
+        k = (r - start % p) * h % p
+        if k < size:
+            sieve[k::p] = bytes(len(range(k, size, p)))
+
+    return sieve
+
+
+@lru_cache
+def _prime_residues(bits: int) -> tuple[tuple[int, int, int], ...]:
+    """Function for getting the residues excluding the candidates for a prime with the given number of bits."""
+    # Only primes less than the candidates are used, so that a prime candidate is not excluded.
+    return tuple((p, 0, (p + 1) >> 1) for p in _SIEVE_PRIMES if p.bit_length() < bits)
+
+
+@lru_cache
+def _safe_prime_residues(bits: int) -> tuple[tuple[int, int, int], ...]:
+    """
+    Function for getting the residues excluding the candidates for q, where p = 2q + 1 is
+    a safe prime with the given number of bits.
+
+    The number p = 2q + 1 is divisible by a small prime s if q = (s - 1) / 2 (mod s).
+    """
+    # Only primes less than the candidates for q are used, so that a prime q is not excluded.
+    sieve_primes = tuple(s for s in _SIEVE_PRIMES if s.bit_length() < bits - 1)
+    return (tuple((s, 0, (s + 1) >> 1) for s in sieve_primes) +
+            tuple((s, (s - 1) >> 1, (s + 1) >> 1) for s in sieve_primes))
+
+
+def _search_prime(bits: int, start: int, size: int) -> int or None:
+    """
+    Function for searching a prime among the odd numbers start + 2k, k = 0, ..., size - 1.
+
+    Returns
+        The first prime with the given number of bits, or None if there are no primes.
+    """
+    rounds = _gen_rounds(bits)
+
+    sieve = _sieve(start, _prime_residues(bits), size)
+    for k in (k for k, flag in enumerate(sieve) if flag):
+        n = start + 2 * k
+        if n.bit_length() > bits:
+            break
+
+        if miller_rabin(n, rounds):
+            return n
+
+    return None
+
+
+def _search_safe_prime(bits: int, start: int, size: int) -> int or None:
+    """
+    Function for searching a safe prime p = 2q + 1 among the candidates q = start + 2k, k = 0, ..., size - 1.
+
+    Only candidates for which p passes the Fermat test to base 2 are checked by the Miller-Rabin test.
+
+    Returns
+        The first safe prime with the given number of bits, or None if there are no safe primes.
+    """
+    rounds = _gen_rounds(bits)
+
+    sieve = _sieve(start, _safe_prime_residues(bits), size)
+    for k in (k for k, flag in enumerate(sieve) if flag):
+        q = start + 2 * k
+        p = 2 * q + 1
+        if p.bit_length() > bits:
+            break
+
+        if pow(2, p - 1, p) == 1 and miller_rabin(q, rounds) and miller_rabin(p, rounds):
+            return p
+
+    return None
+
+
+def _search_parallel(search, bits: int, start_bits: int, batch: int, count: int, workers: int) -> list[int]:
+    """
+    Function for searching several distinct primes in parallel.
+
+    The window of candidates starting at a random point is split into consecutive pieces
+    of the batch size, which are searched by the worker processes (a few pieces per worker
+    are queued). When enough primes are found, the queued pieces are cancelled, and the
+    results of the pieces being searched are ignored.
+
+    Args:
+        search: function searching a piece (_search_prime or _search_safe_prime).
+        bits: number of bits of the primes.
+        start_bits: number of bits of the candidates passed to the search function.
+        batch: number of candidates in a piece.
+        count: number of primes to find.
+        workers: number of worker processes.
+    """
+    executor = parallel.get_executor(workers)
+
+    start = 0
+    offset = SIEVE_WINDOW
+
+    def submit():
+        nonlocal start, offset
+
+        # When the window is exhausted, the search continues from a new random point.
+        if offset >= SIEVE_WINDOW:
+            start = _sysrand.getrandbits(start_bits) | (1 << (start_bits - 1)) | 1
+            offset = 0
+
+        future = executor.submit(search, bits, start + 2 * offset, batch)
+        offset += batch
+        return future
+
+    primes = []
+    pending = {submit() for _ in range(2 * workers)}
+
+    try:
+        while len(primes) < count:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                prime = future.result()
+                if prime is not None and prime not in primes:
+                    primes.append(prime)
+
+                pending.add(submit())
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+    return primes[:count]
+
+
+def gen_primes(bits: int = 1024, count: int = 1, workers: int = 1) -> list[int]:
+    """
+    Function for generating several distinct random prime numbers with the given number of bits.
+
+    bits
+        Number of bits of the primes (the most significant bit is always set).
+    count
+        Number of primes.
+    workers
+        Number of processes searching for the primes at the same time. The parallel search
+        is used only for primes of at least PARALLEL_MIN_BITS bits.
+    """
+    _check_bits(bits, 2)
+
+    if workers > 1 and bits >= PARALLEL_MIN_BITS:
+        return _search_parallel(_search_prime, bits, bits, PARALLEL_BATCH, count, workers)
+
+    primes = []
+    while len(primes) < count:
+        prime = gen_prime(bits)
+        if prime not in primes:
+            primes.append(prime)
+
+    return primes
+
+
+def gen_prime(bits: int = 1024, workers: int = 1) -> int:
+    """
+    Function for generating a random prime number with the given number of bits.
+
+    bits
+        Number of bits of the prime (the most significant bit is always set).
+    workers
+        Number of processes searching for the prime at the same time. The parallel search
+        is used only for primes of at least PARALLEL_MIN_BITS bits.
+    """
+    _check_bits(bits, 2)
+
+    if bits <= SMALL_PRIMES_BOUND.bit_length() - 1:
+        return _sysrand.choice([p for p in SMALL_PRIMES if p.bit_length() == bits])
+
+    if workers > 1 and bits >= PARALLEL_MIN_BITS:
+        return gen_primes(bits, 1, workers)[0]
+
+    while True:
+        start = _sysrand.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+        prime = _search_prime(bits, start, SIEVE_WINDOW)
+        if prime is not None:
+            return prime
+
+
+def gen_safe_prime(bits: int = 1024, workers: int = 1) -> int:
+    """
+    Function for generating a random safe prime p = 2q + 1 (q is prime) with the given number of bits.
+
+    Candidates for q and p are sieved together: the number p = 2q + 1 is divisible by a small
+    prime s if q = (s - 1) / 2 (mod s). Only candidates for which p passes the Fermat test to
+    base 2 are checked by the Miller-Rabin test.
+
+    bits
+        Number of bits of the prime p (the most significant bit is always set).
+    workers
+        Number of processes searching for the prime at the same time. The parallel search
+        is used only for primes of at least PARALLEL_MIN_BITS bits.
+    """
+    _check_bits(bits, 3)
+
+    if bits <= SMALL_PRIMES_BOUND.bit_length() - 1:
+        return _sysrand.choice([p for p in SMALL_PRIMES if p.bit_length() == bits and is_safe_prime(p)])
+
+    if workers > 1 and bits >= PARALLEL_MIN_BITS:
+        return _search_parallel(_search_safe_prime, bits, bits - 1, PARALLEL_SAFE_BATCH, 1, workers)[0]
+
+    while True:
+        start = _sysrand.getrandbits(bits - 1) | (1 << (bits - 2)) | 1
+
+        prime = _search_safe_prime(bits, start, SIEVE_WINDOW)
+        if prime is not None:
+            return prime
@@ -1 +1,11 @@
-from .rc4 import RC4
+# The classes are imported on first access (see app.crypto.utils.lazy_import).
+from app.crypto.utils import lazy_import
+
+_ATTRIBUTES = {
+    "RC4": ".rc4",
+    "RC4Checkpoints": ".rc4"
+}
+
+__all__ = tuple(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
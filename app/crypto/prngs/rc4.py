@@ -1,5 +1,29 @@
 # This module contains an implementation of a pseudo-random number generator
 # based on the RC4 stream encryption algorithm
+#
+# The state of RC4 (i, j, S) only moves forward, so to get the keystream at an offset
+# all the bytes before it have to be generated. RC4Checkpoints stores the states at
+# every N bytes of the keystream, so the generator can jump to the nearest checkpoint
+# and generate at most N bytes to reach any offset.
+import struct
+from typing import NamedTuple
+
+from app.crypto.stream import StreamContext
+
+# Size of the piece of the keystream generated at a time when skipping bytes.
+_SKIP_CHUNK_SIZE = 1 << 16
+
+# Default distance between the checkpoints in bytes. A checkpoint takes 258 bytes,
+# so the checkpoints take about 0.1% of the size of the data.
+CHECKPOINT_INTERVAL = 1 << 18
+
+
+class RC4State(NamedTuple):
+    """State of the RC4 generator with 8-bit numbers."""
+    i: int
+    j: int
+    s: bytes
+
 
 class RC4:
     def __init__(self, iv: str, n: int = 8):
@@ -22,26 +46,37 @@ class RC4:
             raise ValueError("Error iv value! (must be hex)")
 
         self.n = n
+        self._module = 2 ** n
         self.s = []
         self.i = 0
         self.j = 0
+        self.position = 0
         self._ksa()
+        self._initial_s = bytes(self.s) if n == 8 else None
 
     def _ksa(self):
         """S-box initialization."""
         len_iv = len(self.iv)
-        module = 2 ** self.n
+        module = self._module
 
-        self.s = list(range(module))
+        # With 8-bit numbers the S-box is a bytearray: it is smaller and faster to index.
+        self.s = bytearray(range(module)) if self.n == 8 else list(range(module))
 
         j = 0
         for i in range(256):
             j = (j + self.s[i] + self.iv[i % len_iv]) % module
             self.s[i], self.s[j] = self.s[j], self.s[i]
 
+    def _reset(self) -> None:
+        """Method for resetting the generator to the beginning of the sequence."""
+        self.i = 0
+        self.j = 0
+        self.position = 0
+        self._ksa()
+
     def _prga(self):
         """Pseudo-random word generation K."""
-        module = 2 ** self.n
+        module = self._module
         i, j = self.i, self.j
 
         i = (i + 1) % module
@@ -49,12 +84,250 @@ class RC4:
 
         self.i, self.j = i, j
         self.s[i], self.s[j] = self.s[j], self.s[i]
+        self.position += 1
 
         t = (self.s[i] + self.s[j]) % module
         return self.s[t]
 
+    def _check_bytes(self) -> None:
+        """Method for checking that the generated numbers are bytes (needed by the bulk methods)."""
+        if self.n != 8:
+            raise ValueError("The keystream of bytes can only be generated with 8-bit numbers!")
+
+    def readinto(self, buffer) -> int:
+        """
+        Method for filling a writable buffer (bytearray, memoryview, ...) with the next bytes of the sequence.
+
+        The generation is performed in one loop with local variables, which is much faster
+        than getting the numbers one by one with next.
+
+        Returns:
+            Number of bytes written.
+        """
+        self._check_bytes()
+
+        out = memoryview(buffer).cast("B")
+        s = self.s
+        i, j = self.i, self.j
+
+        for k in range(len(out)):
+            i = (i + 1) & 0xFF
+            si = s[i]
+            j = (j + si) & 0xFF
+            sj = s[j]
+            s[i] = sj
+            s[j] = si
+            out[k] = s[(si + sj) & 0xFF]
+
+        self.i, self.j = i, j
+        self.position += len(out)
+        return len(out)
+
+    def keystream(self, nbytes: int) -> bytes:
+        """Method for getting the next nbytes bytes of the sequence."""
+        buffer = bytearray(nbytes)
+        self.readinto(buffer)
+        return bytes(buffer)
+
+    def xor_into(self, buffer) -> int:
+        """
+        Method for XORing the next bytes of the sequence into a writable buffer in place
+        (encryption/decryption by the RC4 stream cipher).
+
+        Returns:
+            Number of bytes processed.
+        """
+        self._check_bytes()
+
+        out = memoryview(buffer).cast("B")
+        s = self.s
+        i, j = self.i, self.j
+
+        for k in range(len(out)):
+            i = (i + 1) & 0xFF
+            si = s[i]
+            j = (j + si) & 0xFF
+            sj = s[j]
+            s[i] = sj
+            s[j] = si
+            out[k] ^= s[(si + sj) & 0xFF]
+
+        self.i, self.j = i, j
+        self.position += len(out)
+        return len(out)
+
+    def get_state(self) -> RC4State:
+        """Method for getting the current state of the generator (8-bit numbers only)."""
+        self._check_bytes()
+        return RC4State(self.i, self.j, bytes(self.s))
+
+    def set_state(self, state: RC4State, position: int) -> None:
+        """Method for setting the state of the generator corresponding to the given position in the sequence."""
+        self._check_bytes()
+
+        if len(state.s) != 256:
+            raise ValueError("The S-box must contain 256 bytes!")
+
+        self.i, self.j, self.s = state.i, state.j, bytearray(state.s)
+        self.position = position
+
+    def seek(self, offset: int, checkpoints: "RC4Checkpoints" = None) -> None:
+        """
+        Method for moving to the given position in the sequence (8-bit numbers only).
+
+        The generator moves forward from the current position, or from the beginning if
+        the offset is behind it. With checkpoints, it starts from the nearest checkpoint
+        instead, if that is closer, so at most checkpoints.interval bytes are generated.
+
+        Args:
+            offset: position in the sequence (number of bytes from the beginning).
+            checkpoints: checkpoints of the sequence created with the same IV.
+        """
+        self._check_bytes()
+
+        if offset < 0:
+            raise ValueError("The offset must be non-negative!")
+
+        if offset < self.position:
+            self._reset()
+
+        if checkpoints is not None:
+            if checkpoints.nearest(0)[1] != RC4State(0, 0, self._initial_s):
+                raise ValueError("The checkpoints were created with another IV!")
+
+            position, state = checkpoints.nearest(offset)
+            if position > self.position:
+                self.set_state(state, position)
+
+        buffer = bytearray(min(offset - self.position, _SKIP_CHUNK_SIZE))
+        while self.position < offset:
+            self.readinto(memoryview(buffer)[:offset - self.position])
+
+    def _stream_context(self) -> StreamContext:
+        """Method for creating an incremental encryptor/decryptor. Encryption and decryption are the same."""
+        self._check_bytes()
+        self._reset()
+
+        def process(data: bytes) -> bytes:
+            data_bytes = bytearray(data)
+            self.xor_into(data_bytes)
+            return bytes(data_bytes)
+
+        return StreamContext(process)
+
+    def encryptor(self) -> StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size by the RC4 stream cipher.
+
+        The data is XORed with the sequence of the generator. The generator is reset
+        when the object is created, so only one encryptor/decryptor can be used at a time.
+        """
+        return self._stream_context()
+
+    def decryptor(self) -> StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size by the RC4 stream cipher.
+
+        The data is XORed with the sequence of the generator. The generator is reset
+        when the object is created, so only one encryptor/decryptor can be used at a time.
+        """
+        return self._stream_context()
+
     def __iter__(self):
         return self
 
     def __next__(self):
         return self._prga()
+
+
+class RC4Checkpoints:
+    MAGIC = b"RC4C"
+    VERSION = 1
+
+    # Header of the file: magic, version, interval between the checkpoints, number of checkpoints.
+    _HEADER = struct.Struct("<4sBQI")
+    # Checkpoint: i, j, S-box.
+    _STATE = struct.Struct("<BB256s")
+
+    def __init__(self, interval: int, states: list[RC4State]) -> None:
+        """
+        Checkpoints of the RC4 keystream: the states of the generator at the positions
+        0, interval, 2 * interval, ... (the first one is the state after initialization).
+
+        The keystream can be generated from any state, so the checkpoints must be kept
+        as secret as the IV.
+
+        Args:
+            interval: distance between the checkpoints in bytes.
+            states: states of the generator at the checkpoints.
+        """
+        if interval < 1:
+            raise ValueError("The interval must be positive!")
+
+        if not states:
+            raise ValueError("There must be at least one checkpoint!")
+
+        self._interval = interval
+        self._states = list(states)
+
+    @property
+    def interval(self) -> int:
+        """Distance between the checkpoints in bytes."""
+        return self._interval
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @staticmethod
+    def build(rc4: RC4, size: int, interval: int = CHECKPOINT_INTERVAL) -> "RC4Checkpoints":
+        """
+        Method for creating the checkpoints of the keystream of the given size.
+
+        The keystream is generated from the beginning (the generator is reset), so it
+        takes as long as encrypting the data of this size.
+        """
+        if interval < 1:
+            raise ValueError("The interval must be positive!")
+
+        rc4._reset()
+        states = [rc4.get_state()]
+
+        buffer = bytearray(min(interval, size))
+        while rc4.position + interval <= size:
+            rc4.readinto(buffer)
+            states.append(rc4.get_state())
+
+        return RC4Checkpoints(interval, states)
+
+    def nearest(self, offset: int) -> tuple[int, RC4State]:
+        """Method for getting the nearest checkpoint at or before the offset. Returns the pair (position, state)."""
+        index = min(offset // self._interval, len(self._states) - 1)
+        return index * self._interval, self._states[index]
+
+    def save(self, path: str) -> None:
+        """Method for saving the checkpoints to a file."""
+        with open(path, "wb") as f_out:
+            f_out.write(self._HEADER.pack(self.MAGIC, self.VERSION, self._interval, len(self._states)))
+            for state in self._states:
+                f_out.write(self._STATE.pack(*state))
+
+    @staticmethod
+    def load(path: str) -> "RC4Checkpoints":
+        """Method for loading the checkpoints from a file."""
+        with open(path, "rb") as f_in:
+            data = f_in.read()
+
+        header_size, state_size = RC4Checkpoints._HEADER.size, RC4Checkpoints._STATE.size
+        if len(data) < header_size:
+            raise ValueError("The file is not a file of RC4 checkpoints!")
+
+        magic, version, interval, count = RC4Checkpoints._HEADER.unpack_from(data)
+        if magic != RC4Checkpoints.MAGIC or version != RC4Checkpoints.VERSION:
+            raise ValueError("The file is not a file of RC4 checkpoints!")
+
+        if len(data) != header_size + count * state_size:
+            raise ValueError("The file of RC4 checkpoints is damaged!")
+
+        states = [RC4State(*RC4Checkpoints._STATE.unpack_from(data, header_size + k * state_size))
+                  for k in range(count)]
+        return RC4Checkpoints(interval, states)
@@ -1,2 +1,11 @@
-from .diffie_hellman import DiffieHellman
-from .shamir import Shamir
+# The classes are imported on first access (see app.crypto.utils.lazy_import).
+from app.crypto.utils import lazy_import
+
+_ATTRIBUTES = {
+    "DiffieHellman": ".diffie_hellman",
+    "Shamir": ".shamir"
+}
+
+__all__ = tuple(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -2,10 +2,10 @@
 from dataclasses import dataclass
 from random import randrange
 
-from sympy import isprime
-
-from app.crypto.utils import gen_prime
-from app.crypto.mathlib import fpow
+from app.crypto.group_pool import GroupPool
+from app.crypto.groups import gen_group
+from app.crypto.fixed_base import fixed_base
+from app.crypto.mathlib import ModContext
 
 
 class DiffieHellman:
@@ -49,6 +49,7 @@ class DiffieHellman:
         self._private_key = private_key
         self._public_key = public_key
         self._shared_private_key = None
+        self._ctx = ModContext(shared_keys.p)
 
     @property
     def public_key(self) -> PublicKey:
@@ -66,28 +67,22 @@ class DiffieHellman:
         return self._shared_private_key
 
     @staticmethod
-    def gen_shared_keys(n: int = 1024) -> SharedKeys:
+    def gen_shared_keys(n: int = 1024, pool: GroupPool = None, workers: int = 1) -> SharedKeys:
         """Method for generating shared keys.
 
         n
             Number of bits of a prime number P.
+        pool
+            Pool of precomputed groups. If it is set, the group is taken from the pool
+            (instantly, if the pool has a ready group of the given size).
+        workers
+            Number of processes searching for the prime number P, if it is generated.
 
         Returns
             Shared keys that have type DiffieHellman.SharedKeys.
         """
-        while True:
-            p = gen_prime(n)
-            q = (p-1) >> 1
-            if isprime(q):
-                break
-
-        g = 2
-        for i in range(2, p-1):
-            if fpow(i, q, p) != 1:
-                g = i
-                break
-
-        return DiffieHellman.SharedKeys(g, p)
+        group = pool.get(n, workers) if pool is not None else gen_group(n, workers)
+        return DiffieHellman.SharedKeys(group.g, group.p)
 
     @staticmethod
     def gen_keys(shared_keys: SharedKeys) -> tuple[PrivateKey, PublicKey]:
@@ -101,16 +96,17 @@ class DiffieHellman:
             Tuple of two elements - private and public keys.
         """
         private_key = randrange(2, shared_keys.p)
-        public_key = fpow(shared_keys.g, private_key, shared_keys.p)
+        # The base G is the same for all users, so the exponentiation is performed by the precomputed table.
+        public_key = fixed_base(shared_keys.g, shared_keys.p).pow(private_key)
         df = DiffieHellman
         return df.PrivateKey(private_key), df.PublicKey(public_key)
 
     def create_shared_private_key(self, other_public_key: PublicKey) -> None:
         """Method for creating and setting a user's private public key."""
-        k = fpow(other_public_key.k, self._private_key.k, self._shared_keys.p)
+        k = self._ctx.pow(other_public_key.k, self._private_key.k)
         self._shared_private_key = DiffieHellman.SharedPrivateKey(k)
 
     def create_intermediate_key(self, other_intermediate_key: PublicKey) -> PublicKey:
         """Method for generating an intermediate key needed by other users."""
-        k = fpow(other_intermediate_key.k, self._private_key.k, self._shared_keys.p)
+        k = self._ctx.pow(other_intermediate_key.k, self._private_key.k)
         return DiffieHellman.PublicKey(k)
@@ -2,7 +2,7 @@
 from secrets import SystemRandom
 from dataclasses import dataclass
 
-from app.crypto.mathlib import ext_gcd, fpow
+from app.crypto.mathlib import ext_gcd, ModContext
 
 
 class Shamir:
@@ -29,14 +29,16 @@ class Shamir:
 
         self._private_key = private_key
         self._public_key = public_key
+        self._public_ctx = ModContext(public_key.p)
+        self._private_ctx = ModContext(private_key.p)
 
     def encrypt(self, data: int) -> int:
         """Method for encrypting data with a public key."""
-        return fpow(data, self._public_key.k, self._public_key.p)
+        return self._public_ctx.pow(data, self._public_key.k)
 
     def decrypt(self, data: int) -> int:
         """Method for decrypting data with a private key"""
-        return fpow(data, self._private_key.k, self._private_key.p)
+        return self._private_ctx.pow(data, self._private_key.k)
 
     @property
     def public_key(self) -> PublicKey:
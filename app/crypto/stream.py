@@ -0,0 +1,123 @@
+# This module contains the implementation of the incremental (streaming) interface
+# of the ciphers: data is passed in chunks of any size, and partial blocks are
+# buffered internally, so arbitrarily large streams are processed with constant memory.
+from typing import Callable
+
+from app.crypto.common import EncProc
+
+
+def pad(data: bytes, block_size: int) -> bytes:
+    """
+    Function for padding data to a multiple of the block size (ISO/IEC 7816-4).
+
+    The byte 0x80 is appended to the data, followed by zeros up to the block boundary.
+    Padding is always added, so data that is a multiple of the block size gets a whole block.
+    """
+    return data + b"\x80" + b"\00" * (block_size - 1 - len(data) % block_size)
+
+
+def unpad(data: bytes) -> bytes:
+    """Function for removing padding (ISO/IEC 7816-4)."""
+    stripped_data = data.rstrip(b"\00")
+
+    if not stripped_data.endswith(b"\x80"):
+        raise ValueError("Invalid padding! (Check key and encryption mode)")
+
+    return stripped_data[:-1]
+
+
+class StreamContext:
+    def __init__(self, process: Callable[[bytes], bytes], final: Callable[[bytes], bytes] = None,
+                 block_size: int = 1, hold_last: bool = False) -> None:
+        """
+        Incremental encryptor/decryptor. Data is passed with the update method, the
+        processed data is returned immediately for all complete blocks. The rest
+        of the data is processed by the finalize method.
+
+        Args:
+            process: function for processing data whose length is a multiple of the block size.
+            final: function for processing the remaining data (less than a block, or exactly
+                one block if hold_last is set) when finalizing. By default, the remaining
+                data is processed by the process function.
+            block_size: block size in bytes.
+            hold_last: flag indicating whether to keep the last complete block until
+                finalizing (needed to remove the padding when decrypting).
+        """
+        self._process = process
+        self._final = final or process
+        self._block_size = block_size
+        self._hold_last = hold_last
+        self._buffer = b""
+        self._finalized = False
+
+    def update(self, data: bytes) -> bytes:
+        """Method for processing the next chunk of data. Returns the processed data."""
+        if self._finalized:
+            raise ValueError("The context has already been finalized!")
+
+        if self._buffer:
+            data = self._buffer + data
+
+        rest = len(data) % self._block_size
+        if self._hold_last and rest == 0:
+            rest = min(self._block_size, len(data))
+
+        if rest:
+            self._buffer = bytes(data[len(data) - rest:])
+            data = bytes(data[:len(data) - rest])
+        else:
+            self._buffer = b""
+
+        return self._process(data) if data else b""
+
+    def finalize(self) -> bytes:
+        """Method for completing the processing. Returns the rest of the processed data."""
+        if self._finalized:
+            raise ValueError("The context has already been finalized!")
+
+        self._finalized = True
+        return self._final(self._buffer)
+
+
+def blockwise(process_block: Callable[[bytes], bytes], block_size: int) -> Callable[[bytes], bytes]:
+    """
+    Function for getting a function that processes data block by block.
+
+    Args:
+        process_block: function for processing one block of data.
+        block_size: block size in bytes.
+    """
+    def process(data: bytes) -> bytes:
+        view = memoryview(data)
+        return b"".join(process_block(bytes(view[pos:pos + block_size])) for pos in range(0, len(data), block_size))
+
+    return process
+
+
+def padded_context(process: Callable[[bytes], bytes], block_size: int, enc_proc: EncProc) -> StreamContext:
+    """
+    Function for creating a context of a cipher that requires padding.
+
+    When encrypting, the rest of the data is padded when finalizing. When decrypting, the
+    last block is kept until finalizing, and then the padding is removed from it.
+
+    Args:
+        process: function for processing data whose length is a multiple of the block size.
+        block_size: size of the input block in bytes.
+        enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+    """
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            return StreamContext(process, lambda rest: process(pad(rest, block_size)), block_size)
+
+        case EncProc.DECRYPT:
+            def final(rest: bytes) -> bytes:
+                if len(rest) != block_size:
+                    raise ValueError("The length of the encrypted data must be a multiple of the block size!")
+
+                return unpad(process(rest))
+
+            return StreamContext(process, final, block_size, hold_last=True)
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
@@ -1,15 +1,24 @@
-from .alberti_disc import Alberti
-from .atbash import Atbash
-from .caesar import Caesar
-from .cardan_grille import CarganGrille
-from .des import DES
-from .gost import GOST
-from .gronsfeld import Gronsfeld
-from .hill import Hill
-from .playfair import Playfair
-from .polybius_square import PolybiusSquare
-from .richelieu import Richelieu
-from .scytale import Scytale
-from .vernam import Vernam
-from .vigenere import Vigenere
-from .xor import XOR
+# The classes are imported on first access (see app.crypto.utils.lazy_import).
+from app.crypto.utils import lazy_import
+
+_ATTRIBUTES = {
+    "Alberti": ".alberti_disc",
+    "Atbash": ".atbash",
+    "Caesar": ".caesar",
+    "CarganGrille": ".cardan_grille",
+    "DES": ".des",
+    "GOST": ".gost",
+    "Gronsfeld": ".gronsfeld",
+    "Hill": ".hill",
+    "Playfair": ".playfair",
+    "PolybiusSquare": ".polybius_square",
+    "Richelieu": ".richelieu",
+    "Scytale": ".scytale",
+    "Vernam": ".vernam",
+    "Vigenere": ".vigenere",
+    "XOR": ".xor"
+}
+
+__all__ = tuple(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -0,0 +1,143 @@
+# This module contains the implementation of the encryption modes of 64-bit
+# block ciphers (DES, GOST 28147-89).
+#
+# Each mode receives the block transformation function of the cipher. The output
+# is written to a preallocated buffer, so the processing time grows linearly
+# with the size of the data.
+import struct
+from typing import Callable, Iterator
+
+from app.crypto.common import EncProc
+
+# Block size in bytes
+BLOCK_SIZE = 8
+
+# Minimum size of data in bytes for which the vectorized engine is used
+# (in the modes where it is possible). Below it, the scalar engine is faster.
+VECTORIZED_MIN_SIZE = 2048
+
+_BLOCK = struct.Struct("<Q")
+
+Transform = Callable[[int, EncProc], int]
+
+
+def align(data: bytes) -> bytes:
+    """Function for padding data with zeros to a multiple of the block size."""
+    if k := len(data) % BLOCK_SIZE:
+        data = bytes(data) + b"\00" * (BLOCK_SIZE - k)
+
+    return data
+
+
+def _iter_blocks(data: bytes) -> Iterator[int]:
+    """Function for iterating over the blocks of data converted to numbers (little endian)."""
+    return (block for block, in _BLOCK.iter_unpack(memoryview(align(data))))
+
+
+def _alloc_output(data: bytes) -> tuple[bytearray, memoryview]:
+    """Function for allocating the output buffer for the processed data."""
+    buffer = bytearray(-(-len(data) // BLOCK_SIZE) * BLOCK_SIZE)
+    return buffer, memoryview(buffer)
+
+
+def ecb(transform: Transform, data: bytes, enc_proc: EncProc) -> bytes:
+    """Function for processing data in ECB mode"""
+    buffer, view = _alloc_output(data)
+    pack_into = _BLOCK.pack_into
+
+    for pos, block in enumerate(_iter_blocks(data)):
+        pack_into(view, pos * BLOCK_SIZE, transform(block, enc_proc))
+
+    return bytes(buffer)
+
+
+def cbc(transform: Transform, data: bytes, enc_proc: EncProc, vector: int) -> tuple[bytes, int]:
+    """
+    Function for processing data in CBC mode.
+
+    Returns the processed data and the new value of the vector.
+    """
+    buffer, view = _alloc_output(data)
+    pack_into = _BLOCK.pack_into
+
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            for pos, block in enumerate(_iter_blocks(data)):
+                vector = transform(block ^ vector, EncProc.ENCRYPT)
+                pack_into(view, pos * BLOCK_SIZE, vector)
+
+        case EncProc.DECRYPT:
+            for pos, block in enumerate(_iter_blocks(data)):
+                pack_into(view, pos * BLOCK_SIZE, transform(block, EncProc.DECRYPT) ^ vector)
+                vector = block
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    return bytes(buffer), vector
+
+
+def cfb(transform: Transform, data: bytes, enc_proc: EncProc, vector: int) -> tuple[bytes, int]:
+    """
+    Function for processing data in CFB mode.
+
+    Returns the processed data and the new value of the vector.
+    """
+    buffer, view = _alloc_output(data)
+    pack_into = _BLOCK.pack_into
+
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            for pos, block in enumerate(_iter_blocks(data)):
+                vector = transform(vector, EncProc.ENCRYPT) ^ block
+                pack_into(view, pos * BLOCK_SIZE, vector)
+
+        case EncProc.DECRYPT:
+            for pos, block in enumerate(_iter_blocks(data)):
+                pack_into(view, pos * BLOCK_SIZE, transform(vector, EncProc.ENCRYPT) ^ block)
+                vector = block
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    return bytes(buffer), vector
+
+
+def ofb(transform: Transform, data: bytes, enc_proc: EncProc, vector: int) -> tuple[bytes, int]:
+    """
+    Function for processing data in OFB mode. Encryption and decryption are the same.
+
+    Returns the processed data and the new value of the vector.
+    """
+    if enc_proc not in (EncProc.ENCRYPT, EncProc.DECRYPT):
+        raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    buffer, view = _alloc_output(data)
+    pack_into = _BLOCK.pack_into
+
+    for pos, block in enumerate(_iter_blocks(data)):
+        vector = transform(vector, EncProc.ENCRYPT)
+        pack_into(view, pos * BLOCK_SIZE, vector ^ block)
+
+    return bytes(buffer), vector
+
+
+def ctr(transform: Transform, data: bytes, counter_block: Callable[[int], int]) -> bytes:
+    """
+    Function for processing data in counter mode. Encryption and decryption are the same.
+
+    Args:
+        transform: block transformation of the cipher.
+        data: bytes to be processed. The length does not have to be a multiple of the block size.
+        counter_block: function returning the counter block for the given block index.
+
+    Returns:
+        Processed bytes, the length is equal to the length of the input data.
+    """
+    buffer, view = _alloc_output(data)
+    pack_into = _BLOCK.pack_into
+
+    for pos, block in enumerate(_iter_blocks(data)):
+        pack_into(view, pos * BLOCK_SIZE, transform(counter_block(pos), EncProc.ENCRYPT) ^ block)
+
+    return bytes(buffer[:len(data)])
@@ -1,7 +1,9 @@
 # This module contains the implementation of the cipher "Caesar's cipher"
-from ..utils import get_alphabet_by_letter
-from ..const import ALPHABET_TABLE
 from ..common import EncProc
+from .translation import (
+    shift_table,
+    translate
+)
 
 
 class Caesar:
@@ -21,6 +23,8 @@ class Caesar:
         """
         Data encryption/decryption method.
 
+        The letters are replaced by the translation table of the shift (see app.crypto.symmetric.translation).
+
         Args:
             text: the string to be encrypted or decrypted.
             enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
@@ -31,44 +35,22 @@ class Caesar:
         if not text:
             return ""
 
-        text_list: list[str] = list(text)
-
-        for i in range(len(text)):
-            letter_text = text_list[i]
-
-            # For each letter of the text, we look for the corresponding alphabet.
-            # If there is none, we skip the iteration, skipping the given letter.
-            if (lang_alphabet := get_alphabet_by_letter(letter_text, ALPHABET_TABLE)) is None:
-                continue
-
-            _, alphabet = lang_alphabet
-
-            # Set the sign for encryption
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    # The sign is positive, the shift value will be added
-                    # to the character index
-                    sign = 1
-
-                case EncProc.DECRYPT:
-                    # The sign is negative, the shift value will be subtracted
-                    # from the character index
-                    sign = -1
-
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
-
-            # We get the index of the current letter and calculate the new index.
-            letter_text_index = alphabet.index(letter_text.lower())
-            new_letter_text_index = (letter_text_index + self.shift * sign) % len(alphabet)
-            new_letter_text = alphabet[new_letter_text_index]
+        # Set the sign for encryption
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                # The sign is positive, the shift value will be added
+                # to the character index
+                sign = 1
 
-            if letter_text.isupper():
-                new_letter_text = new_letter_text.upper()
+            case EncProc.DECRYPT:
+                # The sign is negative, the shift value will be subtracted
+                # from the character index
+                sign = -1
 
-            text_list[i] = new_letter_text
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
 
-        return "".join(text_list)
+        return translate(text, shift_table(self.shift * sign))
 
     def encrypt(self, text: str) -> str:
         """
@@ -1,4 +1,5 @@
 # This module contains the implementation of the cipher "DES"
+from functools import partial
 from enum import (
     Enum,
     auto
@@ -11,6 +12,76 @@ from app.crypto.const import (
     DES_S_TABLE, DES_SHIFT_TABLE
 )
 from app.crypto.common import EncProc
+from app.crypto import (
+    parallel,
+    stream
+)
+from app.crypto.symmetric import block_modes
+
+
+def _gen_permutation_tables(table: tuple, bit_len: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Function for generating byte-indexed tables of a bit permutation.
+
+    The permutation is linear with respect to OR, so the result of the permutation
+    of a number is equal to the OR of the results for each of its bytes. Table K
+    contains the permutation result for each value of the K-th byte (little endian).
+    """
+    out_len = len(table)
+
+    # Output bits produced by each input bit (numbering from the least significant bit).
+    masks = [0] * (bit_len + 7 & ~7)
+    for j, pos in enumerate(table):
+        masks[bit_len - pos] |= 1 << (out_len - 1 - j)
+
+    tables = []
+    for k in range(0, bit_len, 8):
+        row = [0] * 256
+        for v in range(1, 256):
+            low_bit = v & -v
+            row[v] = row[v ^ low_bit] | masks[k + low_bit.bit_length() - 1]
+
+        tables.append(tuple(row))
+
+    return tuple(tables)
+
+
+def _apply_permutation_tables(value: int, tables: tuple[tuple[int, ...], ...]) -> int:
+    """Function for performing a bit permutation using byte-indexed tables."""
+    result = 0
+    for k, table in enumerate(tables):
+        result |= table[(value >> (8 * k)) & 0xFF]
+
+    return result
+
+
+def _gen_sp_tables() -> tuple[tuple[int, ...], ...]:
+    """
+    Function for generating combined S-box and P-permutation tables.
+
+    Table K contains the result of the P-permutation of the output of the S-box
+    for each value of the K-th 6-bit chunk of the expanded block.
+    """
+    p_tables = _gen_permutation_tables(DES_P_TABLE, 48)
+
+    tables = []
+    for k in range(8):
+        row = []
+        for b in range(64):
+            i = ((b >> 5) << 1) | (b & 0b1)
+            j = (b >> 1) & 0b1111
+            row.append(_apply_permutation_tables(DES_S_TABLE[7 - k][i][j] << (6 * k), p_tables))
+
+        tables.append(tuple(row))
+
+    return tuple(tables)
+
+
+# Precomputed tables for the table-driven engine.
+_IP_TABLES = _gen_permutation_tables(DES_IP_TABLE, 64)
+_IP_INV_TABLES = _gen_permutation_tables(DES_IP_INV_TABLE, 64)
+_E_TABLES = _gen_permutation_tables(DES_E_TABLE, 32)
+_SP_TABLES = _gen_sp_tables()
 
 
 class DES:
@@ -20,6 +91,7 @@ class DES:
         CBC = auto()
         CFB = auto()
         OFB = auto()
+        CTR = auto()
 
         @staticmethod
         def from_str(value: str):
@@ -36,13 +108,34 @@ class DES:
                 case "OFB":
                     return DES.EncMode.OFB
 
+                case "CTR":
+                    return DES.EncMode.CTR
+
                 case _:
                     raise NotImplementedError
 
-    def __init__(self, key: str, iv: str = None, enc_mode: EncMode = EncMode.ECB, reset_iv: bool = True) -> None:
+    class Backend(Enum):
+        """Implementations of the DES block transformation."""
+        REFERENCE = auto()
+        TABLE = auto()
+
+        @staticmethod
+        def from_str(value: str):
+            match value.lower():
+                case "reference":
+                    return DES.Backend.REFERENCE
+
+                case "table":
+                    return DES.Backend.TABLE
+
+                case _:
+                    raise NotImplementedError
+
+    def __init__(self, key: str, iv: str = None, enc_mode: EncMode = EncMode.ECB, reset_iv: bool = True,
+                 backend: Backend = Backend.TABLE, workers: int = 1) -> None:
         """
         Implementation of the "DES" symmetric encryption algorithm. The following 
-        encryption modes are available: ECB, CBC, CFB, OFB.
+        encryption modes are available: ECB, CBC, CFB, OFB, CTR.
 
         Args:
             key: a string representing the 16th number. The key consists of 7 bytes,
@@ -54,10 +147,17 @@ class DES:
                 are not met, an ValueError exception will be raised.
 
             enc_mode: encryption mode, for this cipher there are several
-                modes: ECB, CBC, CFB, OFB.
+                modes: ECB, CBC, CFB, OFB, CTR.
 
             reset_iv: parameter indicating whether to reset the initialization vector
                 before encrypting/decrypting the input data.
+
+            backend: implementation of the block transformation. The reference backend
+                follows the standard step by step, the table backend uses precomputed
+                permutation and SP tables. Both give the same result.
+
+            workers: number of processes used to process large data in the modes
+                where the blocks are independent (ECB, CTR, and CBC, CFB when decrypting).
         """
         if len(key) != 14:
             raise ValueError(f"Key length must be 56 bits (7 bytes)! ({len(key) // 2} bytes entered)")
@@ -67,6 +167,9 @@ class DES:
         except ValueError:
             raise ValueError("The entered key is not a hexadecimal value!")
 
+        # The initialization vector is not used in ECB mode.
+        self.iv = self.vector = None
+
         if iv:
             if len(iv) != 16:
                 raise ValueError(f"IV length must be 64 bits (8 bytes)! ({len(iv) // 2} bytes entered)")
@@ -76,24 +179,42 @@ class DES:
             except ValueError:
                 raise ValueError("The entered IV is not a hexadecimal value!")
 
-            self.vector = self.iv
-
         if iv is None and enc_mode is not DES.EncMode.ECB:
             raise TypeError(f"Encryption in '{enc_mode}' mode requires an initialization vector!")
 
         self._mode_fns = {DES.EncMode.ECB: self._ECB,
                           DES.EncMode.CBC: self._CBC,
                           DES.EncMode.CFB: self._CFB,
-                          DES.EncMode.OFB: self._OFB}
+                          DES.EncMode.OFB: self._OFB,
+                          DES.EncMode.CTR: self._CTR}
 
         if enc_mode not in self._mode_fns.keys():
             raise TypeError(f"Invalid encryption mode entered ({enc_mode})! "
                             f"Possible modes: {tuple(self._mode_fns.keys())}")
 
         self._mode_fn = self._mode_fns.get(enc_mode)
+        self._enc_mode = enc_mode
         self._reset_iv = reset_iv
 
+        self._transform_fns = {DES.Backend.REFERENCE: self._transform_reference,
+                               DES.Backend.TABLE: self._transform_table}
+
+        if backend not in self._transform_fns.keys():
+            raise TypeError(f"Invalid backend entered ({backend})! "
+                            f"Possible backends: {tuple(self._transform_fns.keys())}")
+
+        self._transform = self._transform_fns.get(backend)
+        self._backend = backend
+        self._workers = workers
+
         self.keys = self.generate_keys(self.key)
+        self._keys_reversed = tuple(reversed(self.keys))
+
+        self._reset_vector()
+
+    def _reset_vector(self) -> None:
+        """Method for setting the vector to the initial state."""
+        self.vector = self.iv
 
     def set_reset_iv_flag(self, flag: bool = False) -> None:
         """Method for setting the flag/clearing the flag by resetting the initialization vector."""
@@ -138,9 +259,9 @@ class DES:
         key = bin(key)[2:].zfill(bit_len)
         return int("".join(key[i - 1] for i in table), 2)
 
-    def _transform(self, block: int, enc_proc: EncProc) -> int:
+    def _transform_reference(self, block: int, enc_proc: EncProc) -> int:
         """
-        Data encryption/decryption method.
+        Data encryption/decryption method (reference implementation).
 
         Args:
             block: bytes converted to a number.
@@ -181,85 +302,213 @@ class DES:
 
         return self._permutation(new_chunk, 48, DES_P_TABLE)
 
+    def _transform_table(self, block: int, enc_proc: EncProc) -> int:
+        """
+        Data encryption/decryption method (table-driven implementation).
+
+        Gives the same result as the reference implementation. All permutations are
+        performed by byte-indexed tables, and the S-boxes are combined with the
+        P-permutation, so the Feistel function is reduced to 12 table lookups.
+
+        Args:
+            block: bytes converted to a number.
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+        Returns:
+            Encrypted/decrypted block as a number.
+        """
+        ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = _IP_TABLES
+        e0, e1, e2, e3 = _E_TABLES
+        s0, s1, s2, s3, s4, s5, s6, s7 = _SP_TABLES
+
+        block = (ip0[block & 0xFF] | ip1[(block >> 8) & 0xFF] | ip2[(block >> 16) & 0xFF] |
+                 ip3[(block >> 24) & 0xFF] | ip4[(block >> 32) & 0xFF] | ip5[(block >> 40) & 0xFF] |
+                 ip6[(block >> 48) & 0xFF] | ip7[block >> 56])
+
+        # Decryption is the same sequence of rounds with the reverse order of the keys
+        # applied to the swapped halves of the block.
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                x, y = block >> 32, block & 0xFFFFFFFF
+                keys = self.keys
+
+            case EncProc.DECRYPT:
+                x, y = block & 0xFFFFFFFF, block >> 32
+                keys = self._keys_reversed
+
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+        for key in keys:
+            t = (e0[y & 0xFF] | e1[(y >> 8) & 0xFF] | e2[(y >> 16) & 0xFF] | e3[y >> 24]) ^ key
+            x, y = y, x ^ (s0[t & 0x3F] | s1[(t >> 6) & 0x3F] | s2[(t >> 12) & 0x3F] |
+                           s3[(t >> 18) & 0x3F] | s4[(t >> 24) & 0x3F] | s5[(t >> 30) & 0x3F] |
+                           s6[(t >> 36) & 0x3F] | s7[t >> 42])
+
+        if enc_proc is EncProc.ENCRYPT:
+            block = (x << 32) | y
+        else:
+            block = (y << 32) | x
+
+        ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = _IP_INV_TABLES
+        return (ip0[block & 0xFF] | ip1[(block >> 8) & 0xFF] | ip2[(block >> 16) & 0xFF] |
+                ip3[(block >> 24) & 0xFF] | ip4[(block >> 32) & 0xFF] | ip5[(block >> 40) & 0xFF] |
+                ip6[(block >> 48) & 0xFF] | ip7[block >> 56])
+
+    def _transform_blocks(self, blocks, enc_proc: EncProc):
+        """
+        Vectorized data encryption/decryption method.
+
+        Args:
+            blocks: NumPy array of blocks (uint64).
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+        Returns:
+            Array of encrypted/decrypted blocks.
+        """
+        from app.crypto.symmetric import vectorized
+
+        return vectorized.des_transform(blocks, self.keys, enc_proc)
+
+    def _is_vectorized(self, data: bytes) -> bool:
+        """Method for checking whether to use the vectorized engine for the data."""
+        return self._backend is DES.Backend.TABLE and len(data) >= block_modes.VECTORIZED_MIN_SIZE
+
     def _ECB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in ECB mode"""
-        processed_data = bytes()
+        if parallel.is_worth_parallel(len(data), self._workers):
+            return parallel.map_chunks(partial(self._ecb_chunk, enc_proc=enc_proc),
+                                       data, self._workers, block_modes.BLOCK_SIZE)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
-            processed_block = self._transform(block, enc_proc)
-            processed_data += processed_block.to_bytes(8, "little")
+        return self._ecb_chunk(data, 0, enc_proc)
 
-        return processed_data
+    def _ecb_chunk(self, data: bytes, index: int, enc_proc: EncProc) -> bytes:
+        """
+        Method for processing a chunk of data in ECB mode.
+
+        Args:
+            data: chunk of data.
+            index: index of the first block of the chunk (not used in ECB mode).
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+        """
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
+
+            return vectorized.ecb(self._transform_blocks, data, enc_proc)
+
+        return block_modes.ecb(self._transform, data, enc_proc)
 
     def _CBC(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in CBC mode"""
-        processed_data = bytes()
+        if enc_proc is EncProc.DECRYPT:
+            return self._decrypt_chained(self._cbc_decrypt_chunk, data)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+        processed_data, self.vector = block_modes.cbc(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    processed_block = self._transform(block ^ self.vector, EncProc.ENCRYPT)
-                    self.vector = processed_block
+    def _cbc_decrypt_chunk(self, data: bytes, index: int) -> bytes:
+        """
+        Method for decrypting a chunk of data in CBC mode.
 
-                case EncProc.DECRYPT:
-                    processed_block = self._transform(block, EncProc.DECRYPT) ^ self.vector
-                    self.vector = block
+        Args:
+            data: chunk of data preceded by the previous ciphertext block (or the vector).
+            index: index of the first block of the chunk (not used).
+        """
+        vector = int.from_bytes(data[:block_modes.BLOCK_SIZE], "little")
+        data = memoryview(data)[block_modes.BLOCK_SIZE:]
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
 
-            processed_data += processed_block.to_bytes(8, "little")
+            return vectorized.cbc_decrypt(self._transform_blocks, data, vector)
 
-        return processed_data
+        return block_modes.cbc(self._transform, data, EncProc.DECRYPT, vector)[0]
 
     def _CFB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in CFB mode"""
-        processed_data = bytes()
+        if enc_proc is EncProc.DECRYPT:
+            return self._decrypt_chained(self._cfb_decrypt_chunk, data)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+        processed_data, self.vector = block_modes.cfb(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    processed_block = self._transform(self.vector, EncProc.ENCRYPT) ^ block
-                    self.vector = processed_block
+    def _cfb_decrypt_chunk(self, data: bytes, index: int) -> bytes:
+        """
+        Method for decrypting a chunk of data in CFB mode.
 
-                case EncProc.DECRYPT:
-                    processed_block = self._transform(self.vector, EncProc.ENCRYPT) ^ block
-                    self.vector = block
+        Args:
+            data: chunk of data preceded by the previous ciphertext block (or the vector).
+            index: index of the first block of the chunk (not used).
+        """
+        vector = int.from_bytes(data[:block_modes.BLOCK_SIZE], "little")
+        data = memoryview(data)[block_modes.BLOCK_SIZE:]
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
 
-            processed_data += processed_block.to_bytes(8, "little")
+            return vectorized.cfb_decrypt(self._transform_blocks, data, vector)
 
+        return block_modes.cfb(self._transform, data, EncProc.DECRYPT, vector)[0]
+
+    def _decrypt_chained(self, chunk_fn, data: bytes) -> bytes:
+        """
+        Method for decrypting data in the modes where each plaintext block depends only
+        on two ciphertext blocks (CBC, CFB).
+
+        The ciphertext is split into chunks, each of which is decrypted together with the
+        block preceding it, so the chunks are independent and can be decrypted in parallel.
+        The final value of the vector is the last ciphertext block, as in the serial mode.
+        """
+        data = self.vector.to_bytes(block_modes.BLOCK_SIZE, "little") + block_modes.align(data)
+
+        if parallel.is_worth_parallel(len(data), self._workers):
+            processed_data = parallel.map_chunks(chunk_fn, data, self._workers,
+                                                 block_modes.BLOCK_SIZE, block_modes.BLOCK_SIZE)
+        else:
+            processed_data = chunk_fn(data, 0)
+
+        self.vector = int.from_bytes(data[-block_modes.BLOCK_SIZE:], "little")
         return processed_data
 
     def _OFB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in OFB mode"""
-        processed_data = bytes()
+        processed_data, self.vector = block_modes.ofb(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+    def _CTR(self, data: bytes, enc_proc: EncProc) -> bytes:
+        """Method for processing data in CTR mode"""
+        if parallel.is_worth_parallel(len(data), self._workers):
+            processed_data = parallel.map_chunks(partial(self._ctr_chunk, vector=self.vector),
+                                                 data, self._workers, block_modes.BLOCK_SIZE)
+        else:
+            processed_data = self._ctr_chunk(data, 0, self.vector)
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    self.vector = self._transform(self.vector, EncProc.ENCRYPT)
-                    processed_block = self.vector ^ block
+        self.vector = self._counter_block(self.vector, -(-len(data) // block_modes.BLOCK_SIZE))
+        return processed_data
 
-                case EncProc.DECRYPT:
-                    self.vector = self._transform(self.vector, EncProc.ENCRYPT)
-                    processed_block = self.vector ^ block
+    def _ctr_chunk(self, data: bytes, index: int, vector: int) -> bytes:
+        """
+        Method for processing a chunk of data in CTR mode.
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        Args:
+            data: chunk of data.
+            index: index of the first block of the chunk.
+            vector: value of the counter for the first block of the data.
+        """
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
 
-            processed_data += processed_block.to_bytes(8, "little")
+            def counter_blocks(pos: int, count: int):
+                return vectorized.des_counter_blocks(self._counter_block(vector, index + pos), count)
 
-        return processed_data
+            return vectorized.ctr(self._transform_blocks, data, counter_blocks)
+
+        return block_modes.ctr(self._transform, data, lambda pos: self._counter_block(vector, index + pos))
+
+    @staticmethod
+    def _counter_block(vector: int, index: int) -> int:
+        """Method for getting the value of the counter for the block with the given index."""
+        return (vector + index) & 0xFFFF_FFFF_FFFF_FFFF
 
     def _data_processing(self, data: bytes or str, enc_proc: EncProc) -> str or bytes:
         """
@@ -298,7 +547,7 @@ class DES:
             data_bytes += b"\00" * (8 - k)
 
         if self._reset_iv:
-            self.vector = self.iv
+            self._reset_vector()
 
         processed_data = self._mode_fn(data_bytes, enc_proc).rstrip(b'\00')
 
@@ -349,6 +598,42 @@ class DES:
         """
         return self._data_processing(data, EncProc.DECRYPT)
 
+    def _stream_context(self, enc_proc: EncProc) -> stream.StreamContext:
+        """
+        Method for creating an incremental encryptor/decryptor.
+
+        In ECB and CBC modes the data is padded (ISO/IEC 7816-4), so the ciphertext is
+        longer than the plaintext by 1-8 bytes. In the other modes the cipher works as a
+        stream cipher and the length of the output is equal to the length of the input.
+        """
+        self._reset_vector()
+        process = partial(self._mode_fn, enc_proc=enc_proc)
+
+        if self._enc_mode in (DES.EncMode.ECB, DES.EncMode.CBC):
+            return stream.padded_context(process, block_modes.BLOCK_SIZE, enc_proc)
+
+        return stream.StreamContext(process, lambda rest: process(rest)[:len(rest)], block_modes.BLOCK_SIZE)
+
+    def encryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the rest of the
+        encrypted data is returned by the finalize method. The vector is reset when the
+        object is created, so only one encryptor/decryptor of the cipher can be used at a time.
+        """
+        return self._stream_context(EncProc.ENCRYPT)
+
+    def decryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the rest of the
+        decrypted data is returned by the finalize method. The vector is reset when the
+        object is created, so only one encryptor/decryptor of the cipher can be used at a time.
+        """
+        return self._stream_context(EncProc.DECRYPT)
+
     def make(self, data: bytes or str, enc_proc: EncProc = EncProc.ENCRYPT) -> str or bytes:
         """
         Method - interface for encrypting/decrypting input data.
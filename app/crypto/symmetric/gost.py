@@ -1,4 +1,5 @@
 # This module contains the implementation of the cipher "GOST 28147-89"
+from functools import partial
 from enum import (
     Enum,
     auto
@@ -7,9 +8,41 @@ from enum import (
 from app.crypto.const import (
     GOST_ENC_INDICES,
     GOST_DEC_INDICES,
-    GOST_SBLOCK
+    GOST_SBLOCK,
+    GOST_C1,
+    GOST_C2
 )
 from app.crypto.common import EncProc
+from app.crypto import (
+    parallel,
+    stream
+)
+from app.crypto.symmetric import block_modes
+
+
+def _gen_sbox_tables() -> tuple[tuple[int, ...], ...]:
+    """
+    Function for generating fused S-box tables.
+
+    Each table combines two adjacent 4-bit S-boxes into one 256-entry table indexed
+    by a byte of the input. The cyclic shift by 11 bits is already applied to the
+    values, so the Feistel function is reduced to four lookups.
+    """
+    tables = []
+    for k in range(4):
+        row = []
+        for v in range(256):
+            value = ((GOST_SBLOCK[7 - 2 * k][v & 0b1111] << (8 * k)) |
+                     (GOST_SBLOCK[6 - 2 * k][v >> 4] << (8 * k + 4)))
+            row.append(((value << 11) | (value >> 21)) & 0xFFFFFFFF)
+
+        tables.append(tuple(row))
+
+    return tuple(tables)
+
+
+# Precomputed tables for the table-driven engine.
+_SBOX_TABLES = _gen_sbox_tables()
 
 
 class GOST:
@@ -19,6 +52,7 @@ class GOST:
         CBC = auto()
         CFB = auto()
         OFB = auto()
+        CTR = auto()
 
         @staticmethod
         def from_str(value: str):
@@ -35,13 +69,34 @@ class GOST:
                 case "OFB":
                     return GOST.EncMode.OFB
 
+                case "CTR":
+                    return GOST.EncMode.CTR
+
+                case _:
+                    raise NotImplementedError
+
+    class Backend(Enum):
+        """Implementations of the GOST 28147-89 block transformation."""
+        REFERENCE = auto()
+        TABLE = auto()
+
+        @staticmethod
+        def from_str(value: str):
+            match value.lower():
+                case "reference":
+                    return GOST.Backend.REFERENCE
+
+                case "table":
+                    return GOST.Backend.TABLE
+
                 case _:
                     raise NotImplementedError
 
-    def __init__(self, key: str, iv: str = None, enc_mode: EncMode = EncMode.ECB, reset_iv: bool = True) -> None:
+    def __init__(self, key: str, iv: str = None, enc_mode: EncMode = EncMode.ECB, reset_iv: bool = True,
+                 backend: Backend = Backend.TABLE, workers: int = 1) -> None:
         """
         Implementation of the "GOST 28147-89" symmetric encryption algorithm. The following 
-        encryption modes are available: ECB, CBC, CFB, OFB.
+        encryption modes are available: ECB, CBC, CFB, OFB, CTR.
 
         Args:
             key: a string representing the 16th number. The key consists of 32 bytes,
@@ -53,10 +108,17 @@ class GOST:
                 are not met, an ValueError exception will be raised.
 
             enc_mode: encryption mode, for this cipher there are several
-                modes: ECB, CBC, CFB, OFB.
+                modes: ECB, CBC, CFB, OFB, CTR.
 
             reset_iv: parameter indicating whether to reset the initialization vector
                 before encrypting/decrypting the input data.
+
+            backend: implementation of the block transformation. The reference backend
+                performs eight 4-bit S-box lookups per round, the table backend uses four
+                fused 8-bit tables. Both give the same result.
+
+            workers: number of processes used to process large data in the modes
+                where the blocks are independent (ECB, CTR, and CBC, CFB when decrypting).
         """
         if len(key) != 64:
             raise ValueError(f"Key length must be 256 bits (32 bytes)! ({len(key) // 2} bytes entered)")
@@ -66,6 +128,9 @@ class GOST:
         except ValueError:
             raise ValueError("The entered key is not a hexadecimal value!")
 
+        # The initialization vector is not used in ECB mode.
+        self.iv = self.vector = None
+
         if iv:
             if len(iv) != 16:
                 raise ValueError(f"IV length must be 64 bits (8 bytes)! ({len(iv) // 2} bytes entered)")
@@ -75,8 +140,6 @@ class GOST:
             except ValueError:
                 raise ValueError("The entered IV is not a hexadecimal value!")
 
-            self.vector = self.iv
-
         if iv is None and enc_mode is not GOST.EncMode.ECB:
             raise TypeError(f"Encryption in '{enc_mode}' mode requires an initialization vector!")
 
@@ -86,22 +149,45 @@ class GOST:
         self._mode_fns = {GOST.EncMode.ECB: self._ECB,
                           GOST.EncMode.CBC: self._CBC,
                           GOST.EncMode.CFB: self._CFB,
-                          GOST.EncMode.OFB: self._OFB}
+                          GOST.EncMode.OFB: self._OFB,
+                          GOST.EncMode.CTR: self._CTR}
 
         if enc_mode not in self._mode_fns.keys():
             raise TypeError(f"Invalid encryption mode entered ({enc_mode})! "
                             f"Possible modes: {tuple(self._mode_fns.keys())}")
 
         self._mode_fn = self._mode_fns.get(enc_mode)
+        self._enc_mode = enc_mode
         self._reset_iv = reset_iv
 
+        self._transform_fns = {GOST.Backend.REFERENCE: self._transform_reference,
+                               GOST.Backend.TABLE: self._transform_table}
+
+        if backend not in self._transform_fns.keys():
+            raise TypeError(f"Invalid backend entered ({backend})! "
+                            f"Possible backends: {tuple(self._transform_fns.keys())}")
+
+        self._transform = self._transform_fns.get(backend)
+        self._backend = backend
+        self._workers = workers
+
+        self._reset_vector()
+
+    def _reset_vector(self) -> None:
+        """Method for setting the vector to the initial state."""
+        self.vector = self.iv
+
+        # In gamma mode, the counter registers are filled with the encrypted IV.
+        if self._mode_fn == self._CTR and self.iv is not None:
+            self.vector = self._transform(self.iv, EncProc.ENCRYPT)
+
     def set_reset_iv_flag(self, flag: bool = False) -> None:
         """Method for setting the flag/clearing the flag by resetting the initialization vector."""
         self._reset_iv = flag
 
-    def _transform(self, block: int, enc_proc: EncProc) -> int:
+    def _transform_reference(self, block: int, enc_proc: EncProc) -> int:
         """
-        Data encryption/decryption method.
+        Data encryption/decryption method (reference implementation).
 
         Args:
             block: bytes converted to a number.
@@ -138,85 +224,213 @@ class GOST:
 
         return ((new_chunk << 11) | (new_chunk >> 21)) & 0xFFFFFFFF
 
+    def _transform_table(self, block: int, enc_proc: EncProc) -> int:
+        """
+        Data encryption/decryption method (table-driven implementation).
+
+        Gives the same result as the reference implementation, but each round
+        is reduced to four lookups in the fused S-box tables.
+
+        Args:
+            block: bytes converted to a number.
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+        Returns:
+            Encrypted/decrypted block as a number.
+        """
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                indices = GOST_ENC_INDICES
+
+            case EncProc.DECRYPT:
+                indices = GOST_DEC_INDICES
+
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+        t0, t1, t2, t3 = _SBOX_TABLES
+        subkeys = self.subkeys
+
+        chunk_l = block >> 32
+        chunk_r = block & 0xFFFFFFFF
+
+        for i in indices:
+            k = (chunk_l + subkeys[i]) & 0xFFFFFFFF
+            chunk_l, chunk_r = chunk_r ^ (t0[k & 0xFF] | t1[(k >> 8) & 0xFF] |
+                                          t2[(k >> 16) & 0xFF] | t3[k >> 24]), chunk_l
+
+        return (chunk_r << 32) | chunk_l
+
+    def _transform_blocks(self, blocks, enc_proc: EncProc):
+        """
+        Vectorized data encryption/decryption method.
+
+        Args:
+            blocks: NumPy array of blocks (uint64).
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+        Returns:
+            Array of encrypted/decrypted blocks.
+        """
+        from app.crypto.symmetric import vectorized
+
+        return vectorized.gost_transform(blocks, self.subkeys, enc_proc)
+
+    def _is_vectorized(self, data: bytes) -> bool:
+        """Method for checking whether to use the vectorized engine for the data."""
+        return self._backend is GOST.Backend.TABLE and len(data) >= block_modes.VECTORIZED_MIN_SIZE
+
     def _ECB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in ECB mode"""
-        processed_data = bytes()
+        if parallel.is_worth_parallel(len(data), self._workers):
+            return parallel.map_chunks(partial(self._ecb_chunk, enc_proc=enc_proc),
+                                       data, self._workers, block_modes.BLOCK_SIZE)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
-            processed_block = self._transform(block, enc_proc)
-            processed_data += processed_block.to_bytes(8, "little")
+        return self._ecb_chunk(data, 0, enc_proc)
 
-        return processed_data
+    def _ecb_chunk(self, data: bytes, index: int, enc_proc: EncProc) -> bytes:
+        """
+        Method for processing a chunk of data in ECB mode.
+
+        Args:
+            data: chunk of data.
+            index: index of the first block of the chunk (not used in ECB mode).
+            enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+        """
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
+
+            return vectorized.ecb(self._transform_blocks, data, enc_proc)
+
+        return block_modes.ecb(self._transform, data, enc_proc)
 
     def _CBC(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in CBC mode"""
-        processed_data = bytes()
+        if enc_proc is EncProc.DECRYPT:
+            return self._decrypt_chained(self._cbc_decrypt_chunk, data)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+        processed_data, self.vector = block_modes.cbc(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    processed_block = self._transform(block ^ self.vector, EncProc.ENCRYPT)
-                    self.vector = processed_block
+    def _cbc_decrypt_chunk(self, data: bytes, index: int) -> bytes:
+        """
+        Method for decrypting a chunk of data in CBC mode.
 
-                case EncProc.DECRYPT:
-                    processed_block = self._transform(block, EncProc.DECRYPT) ^ self.vector
-                    self.vector = block
+        Args:
+            data: chunk of data preceded by the previous ciphertext block (or the vector).
+            index: index of the first block of the chunk (not used).
+        """
+        vector = int.from_bytes(data[:block_modes.BLOCK_SIZE], "little")
+        data = memoryview(data)[block_modes.BLOCK_SIZE:]
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
 
-            processed_data += processed_block.to_bytes(8, "little")
+            return vectorized.cbc_decrypt(self._transform_blocks, data, vector)
 
-        return processed_data
+        return block_modes.cbc(self._transform, data, EncProc.DECRYPT, vector)[0]
 
     def _CFB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in CFB mode"""
-        processed_data = bytes()
+        if enc_proc is EncProc.DECRYPT:
+            return self._decrypt_chained(self._cfb_decrypt_chunk, data)
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+        processed_data, self.vector = block_modes.cfb(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    processed_block = self._transform(self.vector, EncProc.ENCRYPT) ^ block
-                    self.vector = processed_block
+    def _cfb_decrypt_chunk(self, data: bytes, index: int) -> bytes:
+        """
+        Method for decrypting a chunk of data in CFB mode.
 
-                case EncProc.DECRYPT:
-                    processed_block = self._transform(self.vector, EncProc.ENCRYPT) ^ block
-                    self.vector = block
+        Args:
+            data: chunk of data preceded by the previous ciphertext block (or the vector).
+            index: index of the first block of the chunk (not used).
+        """
+        vector = int.from_bytes(data[:block_modes.BLOCK_SIZE], "little")
+        data = memoryview(data)[block_modes.BLOCK_SIZE:]
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
+
+            return vectorized.cfb_decrypt(self._transform_blocks, data, vector)
+
+        return block_modes.cfb(self._transform, data, EncProc.DECRYPT, vector)[0]
+
+    def _decrypt_chained(self, chunk_fn, data: bytes) -> bytes:
+        """
+        Method for decrypting data in the modes where each plaintext block depends only
+        on two ciphertext blocks (CBC, CFB).
+
+        The ciphertext is split into chunks, each of which is decrypted together with the
+        block preceding it, so the chunks are independent and can be decrypted in parallel.
+        The final value of the vector is the last ciphertext block, as in the serial mode.
+        """
+        data = self.vector.to_bytes(block_modes.BLOCK_SIZE, "little") + block_modes.align(data)
 
-            processed_data += processed_block.to_bytes(8, "little")
+        if parallel.is_worth_parallel(len(data), self._workers):
+            processed_data = parallel.map_chunks(chunk_fn, data, self._workers,
+                                                 block_modes.BLOCK_SIZE, block_modes.BLOCK_SIZE)
+        else:
+            processed_data = chunk_fn(data, 0)
 
+        self.vector = int.from_bytes(data[-block_modes.BLOCK_SIZE:], "little")
         return processed_data
 
     def _OFB(self, data: bytes, enc_proc: EncProc) -> bytes:
         """Method for processing data in OFB mode"""
-        processed_data = bytes()
+        processed_data, self.vector = block_modes.ofb(self._transform, data, enc_proc, self.vector)
+        return processed_data
 
-        for pos in range(0, len(data), 8):
-            block = int.from_bytes(data[pos:pos + 8], "little")
+    def _CTR(self, data: bytes, enc_proc: EncProc) -> bytes:
+        """
+        Method for processing data in gamma mode (counter mode of GOST 28147-89).
 
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    self.vector = self._transform(self.vector, EncProc.ENCRYPT)
-                    processed_block = self.vector ^ block
+        The vector stores the state of the counter registers N3 (the least significant
+        32 bits) and N4 (the most significant 32 bits), which is changed before encrypting
+        each block. Initially, the registers contain the encrypted IV.
+        """
+        if parallel.is_worth_parallel(len(data), self._workers):
+            processed_data = parallel.map_chunks(partial(self._ctr_chunk, vector=self.vector),
+                                                 data, self._workers, block_modes.BLOCK_SIZE)
+        else:
+            processed_data = self._ctr_chunk(data, 0, self.vector)
 
-                case EncProc.DECRYPT:
-                    self.vector = self._transform(self.vector, EncProc.ENCRYPT)
-                    processed_block = self.vector ^ block
+        if blocks_count := -(-len(data) // block_modes.BLOCK_SIZE):
+            self.vector = self._counter_block(self.vector, blocks_count - 1)
 
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+        return processed_data
 
-            processed_data += processed_block.to_bytes(8, "little")
+    def _ctr_chunk(self, data: bytes, index: int, vector: int) -> bytes:
+        """
+        Method for processing a chunk of data in gamma mode.
 
-        return processed_data
+        Args:
+            data: chunk of data.
+            index: index of the first block of the chunk.
+            vector: state of the counter registers before the first block of the data.
+        """
+        if self._is_vectorized(data):
+            from app.crypto.symmetric import vectorized
+
+            def counter_blocks(pos: int, count: int):
+                return vectorized.gost_counter_blocks(vector, index + pos, count)
+
+            return vectorized.ctr(self._transform_blocks, data, counter_blocks)
+
+        return block_modes.ctr(self._transform, data, lambda pos: self._counter_block(vector, index + pos))
+
+    @staticmethod
+    def _counter_block(vector: int, index: int) -> int:
+        """
+        Method for getting the state of the counter registers for the block with the given index.
+
+        Before each block, the constant C2 is added to N3 modulo 2^32, and the constant C1
+        is added to N4 modulo 2^32 - 1, so the state is calculated directly from the index.
+        """
+        steps = index + 1
+        n3 = ((vector & 0xFFFFFFFF) + steps * GOST_C2) & 0xFFFFFFFF
+        n4 = ((vector >> 32) - 1 + steps * GOST_C1) % 0xFFFFFFFF + 1
+        return (n4 << 32) | n3
 
     def _data_processing(self, data: bytes or str, enc_proc: EncProc) -> str or bytes:
         """
@@ -257,7 +471,7 @@ class GOST:
             data_bytes += b"\00" * (8 - k)
 
         if self._reset_iv:
-            self.vector = self.iv
+            self._reset_vector()
 
         processed_data = self._mode_fn(data_bytes, enc_proc).rstrip(b"\00")
 
@@ -308,6 +522,42 @@ class GOST:
         """
         return self._data_processing(data, EncProc.DECRYPT)
 
+    def _stream_context(self, enc_proc: EncProc) -> stream.StreamContext:
+        """
+        Method for creating an incremental encryptor/decryptor.
+
+        In ECB and CBC modes the data is padded (ISO/IEC 7816-4), so the ciphertext is
+        longer than the plaintext by 1-8 bytes. In the other modes the cipher works as a
+        stream cipher and the length of the output is equal to the length of the input.
+        """
+        self._reset_vector()
+        process = partial(self._mode_fn, enc_proc=enc_proc)
+
+        if self._enc_mode in (GOST.EncMode.ECB, GOST.EncMode.CBC):
+            return stream.padded_context(process, block_modes.BLOCK_SIZE, enc_proc)
+
+        return stream.StreamContext(process, lambda rest: process(rest)[:len(rest)], block_modes.BLOCK_SIZE)
+
+    def encryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the rest of the
+        encrypted data is returned by the finalize method. The vector is reset when the
+        object is created, so only one encryptor/decryptor of the cipher can be used at a time.
+        """
+        return self._stream_context(EncProc.ENCRYPT)
+
+    def decryptor(self) -> stream.StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the rest of the
+        decrypted data is returned by the finalize method. The vector is reset when the
+        object is created, so only one encryptor/decryptor of the cipher can be used at a time.
+        """
+        return self._stream_context(EncProc.DECRYPT)
+
     def make(self, data: bytes or str, enc_proc: EncProc = EncProc.ENCRYPT) -> str or bytes:
         """
         Method - interface for encrypting/decrypting input data.
@@ -1,9 +1,11 @@
 # This module contains the implementation of the cipher "Gronsfeld cipher"
 import re
 
-from ..utils import get_alphabet_by_letter
-from ..const import ALPHABET_TABLE
 from ..common import EncProc
+from .translation import (
+    shift_table,
+    translate_periodic
+)
 
 
 class Gronsfeld:
@@ -29,6 +31,9 @@ class Gronsfeld:
         """
         Data encryption/decryption method.
 
+        The letters at the positions of each digit of the key are replaced by the translation
+        table of its shift (see app.crypto.symmetric.translation).
+
         Args:
             text: the string to be encrypted or decrypted.
             enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
@@ -39,41 +44,18 @@ class Gronsfeld:
         if not text:
             return ""
 
-        text_list: list[str] = list(text)
-
-        for i in range(len(text)):
-            letter_text = text_list[i]
-
-            # For each letter of the text, we look for the corresponding alphabet.
-            # If there is none, we skip the iteration, skipping the given letter.
-            if (lang_alphabet := get_alphabet_by_letter(letter_text, ALPHABET_TABLE)) is None:
-                continue
-
-            _, alphabet = lang_alphabet
-            shift = int(self.key[i % len(self.key)])
-
-            # Set the sign for encryption
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    sign = 1
-
-                case EncProc.DECRYPT:
-                    sign = -1
-
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
-
-            # We get the index of the current letter and calculate the new index.
-            letter_text_index = alphabet.index(letter_text.lower())
-            new_letter_index = (letter_text_index + shift * sign) % len(alphabet)
-            new_letter_text = alphabet[new_letter_index]
+        # Set the sign for encryption
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                sign = 1
 
-            if letter_text.isupper():
-                new_letter_text = new_letter_text.upper()
+            case EncProc.DECRYPT:
+                sign = -1
 
-            text_list[i] = new_letter_text
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
 
-        return "".join(text_list)
+        return translate_periodic(text, [shift_table(int(digit) * sign) for digit in self.key])
 
     def encrypt(self, text: str) -> str:
         """
@@ -0,0 +1,142 @@
+# This module contains the translation tables of the substitution ciphers with the
+# alphabets of ALPHABET_TABLE (Caesar, Atbash, Gronsfeld, Vigenère).
+#
+# A table maps each letter of the alphabets (in both cases) to its replacement, and the
+# text is encrypted by str.translate in C, instead of searching the alphabet and the
+# index of each character in a loop. The tables are built once for each shift.
+#
+# str.translate is fast only for ASCII text, so texts that can be encoded in the single-byte
+# encoding containing both alphabets (cp1251) are translated as bytes by bytes.translate.
+#
+# The ciphers with a periodic key (Gronsfeld, Vigenère) use a table for each position of
+# the key: the characters at the positions k, k + period, k + 2 * period, ... are
+# translated at once by the table of the k-th character of the key.
+from functools import lru_cache
+from typing import (
+    Callable,
+    NamedTuple,
+    Sequence
+)
+
+from app.crypto.const import ALPHABET_TABLE
+
+# Maximum number of shift tables kept.
+CACHE_SIZE = 128
+
+# Single-byte encoding containing the letters of all alphabets.
+BYTE_ENCODING = "cp1251"
+
+# Characters that are not letters of the alphabets, but whose lower case is a letter of an
+# alphabet (the Kelvin sign is lowered to "k"). They are replaced as upper case letters.
+_EXTRA_LETTERS = ("\u212a",)
+
+
+class Table(NamedTuple):
+    """Translation table for str.translate and its version for bytes.translate of the text in BYTE_ENCODING."""
+    chars: dict[int, str]
+    byte_table: bytes
+
+
+def _make_byte_table(chars: dict[int, str]) -> bytes:
+    """Function for converting the translation table of the characters to the table of the bytes in BYTE_ENCODING."""
+    byte_table = bytearray(range(256))
+
+    for byte in range(256):
+        try:
+            char = bytes([byte]).decode(BYTE_ENCODING)
+        except UnicodeDecodeError:
+            continue
+
+        new_char = chars.get(ord(char), char)
+        byte_table[byte] = new_char.encode(BYTE_ENCODING)[0]
+
+    return bytes(byte_table)
+
+
+def _make_table(transform: Callable[[int, int], int]) -> Table:
+    """
+    Function for building a translation table.
+
+    Args:
+        transform: function getting the index of the new letter from the index of the
+            letter in the alphabet and the length of the alphabet.
+
+    Returns:
+        Translation table. The case of the letters is kept.
+    """
+    letters = {}
+
+    for alphabet in ALPHABET_TABLE.values():
+        for letter in (*alphabet, *alphabet.upper(), *_EXTRA_LETTERS):
+            lower_letter = letter.lower()
+            if letter in letters or len(lower_letter) != 1 or lower_letter not in alphabet:
+                continue
+
+            new_letter = alphabet[transform(alphabet.index(lower_letter), len(alphabet))]
+            letters[letter] = new_letter.upper() if letter.isupper() else new_letter
+
+    chars = str.maketrans(letters)
+    return Table(chars, _make_byte_table(chars))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def shift_table(shift: int) -> Table:
+    """Function for getting the table shifting each letter by the given value within its alphabet."""
+    return _make_table(lambda index, size: (index + shift) % size)
+
+
+@lru_cache(maxsize=1)
+def reverse_table() -> Table:
+    """Function for getting the table replacing each letter by the letter at the mirror position (Atbash)."""
+    return _make_table(lambda index, size: size - index - 1)
+
+
+# Table that does not change the text.
+IDENTITY_TABLE = Table({}, bytes(range(256)))
+
+
+def translate(text: str, table: Table) -> str:
+    """Function for translating a text by the table."""
+    try:
+        data = text.encode(BYTE_ENCODING)
+    except UnicodeEncodeError:
+        return text.translate(table.chars)
+
+    return data.translate(table.byte_table).decode(BYTE_ENCODING)
+
+
+def translate_periodic(text: str, tables: Sequence[Table]) -> str:
+    """
+    Function for translating a text with a periodic key.
+
+    Args:
+        text: the string to be translated.
+        tables: the tables of the positions of the key. The i-th character of the text
+            is translated by the table i % len(tables).
+
+    Returns:
+        Translated string.
+    """
+    period = len(tables)
+    if period == 1:
+        return translate(text, tables[0])
+
+    try:
+        data = text.encode(BYTE_ENCODING)
+    except UnicodeEncodeError:
+        # Each character takes 4 bytes in UTF-32, the positions are set through the view of
+        # the characters as 32-bit numbers.
+        result = bytearray(text.encode("utf-32-le"))
+        view = memoryview(result).cast("I")
+
+        for k, table in enumerate(tables):
+            view[k::period] = memoryview(text[k::period].translate(table.chars).encode("utf-32-le")).cast("I")
+
+        view.release()
+        return result.decode("utf-32-le")
+
+    result = bytearray(data)
+    for k, table in enumerate(tables):
+        result[k::period] = data[k::period].translate(table.byte_table)
+
+    return result.decode(BYTE_ENCODING)
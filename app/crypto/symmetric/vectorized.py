@@ -0,0 +1,250 @@
+# This module contains vectorized (NumPy) implementations of the DES and
+# GOST 28147-89 block transformations.
+#
+# The whole buffer is loaded as an array of 64-bit blocks and each round of the
+# Feistel network is performed on all blocks at once, the S-boxes are replaced by
+# gathers from the precomputed tables of the table-driven engines. This is only
+# possible when the input of every block transformation is known in advance: in
+# ECB and CTR the blocks are independent of each other, and in CBC/CFB decryption
+# each block depends only on ciphertext blocks, which are all available at once.
+from typing import Callable
+
+import numpy as np
+
+from app.crypto.common import EncProc
+from app.crypto.const import (
+    GOST_ENC_INDICES,
+    GOST_DEC_INDICES,
+    GOST_C1,
+    GOST_C2
+)
+from app.crypto.symmetric.block_modes import align
+from app.crypto.symmetric.des import (
+    _IP_TABLES, _IP_INV_TABLES,
+    _SP_TABLES
+)
+from app.crypto.symmetric.gost import _SBOX_TABLES
+
+# Number of blocks processed at once. Limits the size of the temporary arrays.
+CHUNK_BLOCKS = 1 << 16
+
+_DES_IP = np.array(_IP_TABLES, dtype=np.uint64)
+_DES_IP_INV = np.array(_IP_INV_TABLES, dtype=np.uint64)
+_DES_SP = np.array(_SP_TABLES, dtype=np.uint32)
+
+_GOST_SBOX = np.array(_SBOX_TABLES, dtype=np.uint32)
+
+TransformBlocks = Callable[[np.ndarray, EncProc], np.ndarray]
+
+
+def _lookup(table: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Function for gathering the elements of the table by an array of unsigned indices.
+
+    NumPy 1.x does not cast uint64 indices to the index type implicitly, so they are cast here.
+    """
+    return np.take(table, indices.astype(np.intp))
+
+
+def _permute(values: np.ndarray, tables: np.ndarray) -> np.ndarray:
+    """Function for performing a bit permutation of each element using byte-indexed tables."""
+    result = _lookup(tables[0], values & 0xFF)
+    for k in range(1, len(tables)):
+        result |= _lookup(tables[k], (values >> (8 * k)) & 0xFF)
+
+    return result
+
+
+def des_transform(blocks: np.ndarray, keys: list[int], enc_proc: EncProc) -> np.ndarray:
+    """
+    Function for encrypting/decrypting an array of blocks with DES.
+
+    Args:
+        blocks: array of blocks (uint64).
+        keys: round keys of the cipher.
+        enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+    Returns:
+        Array of encrypted/decrypted blocks (uint64).
+    """
+    block = _permute(blocks, _DES_IP)
+    chunk_l = (block >> 32).astype(np.uint32)
+    chunk_r = block.astype(np.uint32)
+
+    # Decryption is the same sequence of rounds with the reverse order of the keys
+    # applied to the swapped halves of the block (see DES._transform_table).
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            x, y = chunk_l, chunk_r
+
+        case EncProc.DECRYPT:
+            x, y = chunk_r, chunk_l
+            keys = keys[::-1]
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    for key in keys:
+        # The K-th 6-bit chunk of the E-expansion is bits 4K-1..4K+4 of the half of the
+        # block (cyclically), so the expansion is reduced to shifts of the doubled half.
+        y1 = (y << 1) | (y >> 31)
+        e = (y1.astype(np.uint64) << 32) | y1
+
+        f = _lookup(_DES_SP[0], (e & 0x3F) ^ (key & 0x3F))
+        for k in range(1, 8):
+            f |= _lookup(_DES_SP[k], ((e >> (4 * k)) & 0x3F) ^ ((key >> (6 * k)) & 0x3F))
+
+        x, y = y, x ^ f
+
+    if enc_proc is EncProc.ENCRYPT:
+        block = (x.astype(np.uint64) << 32) | y
+    else:
+        block = (y.astype(np.uint64) << 32) | x
+
+    return _permute(block, _DES_IP_INV)
+
+
+def gost_transform(blocks: np.ndarray, subkeys: tuple[int, ...], enc_proc: EncProc) -> np.ndarray:
+    """
+    Function for encrypting/decrypting an array of blocks with GOST 28147-89.
+
+    Args:
+        blocks: array of blocks (uint64).
+        subkeys: eight 32-bit subkeys of the cipher.
+        enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
+
+    Returns:
+        Array of encrypted/decrypted blocks (uint64).
+    """
+    match enc_proc:
+        case EncProc.ENCRYPT:
+            indices = GOST_ENC_INDICES
+
+        case EncProc.DECRYPT:
+            indices = GOST_DEC_INDICES
+
+        case _:
+            raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
+
+    t0, t1, t2, t3 = _GOST_SBOX
+    subkeys = tuple(np.uint32(key) for key in subkeys)
+
+    chunk_l = (blocks >> 32).astype(np.uint32)
+    chunk_r = blocks.astype(np.uint32)
+
+    for i in indices:
+        # Addition modulo 2^32 is provided by the overflow of uint32.
+        k = chunk_l + subkeys[i]
+        f = (_lookup(t0, k & 0xFF) | _lookup(t1, (k >> 8) & 0xFF) |
+             _lookup(t2, (k >> 16) & 0xFF) | _lookup(t3, k >> 24))
+        chunk_l, chunk_r = chunk_r ^ f, chunk_l
+
+    return (chunk_r.astype(np.uint64) << 32) | chunk_l
+
+
+def des_counter_blocks(start: int, count: int) -> np.ndarray:
+    """Function for getting an array of consecutive values of the DES counter (modulo 2^64)."""
+    return np.arange(count, dtype=np.uint64) + np.uint64(start)
+
+
+def gost_counter_blocks(vector: int, index: int, count: int) -> np.ndarray:
+    """
+    Function for getting an array of states of the counter registers of the GOST 28147-89
+    gamma mode for the blocks with indices index, ..., index + count - 1 (see GOST._counter_block).
+    """
+    steps = np.arange(index + 1, index + count + 1, dtype=np.uint64)
+
+    n3 = (np.uint64(vector & 0xFFFFFFFF) + steps * np.uint64(GOST_C2)) & np.uint64(0xFFFFFFFF)
+    # N4 - 1 + 2^32 - 1 is used instead of N4 - 1 to avoid a negative value when N4 = 0.
+    n4 = (np.uint64((vector >> 32) + 0xFFFFFFFE) + steps * np.uint64(GOST_C1)) % np.uint64(0xFFFFFFFF) + np.uint64(1)
+
+    return (n4 << np.uint64(32)) | n3
+
+
+def _as_blocks(data: bytes) -> np.ndarray:
+    """Function for converting data to an array of blocks (little endian)."""
+    return np.frombuffer(align(data), dtype="<u8")
+
+
+def _previous_blocks(blocks: np.ndarray, vector: int) -> np.ndarray:
+    """Function for getting an array of blocks preceding each block (the first one is preceded by the vector)."""
+    previous_blocks = np.empty_like(blocks)
+    previous_blocks[:1] = vector
+    previous_blocks[1:] = blocks[:-1]
+    return previous_blocks
+
+
+def ecb(transform_blocks: TransformBlocks, data: bytes, enc_proc: EncProc) -> bytes:
+    """
+    Function for processing data in ECB mode.
+
+    The result is the same as of block_modes.ecb with the corresponding block transformation.
+    """
+    blocks = _as_blocks(data)
+    processed_blocks = np.empty_like(blocks)
+
+    for pos in range(0, len(blocks), CHUNK_BLOCKS):
+        processed_blocks[pos:pos + CHUNK_BLOCKS] = transform_blocks(blocks[pos:pos + CHUNK_BLOCKS], enc_proc)
+
+    return processed_blocks.tobytes()
+
+
+def ctr(transform_blocks: TransformBlocks, data: bytes, counter_blocks: Callable[[int, int], np.ndarray]) -> bytes:
+    """
+    Function for processing data in counter mode. Encryption and decryption are the same.
+
+    Args:
+        transform_blocks: vectorized block transformation of the cipher.
+        data: bytes to be processed. The length does not have to be a multiple of the block size.
+        counter_blocks: function returning the array of counter blocks for the given
+            index of the first block and the number of blocks.
+
+    Returns:
+        Processed bytes, the length is equal to the length of the input data.
+    """
+    blocks = _as_blocks(data)
+    processed_blocks = np.empty_like(blocks)
+
+    for pos in range(0, len(blocks), CHUNK_BLOCKS):
+        chunk = blocks[pos:pos + CHUNK_BLOCKS]
+        gamma = transform_blocks(counter_blocks(pos, len(chunk)), EncProc.ENCRYPT)
+        processed_blocks[pos:pos + CHUNK_BLOCKS] = chunk ^ gamma
+
+    return processed_blocks.tobytes()[:len(data)]
+
+
+def cbc_decrypt(transform_blocks: TransformBlocks, data: bytes, vector: int) -> bytes:
+    """
+    Function for decrypting data in CBC mode.
+
+    Each plaintext block depends only on two ciphertext blocks, so all blocks are
+    decrypted at once. The result is the same as of block_modes.cbc.
+    """
+    blocks = _as_blocks(data)
+    previous_blocks = _previous_blocks(blocks, vector)
+    processed_blocks = np.empty_like(blocks)
+
+    for pos in range(0, len(blocks), CHUNK_BLOCKS):
+        processed_blocks[pos:pos + CHUNK_BLOCKS] = (transform_blocks(blocks[pos:pos + CHUNK_BLOCKS], EncProc.DECRYPT) ^
+                                                    previous_blocks[pos:pos + CHUNK_BLOCKS])
+
+    return processed_blocks.tobytes()
+
+
+def cfb_decrypt(transform_blocks: TransformBlocks, data: bytes, vector: int) -> bytes:
+    """
+    Function for decrypting data in CFB mode.
+
+    Each plaintext block depends only on two ciphertext blocks, so all blocks are
+    decrypted at once. The result is the same as of block_modes.cfb.
+    """
+    blocks = _as_blocks(data)
+    previous_blocks = _previous_blocks(blocks, vector)
+    processed_blocks = np.empty_like(blocks)
+
+    for pos in range(0, len(blocks), CHUNK_BLOCKS):
+        processed_blocks[pos:pos + CHUNK_BLOCKS] = (transform_blocks(previous_blocks[pos:pos + CHUNK_BLOCKS],
+                                                                     EncProc.ENCRYPT) ^
+                                                    blocks[pos:pos + CHUNK_BLOCKS])
+
+    return processed_blocks.tobytes()
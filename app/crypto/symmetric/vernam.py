@@ -1,7 +1,19 @@
 # This module contains the implementation of the cipher "Vernam"
-import numpy as np
+#
+# Besides keys held in memory, the cipher works with pads (keys) stored in files: the
+# data file and the pad file are memory-mapped and XORed piece by piece, so files of
+# any size are processed with constant memory.
+import mmap
+import os
+import secrets
 
 from ..common import EncProc
+from ..stream import StreamContext
+from .xor import xor_with_key
+
+# Size of the pieces of the files XORed at a time by process_file and of the blocks
+# of random bytes written at a time by gen_pad_file.
+FILE_CHUNK_SIZE = 1 << 24
 
 
 class Vernam:
@@ -23,8 +35,94 @@ class Vernam:
     @staticmethod
     def gen_key(size: int) -> str:
         """Method for generating a key."""
-        sample = tuple(np.random.randint(0, 256, size))
-        return bytes(sample).hex()
+        return secrets.token_hex(size)
+
+    @staticmethod
+    def gen_pad_file(path: str, size: int, chunk_size: int = FILE_CHUNK_SIZE) -> None:
+        """
+        Method for generating a pad (key) file of the given size.
+
+        The random bytes (os.urandom) are written to the file by blocks of chunk_size
+        bytes, so the pad is never held in memory.
+        """
+        if size < 0:
+            raise ValueError("The size of the pad must be non-negative!")
+
+        with open(path, "wb") as f_out:
+            for start in range(0, size, chunk_size):
+                f_out.write(os.urandom(min(chunk_size, size - start)))
+
+    @staticmethod
+    def process_file(input_path: str, output_path: str, pad_path: str, pad_offset: int = 0,
+                     chunk_size: int = FILE_CHUNK_SIZE) -> int:
+        """
+        Method for encrypting/decrypting a file with a pad file (encryption and decryption are the same).
+
+        The input file, the pad file and the output file are memory-mapped, and the data is
+        XORed with the pad by NumPy piece by piece without copying, so the memory used does
+        not depend on the size of the files.
+
+        A pad file can be used for several files: each of them takes the next part of the
+        pad starting at pad_offset. The same part of the pad must never be used twice.
+
+        Args:
+            input_path: path to the file to be encrypted/decrypted.
+            output_path: path to the output file (must differ from the input file and the pad file).
+            pad_path: path to the pad file.
+            pad_offset: position in the pad file of the byte used for the first byte of the data.
+            chunk_size: size of the pieces XORed at a time.
+
+        Returns:
+            Position in the pad file after the used part (pad_offset for the next file).
+        """
+        # The output file is truncated when opened, so it must not be the input or the pad.
+        for path in (input_path, pad_path):
+            if os.path.exists(output_path):
+                same_file = os.path.samefile(output_path, path)
+            else:
+                same_file = os.path.realpath(output_path) == os.path.realpath(path)
+
+            if same_file:
+                raise ValueError("The output file must differ from the input file and the pad file!")
+
+        import numpy as np
+
+        size = os.path.getsize(input_path)
+        pad_size = os.path.getsize(pad_path)
+
+        if pad_offset < 0:
+            raise ValueError("The pad offset must be non-negative!")
+
+        if pad_offset + size > pad_size:
+            raise ValueError(f"The pad is too short: {pad_size - pad_offset} bytes are left "
+                             f"after the offset, {size} bytes are needed!")
+
+        with open(input_path, "rb") as f_in, open(pad_path, "rb") as f_pad, open(output_path, "w+b") as f_out:
+            f_out.truncate(size)
+
+            # Empty files cannot be mapped.
+            if not size:
+                return pad_offset
+
+            with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as input_map, \
+                    mmap.mmap(f_pad.fileno(), 0, access=mmap.ACCESS_READ) as pad_map, \
+                    mmap.mmap(f_out.fileno(), 0, access=mmap.ACCESS_WRITE) as output_map:
+                data = np.frombuffer(input_map, dtype=np.uint8)
+                pad = np.frombuffer(pad_map, dtype=np.uint8, count=size, offset=pad_offset)
+                output = np.frombuffer(output_map, dtype=np.uint8)
+
+                try:
+                    for start in range(0, size, chunk_size):
+                        end = min(start + chunk_size, size)
+                        np.bitwise_xor(data[start:end], pad[start:end], out=output[start:end])
+
+                finally:
+                    # The arrays must be released before the maps are closed.
+                    del data, pad, output
+
+                output_map.flush()
+
+        return pad_offset + size
 
     def _transform(self, data: bytes or str, enc_proc: EncProc) -> str or bytes:
         """
@@ -66,8 +164,7 @@ class Vernam:
         if len(self.key) != len(data_bytes):
             raise ValueError(f"Key size ({len(self.key)}) and text size ({len(data_bytes)}) in bytes must match!")
 
-        for i in range(len(data_bytes)):
-            data_bytes[i] ^= self.key[i % len(self.key)]
+        data_bytes = xor_with_key(data_bytes, self.key)
 
         # manage output
         match enc_proc, data:
@@ -117,6 +214,51 @@ class Vernam:
         """
         return self._transform(data, EncProc.DECRYPT)
 
+    def _stream_context(self) -> StreamContext:
+        """
+        Method for creating an incremental encryptor/decryptor. Encryption and decryption are the same.
+
+        The key is consumed as the data arrives, the total size of the data must be equal to the key size.
+        """
+        offset = 0
+
+        def process(data: bytes) -> bytes:
+            nonlocal offset
+
+            if offset + len(data) > len(self.key):
+                raise ValueError(f"Key size ({len(self.key)}) and text size (at least {offset + len(data)}) "
+                                 f"in bytes must match!")
+
+            key = self.key[offset:offset + len(data)]
+            offset += len(data)
+            return xor_with_key(data, key)
+
+        def final(rest: bytes) -> bytes:
+            if offset != len(self.key):
+                raise ValueError(f"Key size ({len(self.key)}) and text size ({offset}) in bytes must match!")
+
+            return b""
+
+        return StreamContext(process, final)
+
+    def encryptor(self) -> StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the finalize
+        method checks that the whole key has been used.
+        """
+        return self._stream_context()
+
+    def decryptor(self) -> StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object, the finalize
+        method checks that the whole key has been used.
+        """
+        return self._stream_context()
+
     def make(self, data: str or bytes, enc_proc: EncProc = EncProc.ENCRYPT) -> str or bytes:
         """
         Method - interface for encrypting/decrypting input data.
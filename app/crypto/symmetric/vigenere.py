@@ -4,6 +4,11 @@ import re
 from ..utils import get_alphabet_by_letter
 from ..const import ALPHABET_TABLE
 from ..common import EncProc
+from .translation import (
+    IDENTITY_TABLE,
+    shift_table,
+    translate_periodic
+)
 
 
 class Vigenere:
@@ -29,6 +34,10 @@ class Vigenere:
         """
         Data encryption/decryption method.
 
+        The letters at the positions of each letter of the key are replaced by the translation
+        table of its shift - the index of the key letter in its alphabet (see
+        app.crypto.symmetric.translation).
+
         Args:
             text: the string to be encrypted or decrypted.
             enc_proc: parameter responsible for the process of data encryption (encryption and decryption).
@@ -39,45 +48,29 @@ class Vigenere:
         if not text:
             return ""
 
-        text_list: list[str] = list(text)
+        # choice of sign
+        match enc_proc:
+            case EncProc.ENCRYPT:
+                key_sign = 1
 
-        for i in range(len(text)):
-            letter_text = text_list[i]
-            # Get the alphabet for the text character.
-            if (lang_alphabet_text := get_alphabet_by_letter(letter_text, ALPHABET_TABLE)) is None:
-                continue
+            case EncProc.DECRYPT:
+                key_sign = -1
+
+            case _:
+                raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
 
-            letter_key = self.key[i % len(self.key)]
-            # # Get the alphabet for the key character.
+        tables = []
+        for letter_key in self.key:
+            # Get the alphabet for the key character. The text is not changed at the positions
+            # of the characters that are not in the alphabets.
             if (lang_alphabet_key := get_alphabet_by_letter(letter_key, ALPHABET_TABLE)) is None:
+                tables.append(IDENTITY_TABLE)
                 continue
 
-            _, alphabet_text = lang_alphabet_text
             _, alphabet_key = lang_alphabet_key
+            tables.append(shift_table(alphabet_key.index(letter_key.lower()) * key_sign))
 
-            letter_text_index = alphabet_text.index(letter_text.lower())
-            letter_key_index = alphabet_key.index(letter_key.lower())
-
-            # choice of sign
-            match enc_proc:
-                case EncProc.ENCRYPT:
-                    key_sign = 1
-
-                case EncProc.DECRYPT:
-                    key_sign = -1
-
-                case _:
-                    raise TypeError("Possible types: EncProc.ENCRYPT, EncProc.DECRYPT.")
-
-            new_letter_text_index = (letter_text_index + letter_key_index * key_sign) % len(alphabet_text)
-            new_letter_text = alphabet_text[new_letter_text_index]
-
-            if letter_text.isupper():
-                new_letter_text = new_letter_text.upper()
-
-            text_list[i] = new_letter_text
-
-        return "".join(text_list)
+        return translate_periodic(text, tables)
 
     def encrypt(self, text: str) -> str:
         """
@@ -1,5 +1,56 @@
 # This module contains the implementation of the cipher "XOR cipher"
 from ..common import EncProc
+from ..stream import StreamContext
+
+# Size of the pieces of data XORed with the key at once, in bytes. Bounds the size
+# of the key repeated to the length of a piece.
+BULK_CHUNK_SIZE = 1 << 20
+
+# Minimum size of data XORed by NumPy. Smaller data is XORed as big integers, so
+# NumPy is not imported for short messages.
+NUMPY_MIN_SIZE = 1 << 16
+
+
+def xor_with_key(data: bytes, key: bytes, phase: int = 0) -> bytes:
+    """
+    Function for XORing data with the key repeated to the length of the data.
+
+    The key is tiled once to a piece of about BULK_CHUNK_SIZE bytes (a multiple of the key
+    length, so every piece starts at the same position in the key), and the pieces are
+    XORed as a whole by NumPy or as big integers instead of byte by byte.
+
+    Args:
+        data: data (any bytes-like object).
+        key: key.
+        phase: position in the key corresponding to the first byte of the data.
+
+    Returns:
+        Result of XOR of the same length as the data.
+    """
+    size = len(data)
+    if not size:
+        return b""
+
+    key_size = len(key)
+    phase %= key_size
+    rotated_key = key[phase:] + key[:phase]
+
+    if size < NUMPY_MIN_SIZE:
+        pad = (rotated_key * -(-size // key_size))[:size]
+        result = int.from_bytes(data, "little") ^ int.from_bytes(pad, "little")
+        return result.to_bytes(size, "little")
+
+    import numpy as np
+
+    piece_size = min(size, max(BULK_CHUNK_SIZE // key_size, 1) * key_size)
+    pad = np.frombuffer((rotated_key * -(-piece_size // key_size))[:piece_size], dtype=np.uint8)
+    data = np.frombuffer(data, dtype=np.uint8)
+    result = np.empty(size, dtype=np.uint8)
+    for start in range(0, size, piece_size):
+        end = min(start + piece_size, size)
+        np.bitwise_xor(data[start:end], pad[:end - start], out=result[start:end])
+
+    return result.tobytes()
 
 
 class XOR:
@@ -31,6 +82,26 @@ class XOR:
         """Method for setting the flag/clearing the flag by resetting the state."""
         self._reset_state = flag
 
+    def seek(self, offset: int) -> None:
+        """
+        Method for moving to the given position in the data: the next processed byte is
+        XORed with the byte of the key used for the byte at the offset.
+
+        Any part of the encrypted data can be decrypted this way without processing the
+        data before it (with the reset_state flag cleared).
+        """
+        if offset < 0:
+            raise ValueError("The offset must be non-negative!")
+
+        self.index_key = offset % len(self.key)
+
+    def _xor(self, data: bytes) -> bytes:
+        """Method for applying the key to the data, starting from the current position of the key."""
+        processed_data = xor_with_key(data, self.key, self.index_key)
+        self.index_key = (self.index_key + len(data)) % len(self.key)
+
+        return processed_data
+
     def _transform(self, data: bytes or str, enc_proc: EncProc) -> str or bytes:
         """
         Method for processing data. This method converts the input data to bytes,
@@ -71,9 +142,7 @@ class XOR:
         if self._reset_state:
             self.index_key = 0
 
-        for i in range(len(data_bytes)):
-            data_bytes[i] ^= self.key[self.index_key % len(self.key)]
-            self.index_key = (self.index_key + 1) % len(self.key)
+        data_bytes = self._xor(data_bytes)
 
         # manage output
         match enc_proc, data:
@@ -123,6 +192,29 @@ class XOR:
         """
         return self._transform(data, EncProc.DECRYPT)
 
+    def _stream_context(self) -> StreamContext:
+        """Method for creating an incremental encryptor/decryptor. Encryption and decryption are the same."""
+        self.index_key = 0
+        return StreamContext(self._xor)
+
+    def encryptor(self) -> StreamContext:
+        """
+        Method - interface for encrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object. The state is
+        reset when the object is created, so only one encryptor/decryptor can be used at a time.
+        """
+        return self._stream_context()
+
+    def decryptor(self) -> StreamContext:
+        """
+        Method - interface for decrypting data in chunks of any size.
+
+        The data is passed to the update method of the returned object. The state is
+        reset when the object is created, so only one encryptor/decryptor can be used at a time.
+        """
+        return self._stream_context()
+
     def make(self, data: str or bytes, enc_proc: EncProc = EncProc.ENCRYPT) -> str or bytes:
         """
         Method - interface for encrypting/decrypting input data.
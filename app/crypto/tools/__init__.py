@@ -1,4 +1,13 @@
-from .autocorrelation import Autocorrelation
-from .freqanalysis import FreqAnalysis
-from .index_of_coincidence import IndexOfCoincidence
-from .kasiski import Kasiski
+# The classes are imported on first access (see app.crypto.utils.lazy_import).
+from app.crypto.utils import lazy_import
+
+_ATTRIBUTES = {
+    "Autocorrelation": ".autocorrelation",
+    "FreqAnalysis": ".freqanalysis",
+    "IndexOfCoincidence": ".index_of_coincidence",
+    "Kasiski": ".kasiski"
+}
+
+__all__ = tuple(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -1,5 +1,9 @@
-import subprocess
-from typing import Iterable
+import sys
+from importlib import import_module
+from typing import (
+    Callable,
+    Iterable
+)
 
 
 def get_alphabet_by_letter(
@@ -51,21 +55,45 @@ def get_letters_alphabetically(
     return letters, indices
 
 
-def gen_prime(n: int = 1024, timeout: int = 10) -> int:
+def gen_prime(n: int = 1024) -> int:
     """
     The function of generating prime numbers of a given dimension.
 
-    To generate prime numbers, the opensl program is used, if
-    the program is missing, an exception will occur.
+    The prime numbers are generated in the process by the engine of the
+    app.crypto.primes module (sieve and Miller-Rabin test).
 
     n
-        The number of bits in the prime to be generated. When generating prime
-        numbers with a small number of bits (<50), the function will return the same number.
+        The number of bits in the prime to be generated.
     """
-    if not isinstance(n, int):
-        raise TypeError("The function parameter must be an integer!")
+    from app.crypto.primes import gen_prime as _gen_prime
 
-    result = subprocess.run(["openssl", "prime", "-generate", "-bits", str(n)],
-                            capture_output=True, timeout=timeout, check=True)
+    return _gen_prime(n)
 
-    return int(result.stdout)
+
+def lazy_import(package: str, attributes: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    The function of creating the module "__getattr__" and "__dir__" functions (PEP 562)
+    of a package that imports its submodules on first access to their attributes.
+
+    Thus, the heavy dependencies of some modules (NumPy, SymPy, SciPy) are loaded
+    only when these modules are used, and not when the package is imported.
+
+    package
+        Name of the package ("__name__").
+    attributes
+        Dictionary whose keys are the names of the attributes of the package, and the values
+        are the names of the submodules (relative to the package) containing these attributes.
+    """
+    def __getattr__(name: str) -> object:
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(attributes[name], package), name)
+        # Subsequent accesses do not call this function.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,9 +1,9 @@
 from typing import Final
 
-from .rsa import RSAWidget
-from .elgamal import ElgamalWidget
+from ..widgets import LazyWidget
 
+# The widgets are created when their tree items are first clicked (see MainWindow).
 WIDGETS_ASYMMETRIC: Final = (
-    RSAWidget,
-    ElgamalWidget
+    LazyWidget("RSA", "app.gui.asymmetric.rsa.rsa_widget", "RSAWidget"),
+    LazyWidget("Elgamal", "app.gui.asymmetric.elgamal.elgamal_widget", "ElgamalWidget")
 )
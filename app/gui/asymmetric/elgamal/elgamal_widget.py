@@ -10,18 +10,25 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QUrl
 
-from sympy import isprime
-
 from .elgamal_ui import Ui_Elgamal
+from app.crypto import parallel
 from app.crypto.asymmetric import Elgamal
 from app.crypto.common import EncProc
-from app.crypto.utils import gen_prime
+from app.crypto.hybrid import Hybrid
+from app.crypto.group_pool import get_default_pool
+from app.crypto.primes import (
+    gen_safe_prime,
+    is_prime
+)
 from app.gui.file_processing import FileProcessing
 from app.gui.widgets import (
     DragDropWidget,
     BaseQWidget
 )
-from app.gui.const import ELGAMAL_SUPPORT_EXT
+from app.gui.const import (
+    ELGAMAL_SUPPORT_EXT,
+    STREAM_BYTES_READ
+)
 
 
 class ElgamalWidget(BaseQWidget):
@@ -51,11 +58,16 @@ class ElgamalWidget(BaseQWidget):
         menu = QMenu()
         menu.addAction("Generate keys", self._action_gen_keys_clicked)
         menu.addSeparator()
-        menu.addAction("Generate keys from p (SLOW!)", self._action_gen_keys_from_p_clicked)
+        menu.addAction("Generate keys from p", self._action_gen_keys_from_p_clicked)
         menu.addAction("Generate p", self._action_gen_p_clicked)
         menu.addSeparator()
         menu.addAction("Save key", self._action_save_key_clicked)
         menu.addAction("Load key", self._action_load_key_clicked)
+        menu.addSeparator()
+        # In the hybrid mode, the files are encrypted by GOST 28147-89 with a random session key,
+        # and only the session key is encrypted by the asymmetric cipher.
+        self._action_hybrid = menu.addAction("Hybrid file encryption")
+        self._action_hybrid.setCheckable(True)
 
         self.ui.button_options.setMenu(menu)
 
@@ -66,6 +78,11 @@ class ElgamalWidget(BaseQWidget):
         self.drag_drop_widget.dropped.connect(self._file_path_changed)
         self.drag_drop_widget.canceled.connect(self._file_path_changed)
 
+        # Groups of the selected size are generated in the background in advance,
+        # so that the keys are generated instantly.
+        self.ui.spin_box_key_size.editingFinished.connect(self._spin_box_key_size_editing_finished)
+        self._spin_box_key_size_editing_finished()
+
     def _button_make_clicked(self) -> None:
         """Method - a slot for processing a signal when a button is pressed."""
         enc_proc = EncProc.from_str(self.ui.combo_box_enc_proc.currentText())
@@ -92,7 +109,7 @@ class ElgamalWidget(BaseQWidget):
         public_key = Elgamal.PublicKey(y, g, p)
 
         try:
-            cipher = Elgamal(private_key, public_key)
+            cipher = Elgamal(private_key, public_key, workers=parallel.cpu_count())
         except (ValueError, TypeError) as e:
             QMessageBox.warning(self, "Warning!", e.args[0])
             return
@@ -176,31 +193,20 @@ class ElgamalWidget(BaseQWidget):
         if not file_path_output:
             return
 
-        # Depending on the encryption process, the block size for reading
-        # changes. The encryption reads fewer bytes than the modulus length,
-        # and then expands the resulting value to two modulus (due to
-        # ciphertext A and B). When decrypting, the size of the two modules
-        # in bytes is read, and then the decrypted data is aligned to the amount
-        # that was read when encrypted
-        if enc_proc is EncProc.ENCRYPT:
-            read_block_size = cipher.num_bytes_to_encrypt
-            control_block_size = read_block_size
-        else:
-            read_block_size = cipher.num_bytes_to_decrypt
-            control_block_size = read_block_size
+        if self._action_hybrid.isChecked():
+            cipher = Hybrid(cipher, workers=parallel.cpu_count())
 
         # We create a stream object that will encrypt the contents of the file, then we send
         # the object to the main window, which will launch it.
         thread_worker = FileProcessing(cipher=cipher, enc_proc=enc_proc, input_file=self.file_path.toLocalFile(),
                                        output_file=file_path_output, input_file_mode="rb", output_file_mode="wb",
-                                       file_size_control=True, read_block_size=read_block_size,
-                                       control_block_size=control_block_size)
+                                       read_block_size=STREAM_BYTES_READ, stream=True)
         self.thread_ready.emit(thread_worker)
 
     def _action_gen_keys_clicked(self) -> None:
         """Method for generating keys."""
         key_size = self.ui.spin_box_key_size.value()
-        private_key, public_key = Elgamal.gen_keys(key_size)
+        private_key, public_key = Elgamal.gen_keys(key_size, pool=get_default_pool(), workers=parallel.cpu_count())
 
         self.ui.line_edit_module_p.setText(hex(public_key.p)[2:])
         self.ui.line_edit_public_key_g.setText(hex(public_key.g)[2:])
@@ -219,11 +225,16 @@ class ElgamalWidget(BaseQWidget):
             QMessageBox.warning(self, "Warning!", "Module P must be in hexadecimal.")
             return
 
-        if not isprime(p):
+        if not is_prime(p):
             QMessageBox.warning(self, "Warning!", "Module P must be prime number!")
             return
 
-        private_key, public_key = Elgamal.gen_keys(p=p)
+        try:
+            private_key, public_key = Elgamal.gen_keys(p=p)
+        except ValueError as e:
+            QMessageBox.warning(self, "Warning!", e.args[0])
+            return
+
         self.ui.line_edit_module_p.setText(hex(public_key.p)[2:])
         self.ui.line_edit_public_key_g.setText(hex(public_key.g)[2:])
         self.ui.line_edit_public_key_y.setText(hex(public_key.y)[2:])
@@ -232,7 +243,8 @@ class ElgamalWidget(BaseQWidget):
     def _action_gen_p_clicked(self):
         """Method for generating prime numbers P, of given dimension"""
         key_size = self.ui.spin_box_key_size.value()
-        p = gen_prime(key_size)
+        # A safe prime allows to find the primitive element quickly.
+        p = gen_safe_prime(key_size, parallel.cpu_count())
 
         self.ui.line_edit_module_p.setText(hex(p)[2:])
 
@@ -301,3 +313,7 @@ class ElgamalWidget(BaseQWidget):
     def _file_path_changed(self, file: QUrl) -> None:
         """Method - a slot for processing a signal from the dragdrop widget to get the path to the file."""
         self.file_path = file
+
+    def _spin_box_key_size_editing_finished(self) -> None:
+        """Method - a slot for starting the background generation of groups of the selected size."""
+        get_default_pool().fill(self.ui.spin_box_key_size.value())
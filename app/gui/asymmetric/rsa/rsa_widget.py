@@ -10,18 +10,24 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QUrl
 
-from sympy import isprime
-
 from .rsa_ui import Ui_RSA
+from app.crypto import parallel
 from app.crypto.asymmetric import RSA
 from app.crypto.common import EncProc
-from app.crypto.utils import gen_prime
+from app.crypto.hybrid import Hybrid
+from app.crypto.primes import (
+    gen_primes,
+    is_prime
+)
 from app.gui.file_processing import FileProcessing
 from app.gui.widgets import (
     DragDropWidget,
     BaseQWidget
 )
-from app.gui.const import RSA_SUPPORT_EXT
+from app.gui.const import (
+    RSA_SUPPORT_EXT,
+    STREAM_BYTES_READ
+)
 
 
 class RSAWidget(BaseQWidget):
@@ -56,6 +62,11 @@ class RSAWidget(BaseQWidget):
         menu.addSeparator()
         menu.addAction("Save key", self._action_save_key_clicked)
         menu.addAction("Load key", self._action_load_key_clicked)
+        menu.addSeparator()
+        # In the hybrid mode, the files are encrypted by GOST 28147-89 with a random session key,
+        # and only the session key is encrypted by the asymmetric cipher.
+        self._action_hybrid = menu.addAction("Hybrid file encryption")
+        self._action_hybrid.setCheckable(True)
 
         self.ui.button_options.setMenu(menu)
 
@@ -86,11 +97,11 @@ class RSAWidget(BaseQWidget):
             QMessageBox.warning(self, "Warning!", "Public, private keys and module must be in hexadecimal.")
             return
 
-        private_key = RSA.PrivateKey(d, n)
+        private_key = RSA.PrivateKey(d, n, *self._get_p_q(n))
         public_key = RSA.PublicKey(e, n)
 
         try:
-            cipher = RSA(private_key, public_key)
+            cipher = RSA(private_key, public_key, workers=parallel.cpu_count())
         except (ValueError, TypeError) as e:
             QMessageBox.warning(self, "Warning!", e.args[0])
             return
@@ -105,6 +116,20 @@ class RSAWidget(BaseQWidget):
             case _:
                 pass
 
+    def _get_p_q(self, n: int) -> tuple[int, int] or tuple[()]:
+        """
+        Method for getting the entered primes P and Q, if they correspond to the module.
+
+        With P and Q the data is decrypted faster by the Chinese remainder theorem.
+        """
+        try:
+            p = int(self.ui.line_edit_p.text(), 16)
+            q = int(self.ui.line_edit_q.text(), 16)
+        except ValueError:
+            return ()
+
+        return (p, q) if p * q == n else ()
+
     def _tab_text_processing(self, cipher: ..., enc_proc: EncProc) -> None:
         """Method for encryption on the text processing tab."""
         data = self.ui.text_edit_input.toPlainText()
@@ -174,35 +199,26 @@ class RSAWidget(BaseQWidget):
         if not file_path_output:
             return
 
-        # Depending on the encryption process, the block size for
-        # reading changes. The encryption reads fewer bytes than
-        # the modulus length, and then flattens the resulting value
-        # to the modulus size. During decryption, as much as the size
-        # in bytes of the module is read, then the decrypted data
-        # is aligned to the amount that was read during encryption.
-        if enc_proc is EncProc.ENCRYPT:
-            read_block_size = cipher.num_bytes_to_encrypt
-            control_block_size = read_block_size
-        else:
-            read_block_size = cipher.num_bytes_to_decrypt
-            control_block_size = read_block_size
+        if self._action_hybrid.isChecked():
+            cipher = Hybrid(cipher, workers=parallel.cpu_count())
 
         # We create a stream object that will encrypt the contents of the file, then we send
         # the object to the main window, which will launch it.
         thread_worker = FileProcessing(cipher=cipher, enc_proc=enc_proc, input_file=self.file_path.toLocalFile(),
                                        output_file=file_path_output, input_file_mode="rb", output_file_mode="wb",
-                                       file_size_control=True, read_block_size=read_block_size,
-                                       control_block_size=control_block_size)
+                                       read_block_size=STREAM_BYTES_READ, stream=True)
         self.thread_ready.emit(thread_worker)
 
     def _action_gen_keys_clicked(self) -> None:
         """Method for generating keys."""
         key_size = self.ui.spin_box_key_size.value()
-        private_key, public_key = RSA.gen_keys(key_size)
+        private_key, public_key = RSA.gen_keys(key_size, workers=parallel.cpu_count())
 
         self.ui.line_edit_private_key.setText(hex(private_key.d)[2:])
         self.ui.line_edit_public_key.setText(hex(public_key.e)[2:])
         self.ui.line_edit_module.setText(hex(public_key.n)[2:])
+        self.ui.line_edit_p.setText(hex(private_key.p)[2:])
+        self.ui.line_edit_q.setText(hex(private_key.q)[2:])
 
     def _action_gen_keys_from_p_q_clicked(self) -> None:
         """Method for generating keys according to the entered/generated P and Q."""
@@ -217,7 +233,7 @@ class RSAWidget(BaseQWidget):
             QMessageBox.warning(self, "Warning!", "P and Q must be in hexadecimal.")
             return
 
-        if not (isprime(p) and isprime(q)):
+        if not (is_prime(p) and is_prime(q)):
             QMessageBox.warning(self, "Warning!", "P and Q must be prime numbers!")
             return
 
@@ -229,8 +245,7 @@ class RSAWidget(BaseQWidget):
     def _action_gen_p_q_clicked(self):
         """Method for generating prime numbers P and Q, of given dimension"""
         key_size = self.ui.spin_box_key_size.value()
-        p = gen_prime(key_size)
-        q = gen_prime(key_size)
+        p, q = gen_primes(key_size, 2, parallel.cpu_count())
 
         self.ui.line_edit_p.setText(hex(p)[2:])
         self.ui.line_edit_q.setText(hex(q)[2:])
@@ -262,6 +277,14 @@ class RSAWidget(BaseQWidget):
             "public_key": public_key
         }
 
+        # The primes P and Q are saved if they correspond to the module: the other parameters
+        # of decryption by the Chinese remainder theorem are calculated from them.
+        try:
+            if self._get_p_q(int(module, 16)):
+                data.update({"p": self.ui.line_edit_p.text(), "q": self.ui.line_edit_q.text()})
+        except ValueError:
+            pass
+
         try:
             with open(filename, "w") as ofile:
                 ofile.write(json.dumps(data))
@@ -298,6 +321,8 @@ class RSAWidget(BaseQWidget):
         self.ui.line_edit_module.setText(data.get("module", ""))
         self.ui.line_edit_private_key.setText(data.get("private_key", ""))
         self.ui.line_edit_public_key.setText(data.get("public_key", ""))
+        self.ui.line_edit_p.setText(data.get("p", ""))
+        self.ui.line_edit_q.setText(data.get("q", ""))
 
     def _file_path_changed(self, file: QUrl) -> None:
         """Method - a slot for processing a signal from the dragdrop widget to get the path to the file."""
@@ -3,6 +3,8 @@ from typing import Final
 # files
 MAX_CHARS_READ: Final = 1024
 MAX_BYTES_READ: Final = 64 * 64
+# Chunk size for the ciphers with the incremental interface (encryptor/decryptor)
+STREAM_BYTES_READ: Final = 1 << 20
 
 # Support file extensions
 RSA_SUPPORT_EXT: Final = "All files (*)"
@@ -1,10 +1,11 @@
 from typing import Final
 
-from .diffie_hellman import DiffieHellmanWidget
-from .shamir import ShamirWidget
+from ..widgets import LazyWidget
 
 
+# The widgets are created when their tree items are first clicked (see MainWindow).
 WIDGETS_CRYPTOPROTOCOLS: Final = (
-    DiffieHellmanWidget,
-    ShamirWidget
+    LazyWidget("Diffie-Hellman protocol", "app.gui.cryptoprotocols.diffie_hellman.diffie_hellman_widget",
+               "DiffieHellmanWidget"),
+    LazyWidget("Three-step Shamir protocol", "app.gui.cryptoprotocols.shamir.shamir_widget", "ShamirWidget")
 )
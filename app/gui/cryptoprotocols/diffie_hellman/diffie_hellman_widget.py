@@ -6,7 +6,9 @@ from PyQt6.QtWidgets import (
     QMenu
 )
 
+from app.crypto import parallel
 from app.crypto.protocols import DiffieHellman
+from app.crypto.group_pool import get_default_pool
 from .diffie_hellman_ui import Ui_DiffieHellman
 
 
@@ -35,6 +37,11 @@ class DiffieHellmanWidget(QWidget):
         self.ui.combo_box_user.currentTextChanged.connect(self._combo_box_user_text_changed)
         self.ui.button_analysis.clicked.connect(self._button_make_clicked)
 
+        # Groups of the selected size are generated in the background in advance,
+        # so that the keys are generated instantly.
+        self.ui.spin_box_key_size.editingFinished.connect(self._spin_box_key_size_editing_finished)
+        self._spin_box_key_size_editing_finished()
+
     def _button_make_clicked(self) -> None:
         """Method - a slot for processing a signal when a button is pressed."""
         if len(self._users) < 2:
@@ -93,7 +100,8 @@ class DiffieHellmanWidget(QWidget):
     def _action_gen_shared_keys_clicked(self) -> None:
         """Method for generating public keys."""
         key_size = self.ui.spin_box_key_size.value()
-        shared_keys = DiffieHellman.gen_shared_keys(key_size)
+        shared_keys = DiffieHellman.gen_shared_keys(key_size, pool=get_default_pool(),
+                                                    workers=parallel.cpu_count())
         self.ui.line_edit_public_key_g.setText(hex(shared_keys.g)[2:])
         self.ui.line_edit_public_key_p.setText(hex(shared_keys.p)[2:])
 
@@ -147,3 +155,7 @@ class DiffieHellmanWidget(QWidget):
 
         self.ui.line_edit_public_key.setText(hex(protocol.public_key.k))
         self.ui.line_edit_private_key.setText(hex(protocol.private_key.k))
+
+    def _spin_box_key_size_editing_finished(self) -> None:
+        """Method - a slot for starting the background generation of groups of the selected size."""
+        get_default_pool().fill(self.ui.spin_box_key_size.value())
@@ -1,13 +1,12 @@
 from typing import Final
 
-from .freqanalysis import FreqAnalysisWidget
-from .index_of_coincidence import ICWidget
-from .autocorrelation import AutocorrelationWidget
-from .kasiski import KasiskiWidget
+from ..widgets import LazyWidget
 
+# The widgets are created when their tree items are first clicked (see MainWindow).
 WIDGETS_CRYPTOTOOLS: Final = (
-    FreqAnalysisWidget,
-    ICWidget,
-    AutocorrelationWidget,
-    KasiskiWidget
+    LazyWidget("Frequency cryptanalysis", "app.gui.cryptotools.freqanalysis.freqanalysis_widget", "FreqAnalysisWidget"),
+    LazyWidget("Index of coincidence", "app.gui.cryptotools.index_of_coincidence.ic_widget", "ICWidget"),
+    LazyWidget("Autocorrelation method", "app.gui.cryptotools.autocorrelation.autocorrelation_widget",
+               "AutocorrelationWidget"),
+    LazyWidget("Kasiski examination", "app.gui.cryptotools.kasiski.kasiski_widget", "KasiskiWidget")
 )
@@ -1,5 +1,7 @@
 # This module contains an implementation of a class for encrypting a file with
 # a specific cipher in a separate thread.
+from functools import partial
+
 from app.crypto.common import EncProc
 from app.gui.widgets import (
     BaseQThread,
@@ -10,7 +12,7 @@ from app.gui.widgets import (
 class FileProcessing(BaseQThread):
     def __init__(self, cipher: ..., enc_proc: EncProc, input_file: str, output_file: str,
                  input_file_mode: str, output_file_mode: str, file_size_control: bool = False,
-                 read_block_size: int = 1024, control_block_size: int = 8):
+                 read_block_size: int = 1024, control_block_size: int = 8, stream: bool = False):
         """
         FileProcessing class constructor. This class is designed to encrypt
         a file in a separate stream.
@@ -31,6 +33,9 @@ class FileProcessing(BaseQThread):
                 it is also worth setting the block size (control_block_size) that will store the file size.
             read_block_size: block size in bytes to be read at a time.
             control_block_size: the size of the block that stores data about the true size of the file.
+            stream: flag responsible for using the incremental interface of the cipher ("encryptor"
+                and "decryptor"). The cipher buffers partial blocks and pads the data itself,
+                so the file size control is not needed and the file can be read in chunks of any size.
         """
         super(FileProcessing, self).__init__()
         self._cipher = cipher
@@ -42,6 +47,7 @@ class FileProcessing(BaseQThread):
         self._file_size_control = file_size_control
         self._read_block_size = read_block_size
         self._control_block_size = control_block_size
+        self._stream = stream
 
         self._is_worked = True
 
@@ -86,14 +92,32 @@ class FileProcessing(BaseQThread):
                         case _:
                             return
 
+                if self._stream:
+                    match self._enc_proc:
+                        case EncProc.ENCRYPT:
+                            context = self._cipher.encryptor()
+
+                        case EncProc.DECRYPT:
+                            context = self._cipher.decryptor()
+
+                        case _:
+                            return
+
+                    process = context.update
+                else:
+                    process = partial(self._cipher.make, enc_proc=self._enc_proc)
+
                 # We read a piece of data, encrypt it and write it to the output file,
                 # simultaneously updating the value in the progress bar.
                 while (block := input_file.read(self._read_block_size)) and self._is_worked:
-                    processed_block = self._cipher.make(block, self._enc_proc)
+                    processed_block = process(block)
                     output_file.write(processed_block)
 
                     self.pbar.emit((PBar.Commands.SET_VALUE, input_file.tell()))
 
+                if self._stream and self._is_worked:
+                    output_file.write(context.finalize())
+
                 if self._file_size_control:
                     # If the decryption mode, set the true size of the file.
                     if self._enc_proc is EncProc.DECRYPT:
@@ -1,5 +1,3 @@
-import shutil
-
 from PyQt6.QtWidgets import (
     QMainWindow,
     QTreeWidgetItem,
@@ -18,7 +16,8 @@ from .cryptotools import WIDGETS_CRYPTOTOOLS
 from .cryptoprotocols import WIDGETS_CRYPTOPROTOCOLS
 from .widgets import (
     BaseQThread,
-    PBar
+    PBar,
+    LazyWidget
 )
 
 WIDGETS_CIPHERS = {
@@ -62,7 +61,6 @@ class MainWindow(QMainWindow):
         self.ui.tree_widget.clicked.connect(self.tree_widget_item_clicked)
 
         self._load_modules()
-        self._check_dependencies()
 
     def _load_modules(self):
         # Load default modules
@@ -78,18 +76,8 @@ class MainWindow(QMainWindow):
 
             children = []
             for widget in widgets:
-                widget = widget()
-
-                # we connect the signal of each widget to the method for
-                # launching and setting the flow
-                try:
-                    widget.thread_ready.connect(self._task_start_handler)
-
-                except AttributeError:
-                    pass
-
-                self.ui.stacked_widget.addWidget(widget)
-
+                # Only a placeholder is added to the tree, the widget itself
+                # is created when the item is first clicked.
                 child = QTreeWidgetItem((widget.title,))
                 child.setIcon(0, QIcon("icons:file.png"))
                 child.setData(1, 1, widget)
@@ -100,10 +88,29 @@ class MainWindow(QMainWindow):
 
         self.ui.tree_widget.invisibleRootItem().addChildren(items)
 
+    def _create_widget(self, placeholder: LazyWidget) -> QWidget:
+        """Method for creating the widget from the placeholder and adding it to the stacked widget."""
+        widget = placeholder.load()
+
+        # we connect the signal of each widget to the method for
+        # launching and setting the flow
+        try:
+            widget.thread_ready.connect(self._task_start_handler)
+
+        except AttributeError:
+            pass
+
+        self.ui.stacked_widget.addWidget(widget)
+        return widget
+
     def tree_widget_item_clicked(self):
         item = self.ui.tree_widget.currentItem()
         widget = item.data(1, 1)
 
+        if isinstance(widget, LazyWidget):
+            widget = self._create_widget(widget)
+            item.setData(1, 1, widget)
+
         match widget:
             case QWidget():
                 self.ui.group_box_right.setTitle(item.text(0))
@@ -129,12 +136,3 @@ class MainWindow(QMainWindow):
         # bind to stop the flow when the cancel button is clicked
         self.pbar_button_cancel.clicked.connect(self._thread_file_worker.close)
         self._thread_file_worker.start()
-
-    def _check_dependencies(self):
-        """Method for checking if required programs are installed or not."""
-        programs = ("openssl",)
-
-        for program in programs:
-            if shutil.which(program) is None:
-                QMessageBox.warning(self, "Warning!",
-                                    f"{program} module not installed or not added to PATH")
@@ -1,35 +1,22 @@
 from typing import Final
 
-from .atbash import AtbashWidget
-from .scytale import ScytaleWidget
-from .polybius_square import PolybiusSquareWidget
-from .caesar import CaesarWidget
-from .cardan_grille import CardanGrilleWidget
-from .richelieu import RichelieuWidget
-from .alberti_disc import AlbertiDiscWidget
-from .gronsfeld import GronsfeldWidget
-from .vigenere import VigenereWidget
-from .playfair import PlayfairWidget
-from .hill import HillWidget
-from .vernam import VernamWidget
-from .xor import XORWidget
-from .des import DESWidget
-from .gost import GOSTWidget
+from ..widgets import LazyWidget
 
+# The widgets are created when their tree items are first clicked (see MainWindow).
 WIDGETS_SYMMETRIC: Final = (
-    AtbashWidget,
-    ScytaleWidget,
-    PolybiusSquareWidget,
-    CaesarWidget,
-    CardanGrilleWidget,
-    RichelieuWidget,
-    AlbertiDiscWidget,
-    GronsfeldWidget,
-    VigenereWidget,
-    PlayfairWidget,
-    HillWidget,
-    VernamWidget,
-    XORWidget,
-    DESWidget,
-    GOSTWidget
+    LazyWidget("Atbash", "app.gui.symmetric.atbash.atbash_widget", "AtbashWidget"),
+    LazyWidget("Scytale", "app.gui.symmetric.scytale.scytale_widget", "ScytaleWidget"),
+    LazyWidget("Polybius square", "app.gui.symmetric.polybius_square.polybius_square_widget", "PolybiusSquareWidget"),
+    LazyWidget("Caesar", "app.gui.symmetric.caesar.caesar_widget", "CaesarWidget"),
+    LazyWidget("Cardan grille", "app.gui.symmetric.cardan_grille.cardan_grille_widget", "CardanGrilleWidget"),
+    LazyWidget("Richelieu", "app.gui.symmetric.richelieu.richelieu_widget", "RichelieuWidget"),
+    LazyWidget("Alberti disc", "app.gui.symmetric.alberti_disc.alberti_disc_widget", "AlbertiDiscWidget"),
+    LazyWidget("Gronsfeld", "app.gui.symmetric.gronsfeld.gronsfeld_widget", "GronsfeldWidget"),
+    LazyWidget("Vigenere", "app.gui.symmetric.vigenere.vigenere_widget", "VigenereWidget"),
+    LazyWidget("Playfair", "app.gui.symmetric.playfair.playfair_widget", "PlayfairWidget"),
+    LazyWidget("Hill", "app.gui.symmetric.hill.hill_widget", "HillWidget"),
+    LazyWidget("Vernam", "app.gui.symmetric.vernam.vernam_widget", "VernamWidget"),
+    LazyWidget("XOR", "app.gui.symmetric.xor.xor_widget", "XORWidget"),
+    LazyWidget("DES", "app.gui.symmetric.des.des_widget", "DESWidget"),
+    LazyWidget("GOST 28147-89", "app.gui.symmetric.gost.gost_widget", "GOSTWidget")
 )
@@ -16,7 +16,7 @@ from app.crypto.symmetric import DES
 from app.crypto.common import EncProc
 from app.gui.const import (
     DES_SUPPORT_EXT,
-    MAX_BYTES_READ
+    STREAM_BYTES_READ
 )
 from app.gui.widgets import (
     DragDropWidget,
@@ -198,7 +198,7 @@ class DESWidget(BaseQWidget):
         thread_worker = FileProcessing(
             cipher=cipher, enc_proc=enc_proc, input_file=self.file_path.toLocalFile(),
             output_file=file_path_output, input_file_mode="rb", output_file_mode="wb",
-            file_size_control=True, read_block_size=MAX_BYTES_READ, control_block_size=8
+            read_block_size=STREAM_BYTES_READ, stream=True
         )
         self.thread_ready.emit(thread_worker)
 
@@ -20,7 +20,7 @@ from app.gui.widgets import (
 )
 from app.gui.const import (
     DES_SUPPORT_EXT,
-    MAX_BYTES_READ
+    STREAM_BYTES_READ
 )
 from app.gui.file_processing import FileProcessing
 
@@ -196,8 +196,7 @@ class GOSTWidget(BaseQWidget):
         # the object to the main window, which will launch it.
         thread_worker = FileProcessing(
             cipher=cipher, enc_proc=enc_proc, input_file=self.file_path.toLocalFile(), output_file=file_path_output,
-            input_file_mode="rb", output_file_mode="wb", file_size_control=True, read_block_size=MAX_BYTES_READ,
-            control_block_size=8
+            input_file_mode="rb", output_file_mode="wb", read_block_size=STREAM_BYTES_READ, stream=True
         )
         self.thread_ready.emit(thread_worker)
 
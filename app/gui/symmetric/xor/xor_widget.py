@@ -21,7 +21,7 @@ from app.gui.widgets import (
 )
 from app.gui.const import (
     XOR_SUPPORT_EXT,
-    MAX_BYTES_READ
+    STREAM_BYTES_READ
 )
 
 
@@ -119,7 +119,7 @@ class XORWidget(BaseQWidget):
         # We create a stream object that will encrypt the contents of the file, then we send
         # the object to the main window, which will launch it.
         thread_worker = FileProcessing(cipher, enc_proc, self.file_path.toLocalFile(), file_path_output,
-                                       "rb", "wb", read_block_size=MAX_BYTES_READ)
+                                       "rb", "wb", read_block_size=STREAM_BYTES_READ, stream=True)
         self.thread_ready.emit(thread_worker)
 
     def _action_gen_iv_clicked(self) -> None:
@@ -181,7 +181,7 @@ class XORWidget(BaseQWidget):
             QMessageBox.warning(self, "Warning!", e.args[0])
             return
 
-        return bytes(next(rc4) for _ in range(self.ui.spin_box_gamma_size.value())).hex()
+        return rc4.keystream(self.ui.spin_box_gamma_size.value()).hex()
 
     def _file_path_changed(self, file: QUrl) -> None:
         """Method - a slot for processing a signal from the dragdrop widget to get the path to the file."""
@@ -2,3 +2,4 @@ from .dragdrop.dragdrop import DragDropWidget
 from .pbar.pbar import PBar
 from .base_qwidget.base_qwidget import BaseQWidget
 from .base_qthread.base_qthread import BaseQThread
+from .lazy_widget.lazy_widget import LazyWidget
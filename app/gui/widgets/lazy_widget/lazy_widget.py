@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from importlib import import_module
+
+from PyQt6.QtWidgets import QWidget
+
+
+@dataclass(frozen=True)
+class LazyWidget:
+    """
+    Placeholder of a widget in the tree of the main window.
+
+    The module of the widget (and its heavy dependencies: pyqtgraph, SciPy, SymPy)
+    is imported only when the widget is created, i.e. when its tree item is first clicked.
+
+    Args:
+        title: title of the widget in the tree (must match the title of the widget).
+        module: absolute name of the module containing the widget class.
+        name: name of the widget class.
+    """
+    title: str
+    module: str
+    name: str
+
+    def load(self) -> QWidget:
+        """Method for importing the module of the widget and creating the widget."""
+        return getattr(import_module(self.module), self.name)()
@@ -0,0 +1,49 @@
+# Benchmark of the scaling of the RSA and Elgamal file encryption with the number of processes,
+# compared with the hybrid encryption (GOST 28147-89 with the session key wrapped by the cipher).
+import argparse
+from random import randbytes
+
+from app.crypto import parallel
+from app.crypto.asymmetric import RSA, Elgamal
+from app.crypto.hybrid import Hybrid
+
+from .common import throughput, format_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel asymmetric encryption scaling benchmark.")
+    parser.add_argument("--size", type=int, default=256 * 1024, help="size of the input data in bytes")
+    parser.add_argument("--bits", type=int, default=1024, help="size of the keys (of p and q for RSA)")
+    parser.add_argument("--max-workers", type=int, default=parallel.cpu_count(), help="maximum number of processes")
+    parser.add_argument("--repeat", type=int, default=1, help="number of repetitions")
+    args = parser.parse_args()
+
+    data = randbytes(args.size)
+    keys = ((RSA, RSA.gen_keys(args.bits)), (Elgamal, Elgamal.gen_keys(args.bits)))
+
+    print(f"{args.bits} bits, {format_size(args.size)}")
+    for cipher_cls, (private_key, public_key) in keys:
+        base = None
+        workers = 1
+        while workers <= args.max_workers:
+            cipher = cipher_cls(private_key, public_key, workers=workers)
+
+            def encrypt():
+                encryptor = cipher.encryptor()
+                encryptor.update(data)
+                encryptor.finalize()
+
+            result = throughput(encrypt, len(data), args.repeat)
+            base = base or result
+            print(f"  {cipher_cls.__name__:7}  workers: {workers:3}  {result:8.3f} MB/s  (x{result / base:.1f})")
+            workers *= 2
+
+        hybrid = Hybrid(cipher_cls(private_key, public_key))
+        # The first call imports the symmetric cipher.
+        hybrid.encrypt(b"")
+        result = throughput(lambda: hybrid.encrypt(data), len(data), args.repeat)
+        print(f"  {cipher_cls.__name__:7}  hybrid:       {result:8.3f} MB/s  (x{result / base:.1f})")
+
+
+if __name__ == "__main__":
+    main()
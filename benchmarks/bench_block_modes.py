@@ -0,0 +1,55 @@
+# Benchmark of the block cipher mode layer: scaling of the processing time with
+# the size of the data. The identity transformation is used, so only the cost of
+# splitting the input into blocks and assembling the output is measured.
+import argparse
+from random import randbytes
+
+from app.crypto.common import EncProc
+from app.crypto.symmetric import block_modes
+
+from .common import measure, format_size
+
+
+def identity(block: int, enc_proc: EncProc) -> int:
+    return block
+
+
+def legacy_cbc(data: bytes, vector: int) -> bytes:
+    """Assembling the output by concatenating immutable bytes (as before)."""
+    processed_data = bytes()
+
+    for pos in range(0, len(data), 8):
+        block = int.from_bytes(data[pos:pos + 8], "little")
+        vector = identity(block ^ vector, EncProc.ENCRYPT)
+        processed_data += vector.to_bytes(8, "little")
+
+    return processed_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Block cipher mode layer scaling benchmark.")
+    parser.add_argument("--max-size", type=int, default=100 * 1024 * 1024,
+                        help="maximum size of the input data in bytes")
+    parser.add_argument("--legacy-max-size", type=int, default=1024 * 1024,
+                        help="maximum size of the input data for the legacy implementation")
+    parser.add_argument("--repeat", type=int, default=1, help="number of repetitions")
+    args = parser.parse_args()
+
+    print(f"{'size':>10}  {'cbc, s':>10}  {'ns/byte':>8}  {'legacy, s':>10}  {'ns/byte':>8}")
+
+    size = 1024
+    while size <= args.max_size:
+        data = randbytes(size)
+        elapsed = measure(lambda: block_modes.cbc(identity, data, EncProc.ENCRYPT, 0), args.repeat)
+        line = f"{format_size(size):>10}  {elapsed:10.4f}  {elapsed / size * 1e9:8.1f}"
+
+        if size <= args.legacy_max_size:
+            elapsed = measure(lambda: legacy_cbc(data, 0), args.repeat)
+            line += f"  {elapsed:10.4f}  {elapsed / size * 1e9:8.1f}"
+
+        print(line)
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
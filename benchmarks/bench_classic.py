@@ -0,0 +1,32 @@
+# Benchmark of the classical substitution ciphers translating the text by the
+# precomputed tables (Caesar, Atbash, Gronsfeld, Vigenère).
+import argparse
+
+from app.crypto.symmetric import Atbash, Caesar, Gronsfeld, Vigenere
+
+from .common import throughput
+
+TEXTS = {"cp1251": "Шифрование используется для скрытия информации. In cryptography, encryption is the process. ",
+         "unicode": "Шифрование — это 😀 способ скрытия информации. Encryption → encoding. "}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classical ciphers throughput benchmark.")
+    parser.add_argument("--size", type=int, default=16 * 1024 * 1024, help="number of characters of the text")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    ciphers = {"Caesar": Caesar(5), "Atbash": Atbash(), "Gronsfeld": Gronsfeld("31415"),
+               "Vigenere": Vigenere("КлючKey")}
+
+    for name, sample in TEXTS.items():
+        text = (sample * (args.size // len(sample) + 1))[:args.size]
+        print(f"{name} text: {args.size} characters")
+
+        for cipher_name, cipher in ciphers.items():
+            result = throughput(lambda: cipher.make(text), len(text), args.repeat)
+            print(f"  {cipher_name:9}  {result:9.3f} M chars/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Benchmark of the DES backends: reference (bit strings) and table-driven.
+import argparse
+from random import randbytes
+
+from app.crypto.symmetric import DES
+
+from .common import bench_backends, format_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DES throughput benchmark.")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="size of the input data in bytes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    print(f"DES, {format_size(args.size)}")
+    bench_backends(DES, randbytes(7).hex(), randbytes(8).hex(), randbytes(args.size), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
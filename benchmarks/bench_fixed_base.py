@@ -0,0 +1,69 @@
+# Benchmark of the exponentiation with a fixed base (app.crypto.fixed_base) compared
+# with the built-in pow, and of the Elgamal encryption that uses it.
+import argparse
+from random import (
+    Random,
+    randbytes
+)
+
+from app.crypto import fixed_base
+from app.crypto.asymmetric import Elgamal
+from app.crypto.groups import Group
+
+from .common import measure, throughput, format_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fixed-base exponentiation benchmark.")
+    parser.add_argument("--bits", type=int, nargs="+", default=[1024, 2048, 3072], help="sizes of the module")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="size of the data encrypted by Elgamal")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    rand = Random(0)
+
+    print("Exponentiation")
+    for bits in args.bits:
+        m = rand.getrandbits(bits) | 1 | (1 << (bits - 1))
+        g = rand.getrandbits(bits)
+        exps = [rand.getrandbits(bits) for _ in range(10)]
+
+        fb = fixed_base.FixedBase(g, m, precompute_after=0)
+        build_time = measure(lambda: fb._build_table(), 1)
+        fb.pow(1)
+
+        builtin_time = measure(lambda: [pow(g, exp, m) for exp in exps], args.repeat) / len(exps)
+        table_time = measure(lambda: [fb.pow(exp) for exp in exps], args.repeat) / len(exps)
+
+        print(f"  {bits:5} bits  pow: {builtin_time * 1000:8.2f} ms  table (w={fb.window}): "
+              f"{table_time * 1000:8.2f} ms  (x{builtin_time / table_time:.1f})  build: {build_time * 1000:.0f} ms")
+
+    # A fixed 1024-bit safe prime group (RFC 2409, Oakley group 2), so that no time is spent on generation.
+    p = int("FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DD"
+            "EF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED"
+            "EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE65381FFFFFFFFFFFFFFFF", 16)
+    group = Group(p, 2)
+    x = rand.randrange(2, p - 1)
+    private_key = Elgamal.PrivateKey(x, p)
+    public_key = Elgamal.PublicKey(pow(group.g, x, p), group.g, p)
+    data = randbytes(args.size)
+
+    print(f"Elgamal (1024 bits), {format_size(args.size)}")
+    for name, max_table_size in (("pow", 0), ("table", fixed_base.MAX_TABLE_SIZE)):
+        fixed_base.fixed_base.cache_clear()
+        saved, fixed_base.MAX_TABLE_SIZE = fixed_base.MAX_TABLE_SIZE, max_table_size
+        cipher = Elgamal(private_key, public_key)
+
+        def encrypt():
+            encryptor = cipher.encryptor()
+            encryptor.update(data)
+            encryptor.finalize()
+
+        print(f"  {name:5}: {throughput(encrypt, len(data), args.repeat):8.3f} MB/s")
+        fixed_base.MAX_TABLE_SIZE = saved
+
+    fixed_base.fixed_base.cache_clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Benchmark of the import time of the packages (python -X importtime).
+# The budget of "import app.crypto" is checked by tests/test_import_time.py.
+import argparse
+import re
+import subprocess
+import sys
+
+MODULES = (
+    "app.crypto",
+    "app.crypto.symmetric.xor",
+    "app.crypto.symmetric.des",
+    "app.crypto.symmetric.hill",
+    "app.crypto.asymmetric.rsa",
+    "app.crypto.asymmetric.elgamal",
+    "app.crypto.tools.autocorrelation",
+    "app.cli"
+)
+
+
+def import_time(module: str) -> float:
+    """Function for getting the cumulative import time of a module in a new interpreter in ms."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", result.stderr, re.M)
+    return int(match.group(1)) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions")
+    args = parser.parse_args()
+
+    for module in MODULES:
+        result = min(import_time(module) for _ in range(args.repeat))
+        print(f"  {module:36}  {result:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
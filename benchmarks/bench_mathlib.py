@@ -0,0 +1,69 @@
+# Benchmark of the big-integer backends of app.crypto.mathlib: modular exponentiation
+# and the modular inverse for operands of 512-4096 bits, and of the operations of
+# ModContext compared with separate calls of the functions.
+import argparse
+from random import Random
+
+from app.crypto import mathlib
+from app.crypto.primes import gen_prime
+
+from .common import measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Big-integer arithmetic benchmark.")
+    parser.add_argument("--bits", type=int, nargs="+", default=[512, 1024, 2048, 3072, 4096],
+                        help="sizes of the operands")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    parser.add_argument("--count", type=int, default=64, help="number of inverses found at once")
+    args = parser.parse_args()
+
+    rand = Random(0)
+    backends = mathlib.available_backends()
+    previous = mathlib.get_backend()
+
+    for name, fn in (("fpow", lambda a, m: mathlib.fpow(a, m - 2, m)),
+                     ("modinv", lambda a, m: mathlib.modinv(a, m))):
+        print(name)
+        for bits in args.bits:
+            a = rand.getrandbits(bits)
+            m = rand.getrandbits(bits) | 1 | (1 << (bits - 1))
+            while mathlib.ext_gcd(a, m).gcd != 1:
+                a += 1
+
+            results = []
+            for backend in backends:
+                mathlib.set_backend(backend)
+                results.append(measure(lambda: fn(a, m), args.repeat))
+
+            print(f"  {bits:5} bits" + "".join(f"  {backend.name.lower()}: {result * 1000:9.3f} ms"
+                                               for backend, result in zip(backends, results))
+                  + f"  (x{results[0] / min(results):.1f})")
+
+    mathlib.set_backend(previous)
+
+    print(f"ModContext ({mathlib.get_backend().name.lower()})")
+    for bits in args.bits:
+        # A prime module, so that all numbers have inverses.
+        m = gen_prime(bits)
+        ctx = mathlib.ModContext(m)
+        values = [rand.randrange(2, m) for _ in range(args.count)]
+        a, x, b = values[:3]
+
+        rows = (
+            ("pow", lambda: mathlib.fpow(a, x, m), lambda: ctx.pow(a, x)),
+            (f"{args.count} inverses", lambda: [mathlib.modinv(v, m) for v in values], lambda: ctx.batch_inv(values)),
+            # The Elgamal decryption: b * (a^x)^-1 and b * a^(m-1-x).
+            ("b / a^x", lambda: mathlib.modinv(mathlib.fpow(a, x, m), m) * b % m,
+             lambda: ctx.mul(ctx.pow(a, m - 1 - x), b)),
+        )
+
+        for name, separate, context in rows:
+            separate_time = measure(separate, args.repeat)
+            context_time = measure(context, args.repeat)
+            print(f"  {bits:5} bits  {name:14}  functions: {separate_time * 1000:9.3f} ms"
+                  f"  context: {context_time * 1000:9.3f} ms  (x{separate_time / context_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Benchmark of the scaling of DES and GOST 28147-89 in CTR mode with the number of processes.
+import argparse
+from random import randbytes
+
+from app.crypto import parallel
+from app.crypto.symmetric import DES, GOST
+
+from .common import throughput, format_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel CTR mode scaling benchmark.")
+    parser.add_argument("--size", type=int, default=256 * 1024 * 1024, help="size of the input data in bytes")
+    parser.add_argument("--max-workers", type=int, default=parallel.cpu_count(), help="maximum number of processes")
+    parser.add_argument("--repeat", type=int, default=1, help="number of repetitions")
+    args = parser.parse_args()
+
+    data = randbytes(args.size)
+    iv = randbytes(8).hex()
+
+    print(f"CTR, {format_size(args.size)}")
+    for cipher_cls, key in ((DES, randbytes(7).hex()), (GOST, randbytes(32).hex())):
+        base = None
+        workers = 1
+        while workers <= args.max_workers:
+            cipher = cipher_cls(key, iv, cipher_cls.EncMode.CTR, workers=workers)
+            # The first call starts the processes of the pool.
+            cipher.encrypt(data[:4 * parallel.MIN_CHUNK_SIZE])
+
+            result = throughput(lambda: cipher.encrypt(data), len(data), args.repeat)
+            base = base or result
+            print(f"  {cipher_cls.__name__:4}  workers: {workers:3}  {result:8.3f} MB/s  (x{result / base:.1f})")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Benchmark of the generation of primes: the in-process engine (app.crypto.primes)
+# compared with the generation by the openssl subprocess (the previous implementation).
+# With --workers, the parallel search is measured in addition to the sequential one.
+import argparse
+import shutil
+import statistics
+import subprocess
+import time
+from typing import Callable
+
+from app.crypto import primes
+
+
+def openssl_prime(bits: int, safe: bool = False) -> int:
+    """Function for generating a prime by the openssl subprocess."""
+    command = ["openssl", "prime", "-generate", "-bits", str(bits)] + (["-safe"] if safe else [])
+    return int(subprocess.run(command, capture_output=True, check=True).stdout)
+
+
+def median_time(fn: Callable[[], object], repeat: int) -> float:
+    """
+    Function for measuring the median execution time of a function in seconds.
+
+    The generation time of primes is random, so the median is used instead of the best time.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prime generation benchmark.")
+    parser.add_argument("--bits", type=int, nargs="+", default=[512, 1024, 2048], help="sizes of the primes")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions")
+    parser.add_argument("--safe", action="store_true", help="generate safe primes")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes of the parallel search")
+    args = parser.parse_args()
+
+    has_openssl = shutil.which("openssl") is not None
+    gen = primes.gen_safe_prime if args.safe else primes.gen_prime
+
+    print("Safe primes" if args.safe else "Primes")
+    for bits in args.bits:
+        result = median_time(lambda: gen(bits), args.repeat)
+        line = f"  {bits:5} bits  engine: {result * 1000:10.1f} ms"
+
+        if args.workers > 1:
+            parallel_result = median_time(lambda: gen(bits, args.workers), args.repeat)
+            line += f"  {args.workers} workers: {parallel_result * 1000:10.1f} ms  (x{result / parallel_result:.2f})"
+
+        if has_openssl:
+            openssl_result = median_time(lambda: openssl_prime(bits, args.safe), args.repeat)
+            line += f"  openssl: {openssl_result * 1000:10.1f} ms  (x{openssl_result / result:.2f})"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
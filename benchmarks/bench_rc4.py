@@ -0,0 +1,31 @@
+# Benchmark of the RC4 generator: the bulk keystream compared to getting the numbers
+# one by one with next, and the stream cipher mode.
+import argparse
+from random import randbytes
+
+from app.crypto.prngs import RC4
+
+from .common import throughput, format_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RC4 keystream throughput benchmark.")
+    parser.add_argument("--size", type=int, default=4 * 1024 * 1024, help="size of the keystream in bytes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    key = randbytes(16).hex()
+    data = randbytes(args.size)
+
+    rc4 = RC4(key)
+    single = throughput(lambda: bytes(next(rc4) for _ in range(args.size)), args.size, args.repeat)
+    bulk = throughput(lambda: rc4.keystream(args.size), args.size, args.repeat)
+    stream = throughput(lambda: rc4.encryptor().update(data), args.size, args.repeat)
+
+    print(f"RC4: {format_size(args.size)}")
+    print(f"  next: {single:8.3f} MB/s  keystream: {bulk:8.3f} MB/s  (x{bulk / single:.1f})  "
+          f"stream cipher: {stream:8.3f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Benchmark of the startup time of the GUI: the time from the start of the
+# program to the first paint of the main window (see app/__main__.py).
+#
+# By default, Qt is started with the "offscreen" platform, so no display is needed.
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+STARTUP_TIMING_ENV = "CRYPTO_METHODS_STARTUP_TIMING"
+
+
+def run_app() -> tuple[float, float]:
+    """Function for starting the application once. Returns the time to the first paint and the total time in ms."""
+    env = dict(os.environ, **{STARTUP_TIMING_ENV: "1"})
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-m", "app"], env=env, capture_output=True, text=True, check=True)
+    total = (time.perf_counter() - start) * 1000
+
+    match = re.search(r"Time to first paint: ([\d.]+) ms", result.stderr)
+    if match is None:
+        raise RuntimeError(f"The application did not report the startup time:\n{result.stderr}")
+
+    return float(match.group(1)), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI startup time benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions")
+    args = parser.parse_args()
+
+    results = [run_app() for _ in range(args.repeat)]
+
+    first_paint = min(result[0] for result in results)
+    total = min(result[1] for result in results)
+    print(f"Time to first paint: {first_paint:8.1f} ms  (process lifetime: {total:8.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
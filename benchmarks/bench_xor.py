@@ -0,0 +1,58 @@
+# Benchmark of the XOR and Vernam ciphers: XOR of the whole buffer with the repeated
+# key compared to the byte-by-byte loop, and the Vernam cipher with a pad file.
+import argparse
+import os
+import tempfile
+from random import randbytes
+
+from app.crypto.symmetric import XOR, Vernam
+
+from .common import throughput, format_size
+
+
+def _xor_loop(data: bytes, key: bytes) -> bytes:
+    """Byte-by-byte XOR with the key (the previous implementation)."""
+    data_bytes = bytearray(data)
+    for i in range(len(data_bytes)):
+        data_bytes[i] ^= key[i % len(key)]
+
+    return bytes(data_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="XOR/Vernam throughput benchmark.")
+    parser.add_argument("--size", type=int, default=64 * 1024 * 1024, help="size of the input data in bytes")
+    parser.add_argument("--loop-size", type=int, default=1024 * 1024,
+                        help="size of the input data for the byte-by-byte loop in bytes")
+    parser.add_argument("--file-size", type=int, default=256 * 1024 * 1024,
+                        help="size of the file encrypted with the pad file in bytes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    data = randbytes(args.size)
+    loop_data = data[:args.loop_size]
+
+    print(f"bulk: {format_size(args.size)}, loop: {format_size(args.loop_size)}")
+    xor_key = randbytes(7)
+    vernam_key = randbytes(args.size)
+
+    for name, cipher, key in (("XOR", XOR(xor_key.hex()), xor_key),
+                              ("Vernam", Vernam(vernam_key.hex()), vernam_key)):
+        loop = throughput(lambda: _xor_loop(loop_data, key), len(loop_data), args.repeat)
+        bulk = throughput(lambda: cipher.encrypt(data), len(data), args.repeat)
+        print(f"  {name:6}  loop: {loop:9.3f} MB/s  bulk: {bulk:9.3f} MB/s  (x{bulk / loop:.1f})")
+
+    print(f"Vernam, pad file: {format_size(args.file_size)}")
+    with tempfile.TemporaryDirectory() as directory:
+        pad_path, input_path, output_path = (os.path.join(directory, name) for name in ("pad", "input", "output"))
+
+        pad = throughput(lambda: Vernam.gen_pad_file(pad_path, args.file_size), args.file_size, 1)
+        Vernam.gen_pad_file(input_path, args.file_size)
+        process = throughput(lambda: Vernam.process_file(input_path, output_path, pad_path),
+                             args.file_size, args.repeat)
+
+        print(f"  pad generation: {pad:9.3f} MB/s  encryption: {process:9.3f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# This module contains helpers shared by the benchmarks.
+#
+# The benchmarks are run from the root of the project as modules, for example:
+#   python -m benchmarks.bench_des
+import time
+from typing import Callable
+
+
+def measure(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Function for measuring the best execution time of a function in seconds."""
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def throughput(fn: Callable[[], object], size: int, repeat: int = 3) -> float:
+    """Function for measuring the throughput of a function in MB/s."""
+    return size / measure(fn, repeat) / 1_000_000
+
+
+def format_size(size: int) -> str:
+    """Function for formatting the size in bytes in a human-readable form."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:g} {unit}"
+
+        size /= 1024
+
+
+def bench_backends(cipher_cls, key: str, iv: str, data: bytes, repeat: int = 3) -> None:
+    """Function for printing the throughput of each backend of a block cipher in each mode."""
+    for enc_mode in cipher_cls.EncMode:
+        results = []
+        for backend in cipher_cls.Backend:
+            cipher = cipher_cls(key, iv, enc_mode, backend=backend)
+            results.append(throughput(lambda: cipher.encrypt(data), len(data), repeat))
+
+        speedup = results[-1] / results[0]
+        print(f"  {enc_mode.name:4}" + "".join(f"  {backend.name.lower()}: {result:8.3f} MB/s"
+                                               for backend, result in zip(cipher_cls.Backend, results))
+              + f"  (x{speedup:.1f})")
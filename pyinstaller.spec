@@ -1,6 +1,8 @@
 # -*- mode: python ; coding: utf-8 -*-
 
 
+from PyInstaller.utils.hooks import collect_submodules
+
 block_cipher = None
 
 datas = [
@@ -19,6 +21,9 @@ hiddenimports = [
     "pyqtgraph.imageview.ImageViewTemplate_pyqt6"
 ]
 
+# The widgets of the main window are imported by name when they are first opened.
+hiddenimports += collect_submodules("app.gui")
+
 a = Analysis(['app\\__main__.py'],
              pathex=[],
              binaries=[],
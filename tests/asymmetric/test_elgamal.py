@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from app.crypto.asymmetric import Elgamal
@@ -28,3 +30,61 @@ class TestElgamal:
         decrypted_data = cipher.decrypt(encrypted_data)
 
         assert data == decrypted_data
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\x00" * 200,
+    bytes(range(256)) * 2
+])
+def test_stream(data):
+    private_key, public_key = Elgamal.gen_keys(512)
+    cipher = Elgamal(private_key, public_key)
+
+    encryptor = cipher.encryptor()
+    encrypted_data = b"".join(encryptor.update(data[pos:pos + 100])
+                              for pos in range(0, len(data), 100)) + encryptor.finalize()
+
+    assert len(encrypted_data) % cipher.num_bytes_to_decrypt == 0
+
+    decryptor = cipher.decryptor()
+    decrypted_data = b"".join(decryptor.update(encrypted_data[pos:pos + 100])
+                              for pos in range(0, len(encrypted_data), 100)) + decryptor.finalize()
+
+    assert decrypted_data == data
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_blocks(workers):
+    private_key, public_key = Elgamal.gen_keys(512)
+    cipher = Elgamal(private_key, public_key, workers=workers)
+
+    data = bytes(range(256)) * 40
+    blocks = [data[pos:pos + cipher.num_bytes_to_encrypt] for pos in range(0, len(data), cipher.num_bytes_to_encrypt)]
+
+    # The blocks are read lazily from a generator.
+    encrypted_blocks = list(cipher.encrypt_blocks(block for block in blocks))
+    assert len(encrypted_blocks) == len(blocks)
+    assert all(len(block) == cipher.num_bytes_to_decrypt for block in encrypted_blocks)
+
+    decrypted_blocks = list(cipher.decrypt_blocks(encrypted_blocks))
+    assert [block.rstrip(b"\x00") for block in decrypted_blocks] == [block.rstrip(b"\x00") for block in blocks]
+
+    # The incremental interface processes the blocks of each chunk in parallel.
+    encryptor = cipher.encryptor()
+    encrypted_data = encryptor.update(data) + encryptor.finalize()
+    decryptor = cipher.decryptor()
+    assert decryptor.update(encrypted_data) + decryptor.finalize() == data
+
+
+@pytest.mark.parametrize("key_length", [100, 521])
+def test_unaligned_modulus(key_length):
+    private_key, public_key = Elgamal.gen_keys(key_length)
+    assert public_key.p.bit_length() % 8 != 0
+
+    cipher = Elgamal(private_key, public_key)
+    data = os.urandom(cipher.num_bytes_to_encrypt)
+
+    encrypted_data = cipher.encrypt(data)
+    assert len(encrypted_data) == cipher.num_bytes_to_decrypt
+    assert cipher.decrypt(encrypted_data) == data
@@ -28,3 +28,75 @@ class TestRSA:
         decrypted_data = cipher.decrypt(encrypted_data)
 
         assert data == decrypted_data
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\x00" * 200,
+    bytes(range(256)) * 2
+])
+def test_stream(data):
+    private_key, public_key = RSA.gen_keys(512)
+    cipher = RSA(private_key, public_key)
+
+    encryptor = cipher.encryptor()
+    encrypted_data = b"".join(encryptor.update(data[pos:pos + 100])
+                              for pos in range(0, len(data), 100)) + encryptor.finalize()
+
+    assert len(encrypted_data) % cipher.num_bytes_to_decrypt == 0
+
+    decryptor = cipher.decryptor()
+    decrypted_data = b"".join(decryptor.update(encrypted_data[pos:pos + 100])
+                              for pos in range(0, len(encrypted_data), 100)) + decryptor.finalize()
+
+    assert decrypted_data == data
+
+
+@pytest.mark.parametrize("key_length", [512, 1024])
+def test_crt(key_length):
+    private_key, public_key = RSA.gen_keys(key_length)
+    p, q = private_key.p, private_key.q
+
+    assert p * q == private_key.n
+    assert private_key.dp == private_key.d % (p - 1)
+    assert private_key.dq == private_key.d % (q - 1)
+    assert private_key.qinv * q % p == 1
+
+    data = 0x435254 * 1_000_000_007
+    encrypted_data = RSA(private_key, public_key).encrypt(data)
+
+    # Keys with only (d, n), with (d, n, p, q) and with all the parameters give the same result.
+    for key in (RSA.PrivateKey(private_key.d, private_key.n),
+                RSA.PrivateKey(private_key.d, private_key.n, p, q),
+                private_key):
+        assert RSA(key, public_key).decrypt(encrypted_data) == data
+
+
+def test_crt_error_value():
+    private_key, public_key = RSA.gen_keys(512)
+
+    with pytest.raises(ValueError):
+        RSA(RSA.PrivateKey(private_key.d, private_key.n, private_key.p, private_key.q + 2), public_key)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_blocks(workers):
+    private_key, public_key = RSA.gen_keys(512)
+    cipher = RSA(private_key, public_key, workers=workers)
+
+    data = bytes(range(256)) * 40
+    blocks = [data[pos:pos + cipher.num_bytes_to_encrypt] for pos in range(0, len(data), cipher.num_bytes_to_encrypt)]
+
+    # The blocks are read lazily from a generator.
+    encrypted_blocks = list(cipher.encrypt_blocks(block for block in blocks))
+    assert len(encrypted_blocks) == len(blocks)
+    assert all(len(block) == cipher.num_bytes_to_decrypt for block in encrypted_blocks)
+
+    decrypted_blocks = list(cipher.decrypt_blocks(encrypted_blocks))
+    assert [block.rstrip(b"\x00") for block in decrypted_blocks] == [block.rstrip(b"\x00") for block in blocks]
+
+    # The incremental interface processes the blocks of each chunk in parallel.
+    encryptor = cipher.encryptor()
+    encrypted_data = encryptor.update(data) + encryptor.finalize()
+    decryptor = cipher.decryptor()
+    assert decryptor.update(encrypted_data) + decryptor.finalize() == data
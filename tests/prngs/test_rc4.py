@@ -0,0 +1,114 @@
+import pytest
+
+from app.crypto.prngs import RC4, RC4Checkpoints
+
+
+# Test vectors of RFC 6229 (the first 16 bytes of the keystream).
+@pytest.mark.parametrize("key,keystream", [
+    ("0102030405", "b2396305f03dc027ccc3524a0a1118a8"),
+    ("01020304050607", "293f02d47f37c9b633f2af5285feb46b"),
+    ("0102030405060708", "97ab8a1bf0afb96132f2f67258da15a8")
+])
+def test_keystream(key, keystream):
+    assert RC4(key).keystream(16).hex() == keystream
+
+
+def test_keystream_matches_next():
+    rc4 = RC4("8d380efc717b90")
+    expected = bytes(next(rc4) for _ in range(3000))
+
+    rc4 = RC4("8d380efc717b90")
+    buffer = bytearray(1000)
+    assert rc4.readinto(buffer) == 1000
+    assert bytes(buffer) + rc4.keystream(1999) + bytes([next(rc4)]) == expected
+
+
+def test_xor_into():
+    data = bytes(range(256)) * 10
+    keystream = RC4("8d380efc717b90").keystream(len(data))
+
+    buffer = bytearray(data)
+    assert RC4("8d380efc717b90").xor_into(memoryview(buffer)) == len(data)
+    assert bytes(buffer) == bytes(a ^ b for a, b in zip(data, keystream))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_stream(chunk_size):
+    cipher = RC4("8d380efc717b90")
+    data = bytes(range(256)) * 3
+
+    encryptor = cipher.encryptor()
+    encrypted_data = b"".join(encryptor.update(data[pos:pos + chunk_size])
+                              for pos in range(0, len(data), chunk_size)) + encryptor.finalize()
+
+    assert encrypted_data == bytes(a ^ b for a, b in zip(data, RC4("8d380efc717b90").keystream(len(data))))
+
+    decryptor = cipher.decryptor()
+    assert decryptor.update(encrypted_data) + decryptor.finalize() == data
+
+
+def test_keystream_error_size():
+    with pytest.raises(ValueError):
+        RC4("8d380efc717b90", 9).keystream(10)
+
+
+def test_seek():
+    keystream = RC4("8d380efc717b90").keystream(5000)
+
+    rc4 = RC4("8d380efc717b90")
+    for offset in (100, 4000, 0, 4999, 2500):
+        rc4.seek(offset)
+        assert rc4.position == offset
+        assert rc4.keystream(1) == keystream[offset:offset + 1]
+
+    with pytest.raises(ValueError):
+        rc4.seek(-1)
+
+
+@pytest.mark.parametrize("size,interval,count", [
+    (5000, 1000, 6),
+    (4999, 1000, 5),
+    (100, 1000, 1)
+])
+def test_checkpoints(tmp_path, size, interval, count):
+    keystream = RC4("8d380efc717b90").keystream(size)
+
+    checkpoints = RC4Checkpoints.build(RC4("8d380efc717b90"), size, interval)
+    assert len(checkpoints) == count
+
+    checkpoints.save(tmp_path / "rc4.idx")
+    checkpoints = RC4Checkpoints.load(tmp_path / "rc4.idx")
+    assert checkpoints.interval == interval
+    assert len(checkpoints) == count
+
+    rc4 = RC4("8d380efc717b90")
+    for offset in (size - 1, size // 2, 1, size - 1):
+        rc4.seek(offset, checkpoints)
+        assert rc4.keystream(1) == keystream[offset:offset + 1]
+
+    # The state is restored from the checkpoint, only the bytes after it are generated.
+    rc4 = RC4("8d380efc717b90")
+    generated = []
+    readinto = rc4.readinto
+    rc4.readinto = lambda buffer: generated.append(readinto(buffer)) or generated[-1]
+
+    rc4.seek(size - 1, checkpoints)
+    assert sum(generated) == (size - 1) % interval
+
+
+def test_checkpoints_error_value(tmp_path):
+    checkpoints = RC4Checkpoints.build(RC4("8d380efc717b90"), 1000, 100)
+
+    with pytest.raises(ValueError):
+        RC4("4f1fbcd2a58a35").seek(500, checkpoints)
+
+    path = tmp_path / "rc4.idx"
+    checkpoints.save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        RC4Checkpoints.load(path)
+
+    path.write_bytes(b"RC4")
+    with pytest.raises(ValueError):
+        RC4Checkpoints.load(path)
@@ -0,0 +1,36 @@
+import pytest
+
+from app.crypto.symmetric import block_modes, DES
+from app.crypto.common import EncProc
+
+
+@pytest.mark.parametrize("mode_fn", [block_modes.cbc, block_modes.cfb, block_modes.ofb])
+@pytest.mark.parametrize("size", [8, 64, 1000])
+def test_mode_round_trip(mode_fn, size):
+    cipher = DES("8d380efc717b90")
+    data = bytes(i % 251 for i in range(size))
+
+    encrypted_data, vector = mode_fn(cipher._transform, data, EncProc.ENCRYPT, 0x0123456789ABCDEF)
+    decrypted_data, _ = mode_fn(cipher._transform, encrypted_data, EncProc.DECRYPT, 0x0123456789ABCDEF)
+
+    assert len(encrypted_data) == -(-size // 8) * 8
+    assert decrypted_data[:size] == data
+
+
+def test_ecb_unaligned_input():
+    cipher = DES("8d380efc717b90")
+
+    assert block_modes.ecb(cipher._transform, b"\x01\x02\x03", EncProc.ENCRYPT) == \
+        block_modes.ecb(cipher._transform, b"\x01\x02\x03" + b"\x00" * 5, EncProc.ENCRYPT)
+
+
+def test_chained_vector():
+    cipher = DES("8d380efc717b90")
+    data = bytes(range(64))
+
+    whole, vector = block_modes.cbc(cipher._transform, data, EncProc.ENCRYPT, 1)
+    first, first_vector = block_modes.cbc(cipher._transform, data[:32], EncProc.ENCRYPT, 1)
+    second, second_vector = block_modes.cbc(cipher._transform, data[32:], EncProc.ENCRYPT, first_vector)
+
+    assert whole == first + second
+    assert vector == second_vector
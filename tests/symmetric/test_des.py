@@ -2,13 +2,15 @@ import pytest
 
 from app.crypto.symmetric import DES
 from app.crypto.common import EncProc
+from app.crypto import parallel
 
 
 @pytest.mark.parametrize("data,key,iv,enc_mode", [
     ("Hello, World! Hello,😱 World! Hello, World!", "8d380efc717b90", "f356687d1989b70b", DES.EncMode.CFB),
     ("Пример, Мир! Пример, 🥹 Мир! Пример, Мир!", "aa322b4e5ff2ab", "9b1cba443c565447", DES.EncMode.ECB),
     ("Привет, World! 🥶 Привет, World! Привет, World!", "4f1fbcd2a58a35", "ee9cf2f264955156", DES.EncMode.CBC),
-    ("Hello, World! Hello,😱 World! Hello, World!", "8d380efc717b90", "f356687d1989b70b", DES.EncMode.OFB)
+    ("Hello, World! Hello,😱 World! Hello, World!", "8d380efc717b90", "f356687d1989b70b", DES.EncMode.OFB),
+    ("Привет, World! 🥶 Привет, World! Привет, World!", "4f1fbcd2a58a35", "ee9cf2f264955156", DES.EncMode.CTR)
 ])
 class TestDES:
 
@@ -59,8 +61,82 @@ def test_empty_iv():
     with pytest.raises(TypeError):
         DES("8d380efc717bad", enc_mode=DES.EncMode.CFB)
 
+    with pytest.raises(TypeError):
+        DES("8d380efc717bad", enc_mode=DES.EncMode.CTR)
+
     try:
         DES("8d380efc717bad", enc_mode=DES.EncMode.ECB)
 
     except TypeError:
         assert False
+
+
+@pytest.mark.parametrize("enc_mode", list(DES.EncMode))
+@pytest.mark.parametrize("data", [
+    b"\x00",
+    bytes(range(256)),
+    "Привет, World! 🥶 Привет, World! Привет, World!".encode("utf-8")
+])
+def test_backends_compatibility(data, enc_mode):
+    key, iv = "8d380efc717b90", "f356687d1989b70b"
+    reference = DES(key, iv, enc_mode, backend=DES.Backend.REFERENCE)
+    table = DES(key, iv, enc_mode, backend=DES.Backend.TABLE)
+
+    encrypted_data = table.encrypt(data)
+
+    assert encrypted_data == reference.encrypt(data)
+    assert table.decrypt(encrypted_data) == reference.decrypt(encrypted_data)
+
+
+@pytest.mark.parametrize("enc_mode,enc_proc", [
+    (DES.EncMode.ECB, EncProc.ENCRYPT),
+    (DES.EncMode.CTR, EncProc.ENCRYPT),
+    (DES.EncMode.CBC, EncProc.DECRYPT),
+    (DES.EncMode.CFB, EncProc.DECRYPT)
+])
+def test_parallel(enc_mode, enc_proc, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1024)
+    key, iv = "8d380efc717b90", "f356687d1989b70b"
+    data = bytes(i * 7 % 256 for i in range(10_000))
+
+    serial = DES(key, iv, enc_mode, reset_iv=False)
+    multiprocess = DES(key, iv, enc_mode, reset_iv=False, workers=2)
+
+    for chunk in (data, data[:1001]):
+        assert multiprocess.make(chunk, enc_proc) == serial.make(chunk, enc_proc)
+        assert multiprocess.vector == serial.vector
+
+
+def _process_stream(context, data: bytes, chunk_size: int) -> bytes:
+    processed_data = b"".join(context.update(data[pos:pos + chunk_size]) for pos in range(0, len(data), chunk_size))
+    return processed_data + context.finalize()
+
+
+@pytest.mark.parametrize("enc_mode", list(DES.EncMode))
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\x00" * 16,
+    bytes(range(256)) + b"\x00\x00\x00"
+])
+def test_stream(data, enc_mode):
+    key, iv = "8d380efc717b90", "f356687d1989b70b"
+    cipher = DES(key, iv, enc_mode)
+
+    encrypted_data = _process_stream(cipher.encryptor(), data, 5)
+
+    assert encrypted_data == _process_stream(cipher.encryptor(), data, 64)
+    assert _process_stream(cipher.decryptor(), encrypted_data, 3) == data
+
+    if enc_mode in (DES.EncMode.ECB, DES.EncMode.CBC):
+        assert len(encrypted_data) == (len(data) // 8 + 1) * 8
+    else:
+        assert len(encrypted_data) == len(data)
+
+
+def test_stream_error_length():
+    key, iv = "8d380efc717b90", "f356687d1989b70b"
+    context = DES(key, iv, DES.EncMode.CBC).decryptor()
+    context.update(b"\x00" * 12)
+
+    with pytest.raises(ValueError):
+        context.finalize()
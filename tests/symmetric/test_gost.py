@@ -2,6 +2,7 @@ import pytest
 
 from app.crypto.symmetric import GOST
 from app.crypto.common import EncProc
+from app.crypto import parallel
 
 
 @pytest.mark.parametrize("data,key,iv,enc_mode", [
@@ -16,7 +17,10 @@ from app.crypto.common import EncProc
      "ee9cf2f264955156", GOST.EncMode.CBC),
     ("Hello, World! Hello,😱 World! Hello, World!",
      "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29",
-     "f356687d1989b70b", GOST.EncMode.OFB)
+     "f356687d1989b70b", GOST.EncMode.OFB),
+    ("Привет, World! 🥶 Привет, World! Привет, World!",
+     "62e0dcea9a0af290f17a2596bef4bd32244a23059fe77d481cc35063f6c62598",
+     "ee9cf2f264955156", GOST.EncMode.CTR)
 ])
 class TestGOST:
 
@@ -74,9 +78,85 @@ def test_empty_iv():
         GOST("027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29",
              enc_mode=GOST.EncMode.CFB)
 
+    with pytest.raises(TypeError):
+        GOST("027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29",
+             enc_mode=GOST.EncMode.CTR)
+
     try:
         GOST("027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29",
              enc_mode=GOST.EncMode.ECB)
 
     except TypeError:
         assert False
+
+
+@pytest.mark.parametrize("enc_mode", list(GOST.EncMode))
+@pytest.mark.parametrize("data", [
+    b"\x00",
+    bytes(range(256)),
+    "Привет, World! 🥶 Привет, World! Привет, World!".encode("utf-8")
+])
+def test_backends_compatibility(data, enc_mode):
+    key = "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29"
+    iv = "f356687d1989b70b"
+    reference = GOST(key, iv, enc_mode, backend=GOST.Backend.REFERENCE)
+    table = GOST(key, iv, enc_mode, backend=GOST.Backend.TABLE)
+
+    encrypted_data = table.encrypt(data)
+
+    assert encrypted_data == reference.encrypt(data)
+    assert table.decrypt(encrypted_data) == reference.decrypt(encrypted_data)
+
+
+@pytest.mark.parametrize("enc_mode,enc_proc", [
+    (GOST.EncMode.ECB, EncProc.ENCRYPT),
+    (GOST.EncMode.CTR, EncProc.ENCRYPT),
+    (GOST.EncMode.CBC, EncProc.DECRYPT),
+    (GOST.EncMode.CFB, EncProc.DECRYPT)
+])
+def test_parallel(enc_mode, enc_proc, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1024)
+    key, iv = "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29", "f356687d1989b70b"
+    data = bytes(i * 7 % 256 for i in range(10_000))
+
+    serial = GOST(key, iv, enc_mode, reset_iv=False)
+    multiprocess = GOST(key, iv, enc_mode, reset_iv=False, workers=2)
+
+    for chunk in (data, data[:1001]):
+        assert multiprocess.make(chunk, enc_proc) == serial.make(chunk, enc_proc)
+        assert multiprocess.vector == serial.vector
+
+
+def _process_stream(context, data: bytes, chunk_size: int) -> bytes:
+    processed_data = b"".join(context.update(data[pos:pos + chunk_size]) for pos in range(0, len(data), chunk_size))
+    return processed_data + context.finalize()
+
+
+@pytest.mark.parametrize("enc_mode", list(GOST.EncMode))
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\x00" * 16,
+    bytes(range(256)) + b"\x00\x00\x00"
+])
+def test_stream(data, enc_mode):
+    key, iv = "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29", "f356687d1989b70b"
+    cipher = GOST(key, iv, enc_mode)
+
+    encrypted_data = _process_stream(cipher.encryptor(), data, 5)
+
+    assert encrypted_data == _process_stream(cipher.encryptor(), data, 64)
+    assert _process_stream(cipher.decryptor(), encrypted_data, 3) == data
+
+    if enc_mode in (GOST.EncMode.ECB, GOST.EncMode.CBC):
+        assert len(encrypted_data) == (len(data) // 8 + 1) * 8
+    else:
+        assert len(encrypted_data) == len(data)
+
+
+def test_stream_error_length():
+    key, iv = "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29", "f356687d1989b70b"
+    context = GOST(key, iv, GOST.EncMode.CBC).decryptor()
+    context.update(b"\x00" * 12)
+
+    with pytest.raises(ValueError):
+        context.finalize()
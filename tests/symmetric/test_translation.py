@@ -0,0 +1,54 @@
+import pytest
+
+from app.crypto.const import ALPHABET_TABLE
+from app.crypto.symmetric.translation import (
+    IDENTITY_TABLE,
+    reverse_table,
+    shift_table,
+    translate,
+    translate_periodic
+)
+
+
+def _reference(letter: str, transform) -> str:
+    for alphabet in ALPHABET_TABLE.values():
+        if letter.lower() in alphabet:
+            new_letter = alphabet[transform(alphabet.index(letter.lower()), len(alphabet))]
+            return new_letter.upper() if letter.isupper() else new_letter
+
+    return letter
+
+
+def _shift_reference(letter: str, shift: int) -> str:
+    return _reference(letter, lambda index, size: (index + shift) % size)
+
+
+# The texts are translated as bytes in cp1251, except the last one with characters outside it
+# (the Kelvin sign is replaced as the letter K).
+TEXTS = [
+    "Hello, World! Ёжик в тумане, ёлка. 123",
+    "Zz Яя Ёё",
+    "Шифр K 😀 xyz"
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("shift", [0, 1, -1, 26, 33, -100])
+def test_shift_table(text, shift):
+    assert translate(text, shift_table(shift)) == "".join(_shift_reference(letter, shift) for letter in text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_reverse_table(text):
+    assert translate(text, reverse_table()) == "".join(_reference(letter, lambda index, size: size - index - 1)
+                                                       for letter in text)
+    assert translate("abz ABZ абя АБЯ", reverse_table()) == "zya ZYA яюа ЯЮА"
+
+
+@pytest.mark.parametrize("text", TEXTS + ["ab"])
+@pytest.mark.parametrize("shifts", [[3], [1, 2], [5, 0, -7, 40]])
+def test_translate_periodic(text, shifts):
+    expected = "".join(_shift_reference(letter, shifts[i % len(shifts)]) for i, letter in enumerate(text))
+    assert translate_periodic(text, [shift_table(shift) for shift in shifts]) == expected
+
+    assert translate_periodic(text, [IDENTITY_TABLE] * len(shifts)) == text
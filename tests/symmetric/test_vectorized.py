@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from app.crypto.symmetric import vectorized, block_modes, DES, GOST
+from app.crypto.common import EncProc
+
+
+CIPHERS = [
+    DES("8d380efc717b90"),
+    GOST("027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29")
+]
+
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+@pytest.mark.parametrize("enc_proc", [EncProc.ENCRYPT, EncProc.DECRYPT])
+@pytest.mark.parametrize("size", [8, 1000, 4096])
+def test_ecb(cipher, enc_proc, size, monkeypatch):
+    monkeypatch.setattr(vectorized, "CHUNK_BLOCKS", 100)
+    data = bytes(i * 7 % 256 for i in range(size))
+
+    assert vectorized.ecb(cipher._transform_blocks, data, enc_proc) == \
+        block_modes.ecb(cipher._transform, data, enc_proc)
+
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+@pytest.mark.parametrize("size", [1, 8, 1001])
+def test_ctr(cipher, size, monkeypatch):
+    monkeypatch.setattr(vectorized, "CHUNK_BLOCKS", 100)
+    data = bytes(i * 7 % 256 for i in range(size))
+    start = 0xFFFF_FFFF_FFFF_FFF0
+
+    def counter_blocks(pos, count):
+        return np.arange(pos, pos + count, dtype=np.uint64) + np.uint64(start)
+
+    expected = b"".join(
+        cipher._transform((start + i) % 2 ** 64, EncProc.ENCRYPT).to_bytes(8, "little")
+        for i in range(-(-size // 8))
+    )
+    expected = bytes(a ^ b for a, b in zip(data, expected))
+
+    assert vectorized.ctr(cipher._transform_blocks, data, counter_blocks) == expected
+
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+@pytest.mark.parametrize("decrypt_fn,mode_fn", [
+    (vectorized.cbc_decrypt, block_modes.cbc),
+    (vectorized.cfb_decrypt, block_modes.cfb)
+])
+def test_chained_decrypt(cipher, decrypt_fn, mode_fn, monkeypatch):
+    monkeypatch.setattr(vectorized, "CHUNK_BLOCKS", 100)
+    data = bytes(i * 7 % 256 for i in range(4096))
+    vector = 0x0123_4567_89AB_CDEF
+
+    assert decrypt_fn(cipher._transform_blocks, data, vector) == \
+        mode_fn(cipher._transform, data, EncProc.DECRYPT, vector)[0]
+
+
+@pytest.mark.parametrize("vector", [0, 0xFFFF_FFFF_FFFF_FFFF, 0xFEFE_FEFB_FEFE_FEFF, 0x0123_4567_89AB_CDEF])
+def test_gost_counter_blocks(vector):
+    counters = vectorized.gost_counter_blocks(vector, 3, 300)
+
+    assert [int(counter) for counter in counters] == [GOST._counter_block(vector, i) for i in range(3, 303)]
+
+
+def test_gost_counter_block_steps():
+    vector = 0xFEFE_FEFB_FEFE_FEFF
+    n3, n4 = vector & 0xFFFFFFFF, vector >> 32
+
+    for i in range(3):
+        n3 = (n3 + 0x01010101) % 2 ** 32
+        # Addition modulo 2^32 - 1 (with end-around carry)
+        n4 = n4 + 0x01010104
+        if n4 >= 2 ** 32:
+            n4 -= 2 ** 32 - 1
+
+        assert GOST._counter_block(vector, i) == (n4 << 32) | n3
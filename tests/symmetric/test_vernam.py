@@ -38,3 +38,86 @@ def test_error_key():
 def test_not_key():
     with pytest.raises(ValueError):
         Vernam("")
+
+
+def test_stream():
+    data = bytes(range(256)) * 3
+    cipher = Vernam(Vernam.gen_key(len(data)))
+
+    encryptor = cipher.encryptor()
+    encrypted_data = b"".join(encryptor.update(data[pos:pos + 100])
+                              for pos in range(0, len(data), 100)) + encryptor.finalize()
+
+    assert encrypted_data == cipher.encrypt(data)
+
+    decryptor = cipher.decryptor()
+    assert decryptor.update(encrypted_data) + decryptor.finalize() == data
+
+
+def test_stream_error_size():
+    cipher = Vernam(Vernam.gen_key(16))
+
+    with pytest.raises(ValueError):
+        cipher.encryptor().update(b"\00" * 17)
+
+    encryptor = cipher.encryptor()
+    encryptor.update(b"\00" * 15)
+
+    with pytest.raises(ValueError):
+        encryptor.finalize()
+
+
+@pytest.mark.parametrize("sizes", [[0], [1000], [300, 0, 4097]])
+def test_pad_file(tmp_path, sizes):
+    pad_path = tmp_path / "pad.bin"
+    Vernam.gen_pad_file(pad_path, sum(sizes) + 10, chunk_size=1000)
+    assert pad_path.stat().st_size == sum(sizes) + 10
+
+    pad_offset = 0
+    for k, size in enumerate(sizes):
+        data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+        (tmp_path / f"{k}.bin").write_bytes(data)
+
+        offset = Vernam.process_file(tmp_path / f"{k}.bin", tmp_path / f"{k}.enc", pad_path, pad_offset, 1024)
+        assert offset == pad_offset + size
+
+        key = pad_path.read_bytes()[pad_offset:offset].hex()
+        encrypted_data = (tmp_path / f"{k}.enc").read_bytes()
+        assert not size or encrypted_data == Vernam(key).encrypt(data)
+
+        Vernam.process_file(tmp_path / f"{k}.enc", tmp_path / f"{k}.dec", pad_path, pad_offset)
+        assert (tmp_path / f"{k}.dec").read_bytes() == data
+
+        pad_offset = offset
+
+
+def test_pad_file_error_size(tmp_path):
+    pad_path = tmp_path / "pad.bin"
+    Vernam.gen_pad_file(pad_path, 100)
+    (tmp_path / "data.bin").write_bytes(b"\00" * 60)
+
+    Vernam.process_file(tmp_path / "data.bin", tmp_path / "data.enc", pad_path, 40)
+
+    with pytest.raises(ValueError):
+        Vernam.process_file(tmp_path / "data.bin", tmp_path / "data.enc", pad_path, 41)
+
+    with pytest.raises(ValueError):
+        Vernam.process_file(tmp_path / "data.bin", tmp_path / "data.enc", pad_path, -1)
+
+
+def test_pad_file_error_same_file(tmp_path):
+    pad_path = tmp_path / "pad.bin"
+    Vernam.gen_pad_file(pad_path, 100)
+    pad = pad_path.read_bytes()
+    data_path = tmp_path / "data.bin"
+    data_path.write_bytes(b"data")
+
+    with pytest.raises(ValueError):
+        Vernam.process_file(data_path, data_path, pad_path)
+
+    with pytest.raises(ValueError):
+        Vernam.process_file(data_path, tmp_path / "." / "pad.bin", pad_path)
+
+    # Neither the data nor the pad is destroyed.
+    assert data_path.read_bytes() == b"data"
+    assert pad_path.read_bytes() == pad
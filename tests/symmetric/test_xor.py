@@ -1,6 +1,6 @@
 import pytest
 
-from app.crypto.symmetric import XOR
+from app.crypto.symmetric import XOR, xor
 from app.crypto.prngs import RC4
 from app.crypto.common import EncProc
 
@@ -46,3 +46,62 @@ def test_error_key():
 def test_not_key():
     with pytest.raises(ValueError):
         XOR("")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_stream(chunk_size):
+    cipher = XOR("8d380efc717b90")
+    data = bytes(range(256)) * 3
+
+    encryptor = cipher.encryptor()
+    encrypted_data = b"".join(encryptor.update(data[pos:pos + chunk_size])
+                              for pos in range(0, len(data), chunk_size)) + encryptor.finalize()
+
+    assert encrypted_data == cipher.encrypt(data)
+
+    decryptor = cipher.decryptor()
+    assert decryptor.update(encrypted_data) + decryptor.finalize() == data
+
+
+def _xor_reference(data: bytes, key: bytes, phase: int = 0) -> bytes:
+    return bytes(byte ^ key[(phase + i) % len(key)] for i, byte in enumerate(data))
+
+
+@pytest.mark.parametrize("size", [1, 13, 1000, 70_000])
+@pytest.mark.parametrize("numpy_min_size", [0, 1 << 16])
+def test_xor_with_key(monkeypatch, size, numpy_min_size):
+    # Small pieces, so the data is XORed by several pieces.
+    monkeypatch.setattr(xor, "BULK_CHUNK_SIZE", 4096)
+    monkeypatch.setattr(xor, "NUMPY_MIN_SIZE", numpy_min_size)
+
+    data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+    key = bytes.fromhex("8d380efc717b90")
+
+    for phase in (0, 3, 13):
+        assert xor.xor_with_key(data, key, phase) == _xor_reference(data, key, phase)
+
+
+def test_keep_state():
+    key = "8d380efc717b90"
+    data = bytes(range(256)) * 300
+
+    cipher = XOR(key, reset_state=False)
+    encrypted_data = b"".join(cipher.encrypt(data[pos:pos + size])
+                              for pos, size in ((0, 5), (5, 70_000), (70_005, 1), (70_006, len(data))))
+
+    assert encrypted_data == _xor_reference(data, bytes.fromhex(key))
+    assert cipher.index_key == len(data) % 7
+
+
+def test_seek():
+    key = "8d380efc717b90"
+    data = bytes(range(256)) * 10
+    encrypted_data = XOR(key).encrypt(data)
+
+    cipher = XOR(key, reset_state=False)
+    for offset in (0, 6, 7, 1000, 2559):
+        cipher.seek(offset)
+        assert cipher.decrypt(encrypted_data[offset:offset + 100]) == data[offset:offset + 100]
+
+    with pytest.raises(ValueError):
+        cipher.seek(-1)
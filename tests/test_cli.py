@@ -0,0 +1,107 @@
+import subprocess
+import sys
+
+import pytest
+
+from app import cli
+from app.crypto.common import EncProc
+
+
+@pytest.mark.parametrize("cipher,key,iv,mode", [
+    ("des", "8d380efc717b90", "f356687d1989b70b", "CBC"),
+    ("gost", "027c9c9f8f44aaa186da7619ff012efd54401f2de3e4c4f930f4216f192d5f29", "f356687d1989b70b", "CTR"),
+    ("xor", "8d380efc717b90", None, "ECB"),
+    ("rc4", "8d380efc717b90", None, "ECB")
+])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_files(tmp_path, cipher, key, iv, mode, jobs):
+    files = {tmp_path / f"file_{i}.bin": bytes(range(i * 50 % 256)) * (i + 1) for i in range(4)}
+    for path, data in files.items():
+        path.write_bytes(data)
+
+    args = ["-c", cipher, "-k", key, "-m", mode, "-j", str(jobs), "--chunk-size", "100", "-q"]
+    if iv:
+        args += ["-i", iv]
+
+    assert cli.main(["encrypt", str(tmp_path / "*.bin"), "-o", str(tmp_path / "enc")] + args) == 0
+    assert cli.main(["decrypt", str(tmp_path / "enc" / "*.enc"), "-o", str(tmp_path / "dec")] + args) == 0
+
+    for path, data in files.items():
+        assert (tmp_path / "dec" / path.name).read_bytes() == data
+
+
+@pytest.mark.parametrize("path,enc_proc,output_dir,result", [
+    ("a/file.txt", EncProc.ENCRYPT, None, "a/file.txt.enc"),
+    ("a/file.txt.enc", EncProc.DECRYPT, None, "a/file.txt"),
+    ("a/file.txt", EncProc.DECRYPT, None, "a/file.txt.dec"),
+    ("a/file.txt", EncProc.ENCRYPT, "b", "b/file.txt.enc")
+])
+def test_output_path(path, enc_proc, output_dir, result):
+    assert cli.output_path(path, enc_proc, output_dir) == result
+
+
+@pytest.mark.parametrize("command,names", [
+    ("encrypt", ["x", "x.enc"]),
+    ("decrypt", ["x", "x.enc"]),
+    ("decrypt", ["x.dec.enc", "x.dec"])
+])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_output_is_input(tmp_path, command, names, jobs):
+    for name in names:
+        (tmp_path / name).write_bytes(name.encode())
+
+    args = ["-k", "8d380efc717b90", "-c", "xor", "-q", "-j", str(jobs)]
+    assert cli.main([command, str(tmp_path / "x*")] + args) == 1
+
+    # The input files are not overwritten.
+    for name in names:
+        assert (tmp_path / name).read_bytes() == name.encode()
+
+
+def test_files_after_options(tmp_path):
+    (tmp_path / "a.bin").write_bytes(b"data a")
+    (tmp_path / "b.bin").write_bytes(b"data b")
+
+    args = ["-c", "des", "-k", "8d380efc717b90", "-i", "f356687d1989b70b", "-m", "CBC", "-q"]
+    assert cli.main(["encrypt"] + args + [str(tmp_path / "a.bin"), "-j", "1", str(tmp_path / "b.bin")]) == 0
+    assert cli.main(["decrypt"] + args + ["-o", str(tmp_path / "dec"), str(tmp_path / "*.enc")]) == 0
+
+    assert (tmp_path / "dec" / "a.bin").read_bytes() == b"data a"
+    assert (tmp_path / "dec" / "b.bin").read_bytes() == b"data b"
+
+
+def test_no_files(tmp_path):
+    assert cli.main(["encrypt", str(tmp_path / "*.bin"), "-k", "8d380efc717b90"]) == 1
+
+
+def test_output_conflict(tmp_path):
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "file.bin").write_bytes(directory.encode())
+
+    args = ["-k", "8d380efc717b90", "-c", "xor", "-q", "-o", str(tmp_path / "enc")]
+    assert cli.main(["encrypt", str(tmp_path / "**" / "*.bin")] + args) == 1
+    assert not (tmp_path / "enc").exists()
+
+    # A file matched by several patterns is processed once.
+    pattern = str(tmp_path / "a" / "*.bin")
+    assert cli.main(["encrypt", pattern, pattern] + args) == 0
+    assert (tmp_path / "enc" / "file.bin.enc").exists()
+
+
+def test_stdin_stdout():
+    data = bytes(range(256)) * 10
+    command = [sys.executable, "-m", "app.cli"]
+    args = ["-c", "des", "-k", "8d380efc717b90", "-i", "f356687d1989b70b", "-m", "CFB", "-q"]
+
+    encrypted_data = subprocess.run(command + ["encrypt"] + args, input=data, capture_output=True, check=True).stdout
+    decrypted_data = subprocess.run(command + ["decrypt"] + args, input=encrypted_data,
+                                    capture_output=True, check=True).stdout
+
+    assert len(encrypted_data) == len(data)
+    assert decrypted_data == data
+
+
+def test_without_gui():
+    code = "import sys, app.cli; assert not any(name.startswith('PyQt6') for name in sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,52 @@
+from random import Random
+
+import pytest
+
+from app.crypto.fixed_base import (
+    FixedBase,
+    fixed_base,
+    table_size
+)
+
+
+@pytest.mark.parametrize("bits,max_table_size", [
+    (64, 1 << 20),
+    (512, 1 << 20),
+    (1024, 1 << 18),
+    (2048, 4 << 20)
+])
+def test_pow(bits, max_table_size):
+    rand = Random(bits)
+    m = rand.getrandbits(bits) | 1 | (1 << (bits - 1))
+    g = rand.getrandbits(bits)
+    fb = FixedBase(g, m, max_table_size=max_table_size, precompute_after=2)
+
+    assert fb.window > 0
+    assert table_size(bits, bits, fb.window) <= max_table_size
+
+    for exp in [0, 1, 2, m - 1, m, (1 << bits) - 1] + [rand.getrandbits(bits) for _ in range(10)]:
+        assert fb.pow(exp) == pow(g, exp, m)
+
+
+def test_large_exponent():
+    fb = FixedBase(3, 1_000_003, exp_bits=16, precompute_after=0)
+
+    for exp in (5, 1 << 16, 1 << 100, 12_345_678_901):
+        assert fb.pow(exp) == pow(3, exp, 1_000_003)
+
+
+def test_table_limit():
+    # Even the table with one-bit windows does not fit: the table is not used.
+    fb = FixedBase(5, (1 << 2048) - 1, max_table_size=1024, precompute_after=0)
+    assert fb.window == 0
+    assert fb.pow(1 << 2000) == pow(5, 1 << 2000, (1 << 2048) - 1)
+
+
+def test_fixed_base_cache():
+    assert fixed_base(2, 1_000_003) is fixed_base(2, 1_000_003)
+    assert fixed_base(2, 1_000_003) is not fixed_base(3, 1_000_003)
+
+
+def test_error_value():
+    with pytest.raises(ValueError):
+        FixedBase(2, 1)
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from app.crypto.group_pool import (
+    Group,
+    GroupPool
+)
+from app.crypto.primes import is_safe_prime
+
+
+def _is_primitive_root(g: int, p: int) -> bool:
+    q = (p - 1) >> 1
+    return pow(g, 2, p) != 1 and pow(g, q, p) != 1
+
+
+def test_fill_and_get(tmp_path):
+    cache_path = tmp_path / "groups.json"
+    pool = GroupPool(size=2, cache_path=cache_path)
+
+    try:
+        pool.fill(64)
+        pool.wait()
+        assert pool.available(64) == 2
+
+        group = pool.get(64)
+        assert group.p.bit_length() == 64
+        assert _is_primitive_root(group.g, group.p)
+        # The group is given out only once.
+        assert group not in GroupPool(size=0, cache_path=cache_path)._groups.get(64, [])
+
+    finally:
+        pool.close()
+
+
+def test_cache_persistence(tmp_path):
+    cache_path = tmp_path / "groups.json"
+    pool = GroupPool(size=3, cache_path=cache_path)
+    pool.fill(48)
+    pool.wait()
+
+    groups = [GroupPool(size=0, cache_path=cache_path).get(48) for _ in range(3)]
+    assert len(set(groups)) == 3
+    assert GroupPool(size=0, cache_path=cache_path).available(48) == 0
+
+
+def test_empty_pool_generates_on_demand(tmp_path):
+    pool = GroupPool(size=0, cache_path=tmp_path / "groups.json")
+    group = pool.get(32)
+    assert isinstance(group, Group)
+    assert is_safe_prime(group.p)
+
+
+def test_damaged_cache(tmp_path):
+    cache_path = tmp_path / "groups.json"
+    cache_path.write_text("{not json")
+    assert GroupPool(size=0, cache_path=cache_path).available(64) == 0
+
+    cache_path.write_text(json.dumps({"version": 1, "groups": {"64": [{"p": "zz"}]}}))
+    assert GroupPool(size=0, cache_path=cache_path).available(64) == 0
+
+
+def test_without_cache():
+    pool = GroupPool(size=1, cache_path=False)
+    pool.fill(32)
+    pool.wait()
+    assert pool.available(32) == 1
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        GroupPool(size=-1, cache_path=False)
+
+    with pytest.raises(ValueError):
+        GroupPool(workers=0, cache_path=False)
+
+
+def test_pool_in_key_generation(tmp_path):
+    from app.crypto.asymmetric import Elgamal
+    from app.crypto.protocols import DiffieHellman
+
+    cache_path = tmp_path / "groups.json"
+    pool = GroupPool(size=2, cache_path=cache_path)
+    pool.fill(64)
+    pool.wait()
+    groups = set(GroupPool(size=0, cache_path=cache_path)._groups[64])
+
+    shared_keys = DiffieHellman.gen_shared_keys(64, pool=GroupPool(size=0, cache_path=cache_path))
+    _, public_key = Elgamal.gen_keys(64, pool=GroupPool(size=0, cache_path=cache_path))
+
+    assert {Group(shared_keys.p, shared_keys.g), Group(public_key.p, public_key.g)} == groups
+    assert GroupPool(size=0, cache_path=cache_path).available(64) == 0
+
+
+def test_tampered_cache(tmp_path):
+    cache_path = tmp_path / "groups.json"
+    pool = GroupPool(size=2, cache_path=cache_path)
+    pool.fill(64)
+    pool.wait()
+
+    cache = json.loads(cache_path.read_text())
+    valid, other = cache["groups"]["64"]
+    p, g = int(other["p"], 16), int(other["g"], 16)
+    composite = p + 2 if not is_safe_prime(p + 2) else p + 4
+    cache["groups"]["64"] = [
+        valid,
+        {"p": hex(composite), "g": other["g"]},
+        {"p": other["p"], "g": hex(pow(g, 2, p))},
+        {"p": other["p"], "g": hex(p - 1)},
+        {"p": other["p"], "g": other["g"]}
+    ]
+    cache["groups"]["128"] = [valid]
+    cache_path.write_text(json.dumps(cache))
+
+    pool = GroupPool(size=0, cache_path=cache_path)
+    assert pool.available(64) == 2
+    assert pool.available(128) == 0
+    assert [pool.get(64) for _ in range(2)] == [Group(int(valid["p"], 16), int(valid["g"], 16)), Group(p, g)]
@@ -0,0 +1,111 @@
+import pytest
+
+from app.crypto.groups import (
+    find_generator,
+    find_subgroup_generator,
+    factor_group_order,
+    gen_group,
+    is_generator,
+    jacobi
+)
+from app.crypto.primes import (
+    SMALL_PRIMES,
+    is_safe_prime
+)
+
+
+def _order(g: int, p: int) -> int:
+    x, order = g, 1
+    while x != 1:
+        x = x * g % p
+        order += 1
+
+    return order
+
+
+@pytest.mark.parametrize("n", [3, 5, 15, 21, 97, 561])
+def test_jacobi(n):
+    from sympy import jacobi_symbol
+
+    for a in range(-5, 2 * n):
+        assert jacobi(a, n) == jacobi_symbol(a, n)
+
+
+@pytest.mark.parametrize("n", [0, -3, 8])
+def test_jacobi_error_value(n):
+    with pytest.raises(ValueError):
+        jacobi(2, n)
+
+
+@pytest.mark.parametrize("p,g", [(7, 3), (23, 5), (47, 5), (59, 2), (83, 2), (107, 2), (13, 2), (41, 6), (97, 5)])
+def test_find_generator(p, g):
+    assert find_generator(p) == g
+    assert _order(g, p) == p - 1
+
+
+def test_find_generator_all_small_primes():
+    for p in SMALL_PRIMES[2:200]:
+        g = find_generator(p)
+        assert _order(g, p) == p - 1
+        assert all(_order(h, p) != p - 1 for h in range(2, g))
+
+
+def test_find_generator_with_factors():
+    # p - 1 = 2^3 * 3 * q, where q is a 128-bit prime: trial division finds the factorization.
+    q = 2 ** 127 - 1
+    p = next(24 * k * q + 1 for k in range(1, 1000) if pow(3, 24 * k * q, 24 * k * q + 1) == 1)
+    factors = factor_group_order(p)
+    assert q in factors
+
+    g = find_generator(p)
+    assert g == find_generator(p, factors)
+    assert is_generator(g, p, factors)
+
+
+@pytest.mark.parametrize("p,factors", [
+    (97, (2, 3, 5)),
+    (97, (2,)),
+    (97, (2, 4, 3)),
+    (91, (2, 3, 5))
+])
+def test_find_generator_error_factors(p, factors):
+    with pytest.raises(ValueError):
+        find_generator(p, factors)
+
+
+def test_find_generator_error_factorization():
+    # p - 1 has two large prime factors.
+    q1, q2 = 2 ** 61 - 1, 2 ** 89 - 1
+    p = next(2 * k * q1 * q2 + 1 for k in range(1, 10_000) if pow(3, 2 * k * q1 * q2, 2 * k * q1 * q2 + 1) == 1)
+
+    with pytest.raises(ValueError):
+        find_generator(p)
+
+    factors = set(factor for factor in SMALL_PRIMES if (p - 1) % factor == 0) | {q1, q2}
+    assert is_generator(find_generator(p, factors), p, factors)
+
+
+@pytest.mark.parametrize("p", [1, 4, 15, 2041])
+def test_find_generator_error_value(p):
+    with pytest.raises(ValueError):
+        find_generator(p)
+
+
+@pytest.mark.parametrize("p,q", [(23, None), (2879, None), (97, 3), (97, 2)])
+def test_find_subgroup_generator(p, q):
+    g = find_subgroup_generator(p, q)
+    assert _order(g, p) == (q or (p - 1) >> 1)
+
+
+@pytest.mark.parametrize("p,q", [(97, None), (97, 5), (97, 4)])
+def test_find_subgroup_generator_error_value(p, q):
+    with pytest.raises(ValueError):
+        find_subgroup_generator(p, q)
+
+
+@pytest.mark.parametrize("bits", [16, 64, 256])
+def test_gen_group(bits):
+    group = gen_group(bits)
+    assert group.p.bit_length() == bits
+    assert is_safe_prime(group.p)
+    assert pow(group.g, 2, group.p) != 1 and pow(group.g, group.p >> 1, group.p) != 1
@@ -0,0 +1,79 @@
+import pytest
+
+from app.crypto.asymmetric import RSA, Elgamal
+from app.crypto.common import EncProc
+from app.crypto.hybrid import Hybrid
+
+
+@pytest.fixture(scope="module", params=["rsa", "elgamal"])
+def cipher(request):
+    match request.param:
+        case "rsa":
+            return RSA(*RSA.gen_keys(256))
+
+        case "elgamal":
+            return Elgamal(*Elgamal.gen_keys(512))
+
+
+@pytest.mark.parametrize("sym_cipher", [Hybrid.SymCipher.DES, Hybrid.SymCipher.GOST])
+@pytest.mark.parametrize("data", [b"", b"a", bytes(range(256)) * 33])
+def test_encrypt_decrypt(cipher, sym_cipher, data):
+    hybrid = Hybrid(cipher, sym_cipher)
+
+    envelope = hybrid.make(data, EncProc.ENCRYPT)
+    assert hybrid.make(envelope, EncProc.DECRYPT) == data
+
+    # The ciphertext is longer than the plaintext only by the header.
+    assert len(envelope) - len(data) == len(hybrid.encrypt(b""))
+    # A new session key is used for each encryption.
+    assert hybrid.encrypt(data) != envelope
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 4096])
+def test_stream(cipher, chunk_size):
+    data = bytes(range(256)) * 20
+    hybrid = Hybrid(cipher)
+
+    encryptor = hybrid.encryptor()
+    envelope = b"".join(encryptor.update(data[pos:pos + chunk_size])
+                        for pos in range(0, len(data), chunk_size)) + encryptor.finalize()
+
+    decryptor = hybrid.decryptor()
+    decrypted_data = b"".join(decryptor.update(envelope[pos:pos + chunk_size])
+                              for pos in range(0, len(envelope), chunk_size)) + decryptor.finalize()
+
+    assert decrypted_data == data
+
+    with pytest.raises(ValueError):
+        decryptor.update(b"")
+
+
+def test_sym_cipher_from_header(cipher):
+    envelope = Hybrid(cipher, Hybrid.SymCipher.DES).encrypt(b"data")
+    assert Hybrid(cipher, Hybrid.SymCipher.GOST).decrypt(envelope) == b"data"
+
+
+@pytest.mark.parametrize("envelope", [b"", b"CMHE", b"XXXX\x01\x02\x00\x00\x00\x00", b"CMHE\x01\x09\x00\x00\x00\x00"])
+def test_damaged_envelope(cipher, envelope):
+    with pytest.raises(ValueError):
+        Hybrid(cipher).decrypt(envelope)
+
+
+def test_wrapped_key_size_limit(cipher):
+    decryptor = Hybrid(cipher).decryptor()
+
+    # The length of the wrapped key is limited, so a damaged header is rejected
+    # without waiting for the rest of the data.
+    with pytest.raises(ValueError):
+        decryptor.update(b"CMHE\x01\x02\xff\xff\xff\xff" + bytes(100))
+
+
+def test_sym_cipher_from_str():
+    assert Hybrid.SymCipher.from_str("GOST") is Hybrid.SymCipher.GOST
+    assert Hybrid.SymCipher.from_str("des") is Hybrid.SymCipher.DES
+
+    with pytest.raises(NotImplementedError):
+        Hybrid.SymCipher.from_str("aes")
+
+    with pytest.raises(TypeError):
+        Hybrid(None, "gost")
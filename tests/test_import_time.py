@@ -0,0 +1,49 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Maximum time of "import app.crypto" in microseconds. The heavy dependencies
+# are loaded on first use, so the import itself must stay cheap.
+IMPORT_TIME_BUDGET = 150_000
+
+HEAVY_MODULES = ("numpy", "sympy", "scipy", "PyQt6")
+
+
+def _import_time(module: str) -> int:
+    """Function for getting the cumulative import time of a module in microseconds (-X importtime)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", result.stderr, re.M)
+    assert match is not None
+    return int(match.group(1))
+
+
+def test_import_time():
+    assert min(_import_time("app.crypto") for _ in range(3)) < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("statement", [
+    "import app.crypto",
+    "from app.crypto.symmetric import XOR, DES, GOST",
+    "from app.crypto.asymmetric import RSA",
+    "from app.crypto.prngs import RC4",
+    "import app.cli"
+])
+def test_no_heavy_imports(statement):
+    code = f"import sys; {statement}; print(' '.join(sorted(set(sys.modules) & set({HEAVY_MODULES!r}))))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes():
+    import app.crypto.symmetric as symmetric
+
+    assert "Hill" in dir(symmetric)
+    assert symmetric.XOR is __import__("app.crypto.symmetric.xor", fromlist=["XOR"]).XOR
+
+    with pytest.raises(AttributeError):
+        getattr(symmetric, "Unknown")
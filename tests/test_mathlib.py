@@ -1,7 +1,12 @@
+from math import gcd
+from random import Random
+
 import pytest
 
 from app.crypto.mathlib import (
-    fpow, ext_gcd, modinv
+    fpow, ext_gcd, modinv,
+    Backend, available_backends, get_backend, set_backend,
+    ModContext
 )
 
 
@@ -64,3 +69,113 @@ def test_modinv_error_value(a, m):
     with pytest.raises(ValueError):
         modinv(a, m)
 
+
+@pytest.fixture(params=available_backends(), ids=lambda backend: backend.name.lower())
+def backend(request):
+    previous = get_backend()
+    set_backend(request.param)
+    yield request.param
+    set_backend(previous)
+
+
+@pytest.mark.parametrize("bits", [512, 1024, 2048, 4096])
+def test_backends_agree(backend, bits):
+    rand = Random(bits)
+
+    for _ in range(3):
+        a = rand.getrandbits(bits)
+        n = rand.getrandbits(bits)
+        m = rand.getrandbits(bits) | 1 | (1 << (bits - 1))
+
+        assert fpow(a, n, m) == pow(a, n, m)
+
+        d, x, y = ext_gcd(a, m)
+        assert d == gcd(a, m)
+        assert a * x + m * y == d
+
+        if d == 1:
+            assert modinv(a, m) * a % m == 1
+
+
+@pytest.mark.parametrize("a,n,m,result", [
+    (2, 10, None, 1024),
+    (23, 11, None, 952_809_757_913_927),
+    (123, 0, None, 1),
+    (123, 0, 7, 1),
+    (5, 3, 1, 0)
+])
+def test_backends_fpow(backend, a, n, m, result):
+    assert fpow(a, n, m) == result
+
+
+@pytest.mark.parametrize("a,m,res", [
+    (23, 2356475682, 1639287431),
+    (4562323, 234234234234234234, 151806922968017875)
+])
+def test_backends_modinv(backend, a, m, res):
+    assert modinv(a, m) == res
+
+    with pytest.raises(ValueError):
+        modinv(a * 2, m * 2)
+
+
+def test_backend_from_str():
+    assert Backend.from_str("Builtin") is Backend.BUILTIN
+    assert Backend.from_str("reference") is Backend.REFERENCE
+    assert Backend.from_str("gmpy2") is Backend.GMPY2
+
+    with pytest.raises(NotImplementedError):
+        Backend.from_str("openssl")
+
+
+def test_set_backend_error_value():
+    with pytest.raises(TypeError):
+        set_backend("builtin")
+
+
+@pytest.mark.parametrize("bits", [64, 512, 2048])
+def test_mod_context(backend, bits):
+    rand = Random(bits)
+    m = rand.getrandbits(bits) | 1 | (1 << (bits - 1))
+    ctx = ModContext(m)
+
+    assert ctx.modulus == m
+    assert ctx.backend is backend
+
+    for _ in range(3):
+        a = rand.getrandbits(bits + 8)
+        b = rand.getrandbits(bits)
+        n = rand.getrandbits(bits)
+
+        assert ctx.reduce(a) == a % m
+        assert ctx.mul(a, -b) == a * -b % m
+        assert ctx.pow(a, n) == pow(a, n, m)
+        assert ctx.pow(a, 0) == 1
+
+        if gcd(a, m) == 1:
+            assert ctx.inv(a) == pow(a, -1, m)
+            assert ctx.pow(a, -n) == pow(a, -n, m)
+
+
+def test_mod_context_batch_inv(backend):
+    rand = Random(0)
+    m = (1 << 521) - 1
+    ctx = ModContext(m)
+
+    values = [rand.randrange(1, m) for _ in range(20)] + [m + 1, -3]
+    assert ctx.batch_inv(values) == [pow(a, -1, m) for a in values]
+    assert ctx.batch_inv([]) == []
+
+    # 2 * 3 has no inverse modulo 6, so neither does the product.
+    with pytest.raises(ValueError):
+        ModContext(2 * 3 * 7).batch_inv([5, 11, 3])
+
+
+@pytest.mark.parametrize("m,error", [
+    ("7", TypeError),
+    (1, ValueError),
+    (-7, ValueError)
+])
+def test_mod_context_error_value(m, error):
+    with pytest.raises(error):
+        ModContext(m)
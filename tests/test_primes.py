@@ -0,0 +1,99 @@
+import pytest
+
+from app.crypto import primes
+from app.crypto.primes import (
+    SMALL_PRIMES,
+    is_prime,
+    is_safe_prime,
+    gen_prime,
+    gen_primes,
+    gen_safe_prime
+)
+
+
+def test_small_primes():
+    assert SMALL_PRIMES[:10] == (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
+    assert all(is_prime(p) for p in SMALL_PRIMES[:1000])
+
+
+@pytest.mark.parametrize("n,result", [
+    (0, False),
+    (1, False),
+    (2, True),
+    (4, False),
+    (7919, True),
+    (65_537 * 65_539, False),
+    # Carmichael numbers
+    (561, False),
+    (3_825_123_056_546_413_051, False),
+    (2 ** 127 - 1, True),
+    (2 ** 521 - 1, True),
+    ((2 ** 127 - 1) * (2 ** 89 - 1), False)
+])
+def test_is_prime(n, result):
+    assert is_prime(n) == result
+
+
+def test_is_prime_error_value():
+    with pytest.raises(TypeError):
+        is_prime("17")
+
+
+@pytest.mark.parametrize("n,result", [
+    (5, True),
+    (7, True),
+    (13, False),
+    (2879, True),
+    (2 ** 127 - 1, False)
+])
+def test_is_safe_prime(n, result):
+    assert is_safe_prime(n) == result
+
+
+@pytest.mark.parametrize("bits", [2, 8, 16, 17, 64, 256, 512])
+def test_gen_prime(bits):
+    p = gen_prime(bits)
+
+    assert p.bit_length() == bits
+    assert is_prime(p)
+
+
+@pytest.mark.parametrize("bits", [3, 10, 16, 17, 64, 256])
+def test_gen_safe_prime(bits):
+    p = gen_safe_prime(bits)
+
+    assert p.bit_length() == bits
+    assert is_safe_prime(p)
+
+
+@pytest.mark.parametrize("fn,bits", [
+    (gen_prime, 1),
+    (gen_safe_prime, 2),
+    (gen_prime, "64")
+])
+def test_gen_error_value(fn, bits):
+    with pytest.raises((TypeError, ValueError)):
+        fn(bits)
+
+
+@pytest.mark.parametrize("bits,count,workers", [(64, 1, 1), (64, 3, 1), (128, 2, 2), (256, 3, 2)])
+def test_gen_primes(monkeypatch, bits, count, workers):
+    # The parallel search is checked on small primes.
+    monkeypatch.setattr(primes, "PARALLEL_MIN_BITS", 64)
+    result = gen_primes(bits, count, workers)
+
+    assert len(set(result)) == count
+    assert all(p.bit_length() == bits and is_prime(p) for p in result)
+
+
+@pytest.mark.parametrize("bits", [64, 256])
+def test_gen_prime_parallel(monkeypatch, bits):
+    monkeypatch.setattr(primes, "PARALLEL_MIN_BITS", 64)
+
+    p = gen_prime(bits, workers=2)
+    assert p.bit_length() == bits
+    assert is_prime(p)
+
+    p = gen_safe_prime(bits, workers=2)
+    assert p.bit_length() == bits
+    assert is_safe_prime(p)
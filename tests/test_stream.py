@@ -0,0 +1,64 @@
+import pytest
+
+from app.crypto.stream import (
+    pad, unpad,
+    StreamContext
+)
+
+
+@pytest.mark.parametrize("data,block_size,result", [
+    (b"", 8, b"\x80" + b"\00" * 7),
+    (b"\00\00\00", 4, b"\00\00\00\x80"),
+    (b"12345678", 8, b"12345678\x80" + b"\00" * 7),
+    (b"123", 1, b"123\x80")
+])
+def test_pad_unpad(data, block_size, result):
+    assert pad(data, block_size) == result
+    assert unpad(result) == data
+
+
+def test_unpad_error():
+    with pytest.raises(ValueError):
+        unpad(b"1234\00\00\00\00")
+
+
+@pytest.mark.parametrize("chunk_sizes", [
+    (1, 2, 3, 4, 5, 6, 7),
+    (8, 8, 8, 4),
+    (28,),
+    (0, 13, 0, 15),
+    (16, 16)
+])
+@pytest.mark.parametrize("hold_last", [False, True])
+def test_context_buffering(chunk_sizes, hold_last):
+    data = bytes(range(sum(chunk_sizes)))
+    calls = []
+
+    def process(chunk: bytes) -> bytes:
+        calls.append(len(chunk))
+        return chunk
+
+    context = StreamContext(process, lambda rest: b"|" + rest, 8, hold_last)
+
+    output, pos = b"", 0
+    for size in chunk_sizes:
+        output += context.update(data[pos:pos + size])
+        pos += size
+
+    output += context.finalize()
+
+    rest = len(data) % 8 or (8 if hold_last else 0)
+
+    assert all(size % 8 == 0 for size in calls)
+    assert output == data[:len(data) - rest] + b"|" + data[len(data) - rest:]
+
+
+def test_context_finalized():
+    context = StreamContext(bytes)
+    context.finalize()
+
+    with pytest.raises(ValueError):
+        context.update(b"123")
+
+    with pytest.raises(ValueError):
+        context.finalize()